@@ -0,0 +1,332 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from monde import CarteCubes
+from navigation import ChampDistance, PlanificateurAStar
+from robot_collector import RobotCollector
+
+
+def enchere(benefices: np.ndarray, prix: Optional[np.ndarray] = None, epsilon: float = 1e-3,
+            affectationInitiale: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Algorithme d'enchères (Bertsekas), version Jacobi vectorisée : à chaque tour, toutes les
+    lignes libres enchérissent en même temps, chaque colonne retient la meilleure offre.
+    benefices : matrice (n, m) avec n <= m, à maximiser.
+    prix : prix initiaux des colonnes (démarrage à chaud) ; affectationInitiale : colonne de chaque
+    ligne (-1 = libre), conservée si elle respecte l'epsilon-complémentarité.
+    Les colonnes libres sont ramenées au prix minimal avant l'enchère (cas n < m : une colonne
+    non affectée ne doit pas coûter plus qu'une colonne affectée).
+    Le résultat est à n * epsilon près de l'optimum. Retourne (colonne de chaque ligne, prix).
+    """
+    n, m = benefices.shape
+    if n > m:
+        raise ValueError("L'enchère nécessite au plus autant de lignes que de colonnes.")
+    prix = np.zeros(m) if prix is None else np.array(prix, dtype=float)
+    ligneColonne = np.full(n, -1)
+    colonneLigne = np.full(m, -1)
+    if n == 0:
+        return ligneColonne, prix
+    lignes = np.arange(n)
+
+    if affectationInitiale is not None:
+        valides = np.flatnonzero(affectationInitiale >= 0)
+        colonnes = affectationInitiale[valides]
+        plancher = prix.min()
+        while True:
+            libresColonnes = np.ones(m, dtype=bool)
+            libresColonnes[colonnes] = False
+            prix[libresColonnes] = plancher
+            # Couples conservés : la colonne affectée reste à epsilon près la meilleure de la ligne
+            valeurs = benefices[valides] - prix
+            ok = valeurs[np.arange(len(valides)), colonnes] >= valeurs.max(axis=1) - epsilon
+            if ok.all():
+                break
+            valides, colonnes = valides[ok], colonnes[ok]
+        ligneColonne[valides] = colonnes
+        colonneLigne[colonnes] = valides
+    else:
+        prix[:] = prix.min()
+
+    while True:
+        libres = np.flatnonzero(ligneColonne < 0)
+        if not libres.size:
+            break
+        valeurs = benefices[libres] - prix
+        k = lignes[:len(libres)]
+        meilleures = valeurs.argmax(axis=1)
+        v1 = valeurs[k, meilleures]
+        if m > 1:
+            valeurs[k, meilleures] = -np.inf
+            v2 = valeurs.max(axis=1)
+        else:
+            v2 = v1
+        offres = prix[meilleures] + (v1 - v2) + epsilon
+
+        # Meilleure offre par colonne : tri par (colonne, offre décroissante)
+        ordre = np.lexsort((-offres, meilleures))
+        colonnesTriees = meilleures[ordre]
+        premier = np.empty(len(ordre), dtype=bool)
+        premier[0] = True
+        premier[1:] = colonnesTriees[1:] != colonnesTriees[:-1]
+        gagnants = libres[ordre[premier]]
+        colonnes = colonnesTriees[premier]
+
+        evinces = colonneLigne[colonnes]
+        ligneColonne[evinces[evinces >= 0]] = -1
+        colonneLigne[colonnes] = gagnants
+        ligneColonne[gagnants] = colonnes
+        prix[colonnes] = offres[ordre[premier]]
+    return ligneColonne, prix
+
+
+def resoudreAffectation(couts: np.ndarray, prix: Optional[np.ndarray] = None, precision: float = 1e-3,
+                        affectationInitiale: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Affectation de coût minimal (une colonne au plus par ligne et inversement), par enchères
+    avec réduction progressive d'epsilon ; le coût total est à precision près de l'optimum.
+    Les coûts infinis sont interdits. S'il y a plus de lignes que de colonnes, ce sont les colonnes
+    qui enchérissent : les prix portent alors sur les lignes.
+    prix / affectationInitiale (colonne de chaque ligne, -1 = libre) : démarrage à chaud.
+    Retourne (colonne de chaque ligne ou -1, prix des lignes si n > m, sinon des colonnes).
+    """
+    n, m = couts.shape
+    affectation = np.full(n, -1)
+    transpose = n > m
+    prix = np.zeros(max(n, m) if transpose else m) if prix is None else np.array(prix, dtype=float)
+    finis = np.isfinite(couts)
+    if not finis.any():
+        return affectation, prix
+
+    valides = -couts[finis]
+    ampleur = float(valides.max() - valides.min())
+    # Bénéfice des couples interdits : assez bas pour qu'aucun échange ne les préfère à un couple
+    # permis, assez proche pour que l'enchère ne s'enlise pas
+    interdit = float(valides.min()) - (min(n, m) + 1) * (ampleur + 1.0)
+    benefices = np.where(finis, -couts, interdit)
+    initiale = affectationInitiale
+    if transpose:
+        benefices = benefices.T
+        if initiale is not None:
+            inverse = np.full(m, -1)
+            affectes = np.flatnonzero(initiale >= 0)
+            inverse[initiale[affectes]] = affectes
+            initiale = inverse
+
+    epsilonFinal = precision / (benefices.shape[0] + 1)
+    # Démarrage à chaud : les prix précédents sont proches de l'équilibre, on part d'un epsilon plus fin
+    epsilon = max(epsilonFinal, ampleur / (64.0 if initiale is not None else 4.0))
+    while True:
+        initiale, prix = enchere(benefices, prix, epsilon, initiale)
+        if epsilon <= epsilonFinal:
+            break
+        epsilon = max(epsilonFinal, epsilon / 6.0)
+
+    if transpose:
+        affectes = np.flatnonzero(initiale >= 0)
+        affectation[initiale[affectes]] = affectes
+    else:
+        affectation = initiale
+    # Couples interdits retirés
+    affectes = np.flatnonzero(affectation >= 0)
+    affectation[affectes[~finis[affectes, affectation[affectes]]]] = -1
+    return affectation, prix
+
+
+def _resoudreRegion(args: Tuple[np.ndarray, np.ndarray, float, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    # Point d'entrée des processus de calcul (fonction de module, sérialisable)
+    couts, prix, precision, initiale = args
+    return resoudreAffectation(couts, prix, precision, initiale)
+
+
+class AllocateurCubes:
+    """
+    Affectation des cubes connus (CarteCubes) aux collecteurs d'une flotte.
+    - Coût d'un couple (robot, cube) : distance de trajet (champ de distance vers le cube si un
+      planificateur est fourni, euclidienne sinon), majorée quand la batterie baisse, plus un terme
+      inversement proportionnel à la capacité restante (_stockageMax - _stockActuel).
+      Les robots pleins ou sous le seuil de batterie ne reçoivent rien.
+    - Résolution par enchères ; les prix et l'affectation précédente servent de démarrage à chaud
+      quand les cubes ou les robots changent.
+    - Au-delà de tailleRegion robots, la flotte est découpée en bandes verticales (robots et cubes
+      de la bande) résolues indépendamment, sur un pool de processus si nbProcessus > 1.
+    Chaque cube affecté est réservé dans la carte et transmis au robot (set_cible_affectee()).
+    """
+
+    def __init__(self, carte: CarteCubes, planificateur: Optional[PlanificateurAStar] = None,
+                 poidsBatterie: float = 1.0, poidsCapacite: float = 0.5, seuilBatterie: float = 20.0,
+                 precision: float = 1e-3, tailleRegion: int = 100, nbProcessus: int = 0):
+        self._carte: CarteCubes = carte
+        self._planificateur: Optional[PlanificateurAStar] = planificateur
+        self._poidsBatterie: float = poidsBatterie
+        self._poidsCapacite: float = poidsCapacite
+        self._seuilBatterie: float = seuilBatterie
+        self._precision: float = precision
+        self._tailleRegion: int = tailleRegion
+        self._nbProcessus: int = nbProcessus
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._robots: Dict[str, RobotCollector] = {}
+        self._affectations: Dict[str, int] = {}
+        # Prix de la dernière enchère : portés par les cubes, ou par les robots s'ils sont plus nombreux
+        self._prixCubes: Dict[int, float] = {}
+        self._prixRobots: Dict[str, float] = {}
+        # Champs de distance vers chaque cube (les cubes ne bougent pas), vidés si la grille change
+        self._champs: Dict[int, np.ndarray] = {}
+        if planificateur is not None:
+            planificateur.get_grille().ajouterObservateur(self._surChangementGrille)
+
+    # ---------- Flotte ----------
+
+    def ajouterRobot(self, robot: RobotCollector) -> None:
+        self._robots[robot.get_name()] = robot
+
+    def retirerRobot(self, robot: RobotCollector) -> None:
+        nom = robot.get_name()
+        self._robots.pop(nom, None)
+        self._prixRobots.pop(nom, None)
+        ident = self._affectations.pop(nom, None)
+        if ident is not None:
+            self._carte.liberer(ident)
+        robot.set_cible_affectee(None)
+
+    def get_affectations(self) -> Dict[str, int]:
+        return dict(self._affectations)
+
+    def reinitialiser(self) -> None:
+        """
+        Oublie l'affectation et les prix : le prochain allouer() repart à froid.
+        """
+        for nom, ident in self._affectations.items():
+            self._carte.liberer(ident)
+            self._robots[nom].set_cible_affectee(None)
+        self._affectations = {}
+        self._prixCubes.clear()
+        self._prixRobots.clear()
+
+    def fermer(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _surChangementGrille(self, changements) -> None:
+        self._champs.clear()
+
+    # ---------- Coûts ----------
+
+    def matriceCouts(self, robots: Sequence[RobotCollector], idents: Sequence[int]) -> np.ndarray:
+        """
+        Matrice (robots x cubes) des coûts d'affectation ; inf = robot indisponible ou cube inaccessible.
+        """
+        positions = np.array([robot.get_position()[:2] for robot in robots], dtype=float).reshape(-1, 2)
+        cubes = np.array([self._carte.get_position(i) for i in idents], dtype=float).reshape(-1, 2)
+        if self._planificateur is None:
+            distances = np.hypot(positions[:, None, 0] - cubes[None, :, 0], positions[:, None, 1] - cubes[None, :, 1])
+        else:
+            distances = self._distancesTrajet(positions, idents)
+
+        batteries = np.array([robot.get_battery_level() for robot in robots], dtype=float)
+        capacites = np.array([robot.get_stockage_max() - robot.get_stock_actuel() for robot in robots], dtype=float)
+        disponibles = (capacites > 0) & (batteries > self._seuilBatterie)
+        facteur = 1.0 + self._poidsBatterie * (1.0 - batteries / 100.0)
+        penalite = self._poidsCapacite / np.maximum(capacites, 1.0)
+        couts = distances * facteur[:, None] + penalite[:, None]
+        couts[~disponibles] = np.inf
+        return couts
+
+    def _distancesTrajet(self, positions: np.ndarray, idents: Sequence[int]) -> np.ndarray:
+        grille = self._planificateur.get_grille()
+        cellules = [grille.versCellule(x, y) for x, y in positions.tolist()]
+        index = np.array([grille.index(l, c) for l, c in cellules], dtype=np.intp)
+        distances = np.empty((len(positions), len(idents)))
+        for j, ident in enumerate(idents):
+            champ = self._champs.get(ident)
+            if champ is None:
+                cellule = grille.versCellule(*self._carte.get_position(ident))
+                champ = self._champs[ident] = ChampDistance(grille, [cellule]).toArray().ravel()
+            distances[:, j] = champ[index]
+        return distances * grille.get_resolution()
+
+    # ---------- Affectation ----------
+
+    def allouer(self) -> Dict[str, int]:
+        """
+        (Re)calcule l'affectation robot → cube et met à jour les réservations de la carte.
+        Retourne {nom du robot: identifiant du cube}.
+        """
+        noms = list(self._robots)
+        robots = [self._robots[nom] for nom in noms]
+        # Réservations de l'affectation précédente levées (elle reste le point de départ à chaud) ;
+        # un cube réservé hors de la flotte (collecteur autonome via _choisirCible()) n'est pas proposé
+        precedentes = self._affectations
+        for ident in precedentes.values():
+            self._carte.liberer(ident)
+        self._affectations = {}
+        idents = [ident for ident in self._carte.get_cubes()
+                  if self._carte.get_reservation(ident) is None or self._carte.get_reservation(ident) in self._robots]
+        # Champs et prix des cubes disparus
+        for ident in [i for i in self._champs if i not in self._carte]:
+            del self._champs[ident]
+        for ident in [i for i in self._prixCubes if i not in self._carte]:
+            del self._prixCubes[ident]
+
+        affectation = np.full(len(noms), -1)
+        if noms and idents:
+            regions = self._regions(robots, idents)
+            taches = []
+            for lignes, colonnes in regions:
+                taches.append(self._preparerRegion(noms, robots, idents, lignes, colonnes, precedentes))
+            if self._nbProcessus > 1 and len(taches) > 1:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(self._nbProcessus)
+                resultats = list(self._pool.map(_resoudreRegion, taches))
+            else:
+                resultats = [_resoudreRegion(tache) for tache in taches]
+            for (lignes, colonnes), (locale, prix) in zip(regions, resultats):
+                affectes = np.flatnonzero(locale >= 0)
+                affectation[lignes[affectes]] = colonnes[locale[affectes]]
+                if len(lignes) > len(colonnes):
+                    self._prixRobots.update(zip([noms[i] for i in lignes.tolist()], prix.tolist()))
+                else:
+                    self._prixCubes.update(zip([idents[j] for j in colonnes.tolist()], prix.tolist()))
+
+        # Réservations et cibles des robots ; un cube déjà réservé par un autre robot de la flotte
+        # (via _choisirCible()) n'est pas attribué une seconde fois
+        for i, nom in enumerate(noms):
+            ident = idents[affectation[i]] if affectation[i] >= 0 else None
+            if ident is not None and not self._carte.reserver(ident, nom):
+                ident = None
+            if ident is not None:
+                self._affectations[nom] = ident
+            robots[i].set_cible_affectee(ident)
+        return dict(self._affectations)
+
+    def _regions(self, robots: Sequence[RobotCollector], idents: Sequence[int]) -> List[Tuple[np.ndarray, np.ndarray]]:
+        # Bandes verticales contenant chacune ~tailleRegion robots ; les cubes suivent leur bande
+        nbRegions = -(-len(robots) // self._tailleRegion)
+        toutesLignes = np.arange(len(robots))
+        toutesColonnes = np.arange(len(idents))
+        if nbRegions <= 1:
+            return [(toutesLignes, toutesColonnes)]
+        xRobots = np.array([robot.get_position()[0] for robot in robots])
+        xCubes = np.array([self._carte.get_position(i)[0] for i in idents])
+        ordre = np.argsort(xRobots, kind="stable")
+        bandes = np.array_split(ordre, nbRegions)
+        # Limites entre bandes : milieu entre le dernier robot d'une bande et le premier de la suivante
+        limites = [(xRobots[a[-1]] + xRobots[b[0]]) / 2.0 for a, b in zip(bandes[:-1], bandes[1:])]
+        regionCube = np.searchsorted(np.array(limites), xCubes)
+        return [(np.sort(bande), toutesColonnes[regionCube == k]) for k, bande in enumerate(bandes)]
+
+    def _preparerRegion(self, noms: List[str], robots: Sequence[RobotCollector], idents: Sequence[int],
+                        lignes: np.ndarray, colonnes: np.ndarray, precedentes: Dict[str, int]) -> Tuple:
+        couts = self.matriceCouts([robots[i] for i in lignes], [idents[j] for j in colonnes])
+        # Démarrage à chaud : prix connus (cubes, ou robots s'ils sont plus nombreux)
+        # et affectation précédente en indices locaux
+        positionCube = {idents[j]: k for k, j in enumerate(colonnes.tolist())}
+        initiale = np.array([positionCube.get(precedentes.get(noms[i]), -1) for i in lignes.tolist()],
+                            dtype=np.intp)
+        if not (initiale >= 0).any():
+            return couts, None, self._precision, None
+        if len(lignes) > len(colonnes):
+            prix = np.array([self._prixRobots.get(noms[i], 0.0) for i in lignes.tolist()])
+        else:
+            prix = np.array([self._prixCubes.get(idents[j], 0.0) for j in colonnes.tolist()])
+        return couts, prix, self._precision, initiale
@@ -0,0 +1,145 @@
+from typing import List, Optional, Sequence, Union
+import numpy as np
+from robot_collector import PIDController
+
+Tableau = Union[float, Sequence[float], np.ndarray]
+
+
+class PIDBank:
+    """
+    Banque de N régulateurs PID évalués en un seul appel NumPy.
+    kp, ki, kd, intégrale et erreur précédente sont stockés dans des tableaux de taille N.
+    Sans option activée, compute() reproduit bit à bit PIDController.compute()
+    (mêmes opérations, dans le même ordre, en float64).
+    Options par régulateur :
+    - saturation de la sortie (set_limites) ;
+    - anti-windup : l'intégrale n'est pas incrémentée quand la sortie est saturée
+      et que l'erreur pousse plus loin dans la saturation ;
+    - dérivée sur la mesure : évite le pic de dérivée lors d'un changement de consigne.
+    """
+
+    def __init__(self, nbControleurs: int, kp: Tableau = 1.0, ki: Tableau = 0.0, kd: Tableau = 0.0):
+        if nbControleurs <= 0:
+            raise ValueError("La banque doit contenir au moins un régulateur.")
+        self._nb: int = nbControleurs
+        self._kp: np.ndarray = np.zeros(nbControleurs)
+        self._ki: np.ndarray = np.zeros(nbControleurs)
+        self._kd: np.ndarray = np.zeros(nbControleurs)
+        self.set_gains(kp, ki, kd)
+        # État interne (intégrale, erreur précédente, mesure précédente)
+        self._integral: np.ndarray = np.zeros(nbControleurs)
+        self._previousError: np.ndarray = np.zeros(nbControleurs)
+        self._previousMeasurement: np.ndarray = np.zeros(nbControleurs)
+        self._mesureConnue: np.ndarray = np.zeros(nbControleurs, dtype=bool)
+        # Options (désactivées par défaut)
+        self._sortieMin: np.ndarray = np.full(nbControleurs, -np.inf)
+        self._sortieMax: np.ndarray = np.full(nbControleurs, np.inf)
+        self._saturee: bool = False
+        self._antiWindup: np.ndarray = np.zeros(nbControleurs, dtype=bool)
+        self._deriveeMesure: np.ndarray = np.zeros(nbControleurs, dtype=bool)
+
+    @classmethod
+    def fromControllers(cls, controleurs: List[PIDController]) -> "PIDBank":
+        """
+        Construit une banque reprenant les gains et l'état interne de PIDController existants.
+        """
+        banque = cls(len(controleurs),
+                     [c.kp for c in controleurs], [c.ki for c in controleurs], [c.kd for c in controleurs])
+        banque._integral[:] = [c._integral for c in controleurs]
+        banque._previousError[:] = [c._previous_error for c in controleurs]
+        return banque
+
+    def writeBack(self, controleurs: List[PIDController]) -> None:
+        """
+        Recopie l'intégrale et l'erreur précédente dans les PIDController correspondants.
+        """
+        if len(controleurs) != self._nb:
+            raise ValueError("Le nombre de régulateurs doit correspondre à la taille de la banque.")
+        for c, integrale, erreur in zip(controleurs, self._integral.tolist(), self._previousError.tolist()):
+            c._integral = integrale
+            c._previous_error = erreur
+
+    # ---------- Getters / Setters ----------
+
+    def get_nb_controleurs(self) -> int:
+        return self._nb
+
+    def get_integrales(self) -> np.ndarray:
+        return self._integral.copy()
+
+    def set_gains(self, kp: Tableau, ki: Tableau, kd: Tableau) -> None:
+        self._kp[:] = kp
+        self._ki[:] = ki
+        self._kd[:] = kd
+
+    def set_limites(self, sortieMin: Tableau, sortieMax: Tableau) -> None:
+        """
+        Bornes de la sortie par régulateur (-inf / inf = pas de saturation).
+        """
+        sortieMin = np.broadcast_to(np.asarray(sortieMin, dtype=float), (self._nb,))
+        sortieMax = np.broadcast_to(np.asarray(sortieMax, dtype=float), (self._nb,))
+        if np.any(sortieMin > sortieMax):
+            raise ValueError("La borne basse doit être inférieure à la borne haute.")
+        self._sortieMin[:] = sortieMin
+        self._sortieMax[:] = sortieMax
+        self._saturee = bool(np.isfinite(self._sortieMin).any() or np.isfinite(self._sortieMax).any())
+
+    def set_anti_windup(self, actif: Union[bool, Sequence[bool], np.ndarray]) -> None:
+        self._antiWindup[:] = actif
+
+    def set_derivee_mesure(self, actif: Union[bool, Sequence[bool], np.ndarray]) -> None:
+        self._deriveeMesure[:] = actif
+
+    def reinitialiser(self, indices: Optional[Sequence[int]] = None) -> None:
+        """
+        Remet à zéro l'état interne de tous les régulateurs (ou seulement ceux de indices).
+        """
+        cible = slice(None) if indices is None else np.asarray(indices)
+        self._integral[cible] = 0.0
+        self._previousError[cible] = 0.0
+        self._previousMeasurement[cible] = 0.0
+        self._mesureConnue[cible] = False
+
+    # ---------- Calcul ----------
+
+    def compute(self, setpoint: Tableau, measurement: Tableau, dt: Tableau) -> np.ndarray:
+        """
+        Retourne les N commandes PID. setpoint, measurement et dt sont des scalaires
+        ou des tableaux de taille N (dt par régulateur ; dt <= 0 annule la dérivée).
+        """
+        taille = (self._nb,)
+        measurement = np.broadcast_to(np.asarray(measurement, dtype=float), taille)
+        dt = np.broadcast_to(np.asarray(dt, dtype=float), taille)
+        dtPositif = dt > 0
+
+        error = np.broadcast_to(setpoint - measurement, taille)
+        ancienneIntegrale = self._integral.copy() if self._antiWindup.any() else None
+        self._integral += error * dt
+
+        derivative = np.zeros(self._nb)
+        np.divide(error - self._previousError, dt, out=derivative, where=dtPositif)
+        if self._deriveeMesure.any():
+            # Dérivée sur la mesure : -(mesure - mesure précédente) / dt, nulle au premier appel
+            surMesure = np.zeros(self._nb)
+            np.divide(self._previousMeasurement - measurement, dt, out=surMesure,
+                      where=dtPositif & self._mesureConnue)
+            derivative = np.where(self._deriveeMesure, surMesure, derivative)
+
+        output = self._kp * error + self._ki * self._integral + self._kd * derivative
+
+        if self._saturee:
+            bornee = np.clip(output, self._sortieMin, self._sortieMax)
+            if ancienneIntegrale is not None:
+                # Intégration conditionnelle : on annule l'incrément qui aggrave la saturation
+                bloquee = self._antiWindup & (((output > self._sortieMax) & (error > 0))
+                                              | ((output < self._sortieMin) & (error < 0)))
+                if bloquee.any():
+                    self._integral[bloquee] = ancienneIntegrale[bloquee]
+                    output = self._kp * error + self._ki * self._integral + self._kd * derivative
+                    bornee = np.clip(output, self._sortieMin, self._sortieMax)
+            output = bornee
+
+        self._previousError[:] = error
+        self._previousMeasurement[:] = measurement
+        self._mesureConnue[:] = True
+        return output
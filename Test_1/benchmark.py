@@ -0,0 +1,932 @@
+# benchmark.py
+# Mesures de performance des modules Tekbot.
+# Usage : python benchmark.py [nom_du_bench ...]   (sans argument : tous les benchs)
+
+import math
+import pickle
+import random
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+
+from robot import Robot
+from robot_compact import RobotCompact
+from robot_collector import RobotCollector
+from robot_trieur import RobotTrieur
+from simulation_flotte import SimulationFlotte
+from navigation import GrilleOccupation, PlanificateurAStar, ZONE_TRI
+from vision import CameraSynthetique, DetecteurCube
+from cinematique_bras import BrasPlanaire, TableIK
+from ordonnanceur import OrdonnanceurTempsReel
+from banque_pid import PIDBank
+from robot_collector import PIDController
+from telemetrie import Telemetrie, TelemetrieConsole, DESACTIVEE
+from monde import CarteCubes
+from allocation import AllocateurCubes
+from chaine_tri import ChaineTri
+from simulation_evenements import SimulateurMission
+from odometrie import OdometrieEncodeurs
+from energie import ChampEnergie, ModeleEnergie
+from capteurs import Capteur
+from planification_tri import simulerDepots
+from profilage import HistogrammeLatence, Profileur
+from flux_camera import AnneauImages, acquerirSynthetique
+from journal_flotte import JournalFlotte, LecteurJournal
+from calibration import CalibrateurZone, CameraMarqueurs, acquerirImages, identifiantsMarqueurs
+import multiprocessing
+import threading
+import os
+import numpy as np
+
+
+def bench_simulation_flotte():
+    print("=== Bench SimulationFlotte : robot-pas/seconde ===")
+    nbPas = 200
+
+    # Référence : boucle Python sur RobotCollector.move()
+    robots = [RobotCollector(name=f"C{i}", ecartementRoues=0.5, stockageMax=5) for i in range(100)]
+    debut = time.perf_counter()
+    for _ in range(nbPas):
+        for robot in robots:
+            robot.move()
+    scalaire = len(robots) * nbPas / (time.perf_counter() - debut)
+    print(f"  RobotCollector.move() (boucle)  : {scalaire:14,.0f} robot-pas/s")
+
+    for taille in (1, 10, 100, 1_000, 10_000, 100_000):
+        flotte = SimulationFlotte(taille)
+        flotte.set_vitesses_roues([0.3] * taille, [0.5] * taille)
+        debut = time.perf_counter()
+        flotte.run(nbPas)
+        debit = taille * nbPas / (time.perf_counter() - debut)
+        print(f"  SimulationFlotte N={taille:<7}      : {debit:14,.0f} robot-pas/s  (x{debit / scalaire:.1f})")
+    print()
+
+
+def bench_robot_compact():
+    print("=== Bench RobotCompact : mémoire et accès aux attributs ===")
+
+    class RobotSimple(Robot):
+        def move(self):
+            super().move()
+
+    class RobotSimpleCompact(RobotCompact):
+        __slots__ = ()
+
+        def move(self):
+            super().move()
+
+    nbRobots = 100_000
+    for classe in (RobotSimple, RobotSimpleCompact):
+        tracemalloc.start()
+        robots = [classe("R") for _ in range(nbRobots)]
+        for i, robot in enumerate(robots):
+            robot.set_position(float(i), 0.5, 0.25)
+        memoire, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"  {classe.__name__:<20} : {memoire / nbRobots:6.0f} octets/robot")
+        del robots
+
+    operations = {
+        "get_position()": "r.get_position()",
+        "set_position()": "r.set_position(1.0, 2.0, 0.5)",
+        "set_vitesse()": "r.set_vitesse(0.3, 0.1)",
+        "set_battery_level()": "r.set_battery_level(50.0)",
+        "get_etat()": "r.get_etat()",
+        "set_etat()": "r.set_etat('en mouvement')",
+    }
+    nbAppels = 1_000_000
+    for nom, instruction in operations.items():
+        temps = []
+        for classe in (RobotSimple, RobotSimpleCompact):
+            t = timeit.timeit(instruction, globals={"r": classe("R")}, number=nbAppels)
+            temps.append(t / nbAppels * 1e9)
+        print(f"  {nom:<20} : Robot {temps[0]:5.1f} ns | RobotCompact {temps[1]:5.1f} ns")
+    print()
+
+
+def _percentiles(mesures, unite=1e3):
+    p50, p90, p99 = np.percentile(np.asarray(mesures) * unite, [50, 90, 99])
+    return f"p50 {p50:9.3f} | p90 {p90:9.3f} | p99 {p99:9.3f}"
+
+
+def bench_navigation(taille=1000):
+    print(f"=== Bench navigation : arène {taille}x{taille} cellules, 15 % d'obstacles ===")
+    rng = np.random.default_rng(0)
+    couts = np.where(rng.random((taille, taille)) < 0.15, np.inf, 1.0)
+    couts[0, 0] = couts[-1, -1] = 1.0
+    grille = GrilleOccupation.fromArray(couts)
+    planificateur = PlanificateurAStar(grille)
+
+    debut = time.perf_counter()
+    planificateur.definirZoneTri([(0, 0)])
+    print(f"  Champ de distance (zone de tri)   : {time.perf_counter() - debut:.2f} s")
+
+    libres = np.argwhere(couts != np.inf)
+    tirage = random.Random(0)
+    mesures = []
+    for _ in range(20):
+        depart, arrivee = (tuple(libres[tirage.randrange(len(libres))]) for _ in range(2))
+        debut = time.perf_counter()
+        planificateur.planifier(depart, arrivee)
+        mesures.append(time.perf_counter() - debut)
+    print(f"  A* (ms)                           : {_percentiles(mesures)}")
+
+    mesures = []
+    for _ in range(10_000):
+        cellule = tuple(libres[tirage.randrange(len(libres))])
+        debut = time.perf_counter()
+        planificateur.distanceVers(ZONE_TRI, cellule)
+        mesures.append(time.perf_counter() - debut)
+    print(f"  returnToSort : lecture champ (µs) : {_percentiles(mesures, 1e6)}")
+
+    mesures = []
+    for _ in range(50):
+        ligne, colonne = libres[tirage.randrange(len(libres))]
+        obstacle = grille.estLibre(ligne, colonne)
+        debut = time.perf_counter()
+        grille.set_obstacle(ligne, colonne, obstacle)
+        mesures.append(time.perf_counter() - debut)
+    print(f"  Replanification incrémentale (ms) : {_percentiles(mesures)}")
+    print()
+
+
+def bench_vision(nbImages=100):
+    print("=== Bench détection de cubes : images/seconde ===")
+    for largeur, hauteur in ((640, 480), (1280, 720)):
+        for mode in ("image entière", "suivi ROI"):
+            camera = CameraSynthetique(largeur, hauteur)
+            detecteur = DetecteurCube()
+            debut = time.perf_counter()
+            for _ in range(nbImages):
+                if mode == "image entière":
+                    detecteur.reinitialiser()
+                numero, image = camera.derniereImage()
+                detecteur.detecter(image, numero)
+                camera.avancer()
+            ips = nbImages / (time.perf_counter() - debut)
+            print(f"  {largeur}x{hauteur} {mode:<14} : {ips:8.1f} images/s")
+
+        # Deuxième appel sur la même image (pickUpCube() après move()) : lecture du cache
+        numero, image = camera.derniereImage()
+        detecteur.detecter(image, numero)
+        duree = timeit.timeit(lambda: detecteur.detecter(image, numero), number=10_000) / 10_000
+        print(f"  {largeur}x{hauteur} cache (même image) : {duree * 1e6:8.2f} µs/appel")
+    print()
+
+
+def bench_classification(nbCrops=256):
+    print(f"=== Bench classification : {nbCrops} images 32x32 ===")
+    rng = np.random.default_rng(0)
+    teintes = rng.choice([(200, 30, 30), (30, 180, 40), (30, 60, 200)], nbCrops)
+    crops = [np.clip(rng.normal(t, 15, (32, 32, 3)), 0, 255).astype(np.uint8) for t in teintes]
+    corbeilles = {"bleu": (0.0, 0.0), "vert": (1.0, 0.0), "rouge": (0.0, 1.0), "doute": (1.0, 1.0)}
+
+    trieur = RobotTrieur(name="T", nbArticulations=3, corbeilles=corbeilles)
+    debut = time.perf_counter()
+    for crop in crops:
+        trieur.classifyCube(crop)
+    unitaire = time.perf_counter() - debut
+
+    trieur = RobotTrieur(name="T", nbArticulations=3, corbeilles=corbeilles)
+    debut = time.perf_counter()
+    trieur.classifyBatch(crops)
+    lot = time.perf_counter() - debut
+
+    debut = time.perf_counter()
+    trieur.classifyBatch(crops)
+    cache = time.perf_counter() - debut
+    print(f"  {'classifyCube() x' + str(nbCrops):<28} : {nbCrops / unitaire:10,.0f} images/s")
+    print(f"  classifyBatch()              : {nbCrops / lot:10,.0f} images/s  (x{unitaire / lot:.1f})")
+    print(f"  classifyBatch() (cache LRU)  : {nbCrops / cache:10,.0f} images/s")
+    print()
+
+
+def bench_cinematique_bras(nbCibles=2_000):
+    print("=== Bench cinématique inverse : résolution à froid / table / démarrage à chaud ===")
+    corbeilles = {"bleu": (0.0, 0.6), "vert": (1.0, 0.0), "rouge": (0.8, 0.8), "doute": (-0.5, 0.5)}
+    rng = np.random.default_rng(0)
+    for nbArticulations in (3, 6):
+        bras = BrasPlanaire([1.5 / nbArticulations] * nbArticulations)
+        table = TableIK(bras)
+        table.reconstruire(corbeilles)
+        cibles = [corbeilles[c] for c in rng.choice(list(corbeilles), nbCibles)]
+        voisines = [(x + dx, y + dy) for (x, y), (dx, dy) in zip(cibles, rng.normal(0, 0.02, (nbCibles, 2)))]
+
+        debut = time.perf_counter()
+        for x, y in voisines:
+            bras.resoudre(x, y)
+        froid = (time.perf_counter() - debut) / nbCibles
+        debut = time.perf_counter()
+        for x, y in cibles:
+            table.angles(x, y)
+        lecture = (time.perf_counter() - debut) / nbCibles
+        debut = time.perf_counter()
+        for x, y in voisines:
+            table.resoudreProche(x, y)
+        chaud = (time.perf_counter() - debut) / nbCibles
+        print(f"  {nbArticulations} articulations : à froid {froid * 1e6:7.1f} µs | table {lecture * 1e6:5.2f} µs"
+              f" | cible voisine à chaud {chaud * 1e6:7.1f} µs")
+    print()
+
+
+def bench_ordonnanceur(duree=1.0):
+    print("=== Bench ordonnanceur : 100 Hz contrôle / 30 Hz vision par robot ===")
+    for nbRobots in (1, 10, 50, 100):
+        ordonnanceur = OrdonnanceurTempsReel()
+        for i in range(nbRobots):
+            robot = RobotCollector(name=f"C{i}", ecartementRoues=0.5, stockageMax=5)
+            robot.set_vitesse(0.5, 0.0)
+            ordonnanceur.ajouterRobotCollector(robot)
+        ordonnanceur.lancer(duree)
+        reel = ordonnanceur.get_duree_execution()
+        controle = [s for nom, s in ordonnanceur.get_statistiques().items() if nom.endswith("/controle")]
+        frequence = sum(s.get_frequence_mesuree(reel) for s in controle) / nbRobots
+        gigue = max(s.gigueMax for s in controle)
+        manquees = sum(s.echeancesManquees for s in controle)
+        sautes = sum(s.ticksSautes for s in controle)
+        print(f"  {nbRobots:3d} robots : contrôle {frequence:6.1f} Hz/robot | gigue max {gigue * 1e3:6.2f} ms"
+              f" | échéances manquées {manquees:5d} | ticks sautés {sautes:5d}")
+    print()
+
+
+def bench_banque_pid(nbPas=200):
+    print("=== Bench PIDBank : régulateurs-pas/seconde ===")
+    rng = np.random.default_rng(0)
+    for taille in (10, 100, 1_000, 10_000):
+        gains = rng.uniform(0.0, 2.0, (taille, 3))
+        consignes, mesures = rng.uniform(-1.0, 1.0, (2, taille))
+        dts = np.full(taille, 0.01)
+
+        controleurs = [PIDController(kp, ki, kd) for kp, ki, kd in gains.tolist()]
+        listeConsignes, listeMesures = consignes.tolist(), mesures.tolist()
+        pas = max(1, nbPas * 100 // taille)
+        debut = time.perf_counter()
+        for _ in range(pas):
+            for c, s, m in zip(controleurs, listeConsignes, listeMesures):
+                c.compute(s, m, 0.01)
+        scalaire = taille * pas / (time.perf_counter() - debut)
+
+        banque = PIDBank(taille, gains[:, 0], gains[:, 1], gains[:, 2])
+        debut = time.perf_counter()
+        for _ in range(nbPas):
+            banque.compute(consignes, mesures, dts)
+        vectorise = taille * nbPas / (time.perf_counter() - debut)
+
+        banque.set_limites(-1.0, 1.0)
+        banque.set_anti_windup(True)
+        banque.set_derivee_mesure(True)
+        debut = time.perf_counter()
+        for _ in range(nbPas):
+            banque.compute(consignes, mesures, dts)
+        options = taille * nbPas / (time.perf_counter() - debut)
+        print(f"  N={taille:<6} boucle PIDController {scalaire:12,.0f} | PIDBank {vectorise:14,.0f}"
+              f" (x{vectorise / scalaire:.1f}) | toutes options {options:14,.0f}")
+    print()
+
+
+def bench_telemetrie(nbIterations=20_000):
+    print("=== Bench télémétrie : sortNextCube() et move() par seconde ===")
+    corbeilles = {"bleu": (0.0, 0.5), "vert": (0.5, 0.0), "rouge": (0.5, 0.5), "doute": (0.2, 0.6)}
+    with open(os.devnull, "w") as nulle:
+        modes = [("print() (console)", lambda: TelemetrieConsole(sortie=nulle)),
+                 ("tampon + texte", lambda: Telemetrie(sortie=nulle)),
+                 ("tampon + binaire", lambda: Telemetrie(chemin=os.devnull, binaire=True)),
+                 ("désactivée", lambda: DESACTIVEE)]
+        for nom, fabrique in modes:
+            telemetrie = fabrique()
+            trieur = RobotTrieur(name="TriBench", nbArticulations=3, corbeilles=corbeilles)
+            trieur.set_telemetrie(telemetrie)
+            cubes = [{"id": i} for i in range(nbIterations)]
+            debut = time.perf_counter()
+            while cubes:
+                trieur.sortNextCube(cubes)
+            tri = nbIterations / (time.perf_counter() - debut)
+
+            # move() avec un cube détecté à chaque pas (détection stub) : un événement par pas
+            collector = RobotCollector(name="ColBench", ecartementRoues=0.5, stockageMax=nbIterations + 1)
+            collector.set_telemetrie(telemetrie)
+            collector.detectCube = lambda: (0.5, 0.0)
+            collector.set_vitesse(0.5, 0.0)
+            debut = time.perf_counter()
+            for _ in range(nbIterations // 10):
+                collector.set_battery_level(100.0)
+                for _ in range(10):
+                    collector.move()
+            deplacement = nbIterations / (time.perf_counter() - debut)
+            if isinstance(telemetrie, Telemetrie):
+                telemetrie.fermer()
+            print(f"  {nom:<18} : sortNextCube {tri:10,.0f} /s | move {deplacement:10,.0f} /s")
+    print()
+
+
+def bench_monde(nbCubes=100_000, nbRequetes=2_000):
+    print(f"=== Bench carte des cubes : {nbCubes:,} cubes dans une arène de 100 m x 100 m ===")
+    rng = np.random.default_rng(0)
+    positions = rng.uniform(0.0, 100.0, (nbCubes, 2))
+    requetes = rng.uniform(0.0, 100.0, (nbRequetes, 2)).tolist()
+
+    carte = CarteCubes(tailleCellule=0.5, rayonFusion=0.0)
+    debut = time.perf_counter()
+    idents = carte.ajouterLot(positions.tolist())
+    duree = time.perf_counter() - debut
+    print(f"  insertion               : {nbCubes / duree:12,.0f} cubes/s")
+
+    mesures = []
+    for x, y in requetes:
+        debut = time.perf_counter()
+        carte.plusProche(x, y)
+        mesures.append(time.perf_counter() - debut)
+    print(f"  plusProche() (µs)       : {_percentiles(mesures, 1e6)}")
+
+    mesures = []
+    for x, y in requetes:
+        debut = time.perf_counter()
+        carte.dansRayon(x, y, 2.0)
+        mesures.append(time.perf_counter() - debut)
+    print(f"  dansRayon(2 m) (µs)     : {_percentiles(mesures, 1e6)}")
+
+    # Référence : balayage NumPy de toutes les positions
+    mesures = []
+    for x, y in requetes[:200]:
+        debut = time.perf_counter()
+        int(np.argmin((positions[:, 0] - x) ** 2 + (positions[:, 1] - y) ** 2))
+        mesures.append(time.perf_counter() - debut)
+    print(f"  balayage NumPy (µs)     : {_percentiles(mesures, 1e6)}")
+
+    # Cycle de collecte : plus proche, réservation, retrait (la carte se vide)
+    debut = time.perf_counter()
+    x, y = 50.0, 50.0
+    for _ in range(nbRequetes):
+        ident, x, y = carte.plusProche(x, y, proprietaire="C0")
+        carte.reserver(ident, "C0")
+        carte.retirer(ident)
+    duree = time.perf_counter() - debut
+    print(f"  plusProche + retrait    : {nbRequetes / duree:12,.0f} cycles/s")
+
+    debut = time.perf_counter()
+    for ident in idents:
+        carte.retirer(ident)
+    duree = time.perf_counter() - debut
+    print(f"  retrait                 : {nbCubes / duree:12,.0f} cubes/s")
+    print()
+
+
+def bench_allocation(tailles=(10, 50, 100, 200, 500), nbProcessus=4):
+    print("=== Bench allocation des cubes : latence d'affectation (ms), 2 cubes par robot ===")
+    print(f"  {'robots':>6} | {'à froid':>9} | {'à chaud':>9} | {'régions':>9} | {'régions pool':>12}")
+    for nbRobots in tailles:
+        rng = np.random.default_rng(nbRobots)
+        cote = 10.0 * np.sqrt(nbRobots)
+        carte = CarteCubes(tailleCellule=1.0, rayonFusion=0.0)
+        carte.ajouterLot(rng.uniform(0.0, cote, (2 * nbRobots, 2)).tolist())
+        robots = []
+        for k, (x, y) in enumerate(rng.uniform(0.0, cote, (nbRobots, 2)).tolist()):
+            robot = RobotCollector(name=f"C{k}", ecartementRoues=0.5, stockageMax=5)
+            robot.set_position(x, y, 0.0)
+            robot.set_battery_level(float(rng.uniform(30.0, 100.0)))
+            robots.append(robot)
+
+        resultats = []
+        for tailleRegion, processus in ((nbRobots, 0), (100, 0), (100, nbProcessus)):
+            allocateur = AllocateurCubes(carte, tailleRegion=tailleRegion, nbProcessus=processus)
+            for robot in robots:
+                allocateur.ajouterRobot(robot)
+            allocateur.allouer()                 # Préchauffage (démarrage du pool)
+            allocateur.reinitialiser()
+            debut = time.perf_counter()
+            allocateur.allouer()
+            resultats.append(time.perf_counter() - debut)
+            if len(resultats) == 1:
+                # Démarrage à chaud : les robots ont avancé, un cube a été ramassé
+                for robot in robots:
+                    x, y, theta = robot.get_position()
+                    robot.set_position(x + rng.normal(0.0, 0.2), y + rng.normal(0.0, 0.2), theta)
+                carte.retirer(next(iter(carte.get_cubes())))
+                debut = time.perf_counter()
+                allocateur.allouer()
+                resultats.append(time.perf_counter() - debut)
+            allocateur.reinitialiser()
+            allocateur.fermer()
+        froid, chaud, regions, pool = (1e3 * r for r in resultats)
+        print(f"  {nbRobots:6d} | {froid:9.2f} | {chaud:9.2f} | {regions:9.2f} | {pool:12.2f}")
+    print()
+
+
+def bench_chaine_tri(nbCubesParCollecteur=40, dureeCollecte=0.005, dureeBras=0.004):
+    print(f"=== Bench chaîne collecte → tri : collecte {dureeCollecte * 1e3:.0f} ms/cube,"
+          f" bras {dureeBras * 1e3:.0f} ms/cube (durées simulées) ===")
+    corbeilles = {"bleu": (0.0, 0.6), "vert": (1.0, 0.0), "rouge": (0.8, 0.8), "doute": (-0.5, 0.5)}
+    rng = np.random.default_rng(0)
+    teintes = rng.choice([(200, 30, 30), (30, 180, 40), (30, 60, 200)], 64)
+    crops = [np.clip(rng.normal(t, 15, (16, 16, 3)), 0, 255).astype(np.uint8) for t in teintes]
+
+    def trieurSimule(nom):
+        trieur = RobotTrieur(name=nom, nbArticulations=3, corbeilles=dict(corbeilles))
+        trieur.set_telemetrie(DESACTIVEE)
+        navigateArmTo = trieur.navigateArmTo
+        def navigue(xC, yC):
+            time.sleep(dureeBras)          # Mouvement du bras
+            navigateArmTo(xC, yC)
+        trieur.navigateArmTo = navigue
+        return trieur
+
+    # Référence séquentielle : un collecteur remplit sa liste, puis un trieur la vide (sortNextCube)
+    trieur = trieurSimule("Tseq")
+    debut = time.perf_counter()
+    liste = []
+    for i in range(nbCubesParCollecteur):
+        time.sleep(dureeCollecte)
+        liste.append({"crop": crops[i % len(crops)]})
+    while liste:
+        trieur.sortNextCube(liste)
+    duree = time.perf_counter() - debut
+    print(f"  séquentiel 1 collecteur / 1 trieur : {60.0 * nbCubesParCollecteur / duree:8.0f} cubes/min")
+
+    print(f"  {'collect.':>8} {'trieurs':>8} | {'cubes/min':>9} | {'file moy':>8} | {'blocage coll. (ms)':>18}"
+          f" | {'attente trieurs (ms)':>20} | {'latence moy (ms)':>16}")
+    for nbCollecteurs, nbTrieurs in ((1, 1), (2, 1), (4, 1), (4, 2), (8, 2), (8, 4)):
+        chaine = ChaineTri([trieurSimule(f"T{k}") for k in range(nbTrieurs)], capacite=8)
+
+        def collecter():
+            for i in range(nbCubesParCollecteur):
+                time.sleep(dureeCollecte)
+                chaine.deposer({"crop": crops[i % len(crops)]})
+        with chaine:
+            collecteurs = [threading.Thread(target=collecter) for _ in range(nbCollecteurs)]
+            for thread in collecteurs:
+                thread.start()
+            for thread in collecteurs:
+                thread.join()
+        stats = chaine.get_statistiques()
+        print(f"  {nbCollecteurs:8d} {nbTrieurs:8d} | {stats.get_cubes_par_minute():9.0f} |"
+              f" {stats.get_profondeur_moyenne():8.2f} | {stats.attenteProducteurTotale * 1e3:18.1f} |"
+              f" {stats.attenteTrieursTotale * 1e3:20.1f} | {stats.get_latence_moyenne() * 1e3:16.2f}")
+    print()
+
+
+def bench_simulation_evenements(nbCollecteurs=(1, 4, 16), dureeEvenements=24 * 3600.0, dureePasFixe=600.0):
+    print("=== Bench simulation de mission : heures simulées par seconde réelle ===")
+    corbeilles = {"bleu": (0.0, 0.6), "vert": (1.0, 0.0), "rouge": (0.8, 0.8), "doute": (-0.5, 0.5)}
+    for nb in nbCollecteurs:
+        collecteurs = [RobotCollector(name=f"S{k}", ecartementRoues=0.5, stockageMax=5) for k in range(nb)]
+        trieurs = [RobotTrieur(name=f"ST{k}", nbArticulations=3, corbeilles=dict(corbeilles))
+                   for k in range(max(1, nb // 4))]
+        for robot in collecteurs + trieurs:
+            robot.set_telemetrie(DESACTIVEE)
+        simulation = SimulateurMission(collecteurs, trieurs, graine=0, tauxApparition=0.02 * nb, nbCubesInitiaux=nb)
+        debut = time.perf_counter()
+        nbEvenements = simulation.executer(dureeEvenements)
+        evenements = time.perf_counter() - debut
+
+        # Référence : boucle à pas fixe de 0.1 s appelant move() sur chaque collecteur, comme test.py
+        for robot in collecteurs:
+            robot.set_vitesse(0.5, 0.0)
+            robot.detectCube = lambda: None
+        debut = time.perf_counter()
+        for _ in range(int(dureePasFixe / 0.1)):
+            for robot in collecteurs:
+                robot.move(0.1)
+                if robot.get_battery_level() < 1.0:
+                    robot.set_battery_level(100.0)
+        pasFixe = time.perf_counter() - debut
+        heuresEvenements = dureeEvenements / 3600.0 / evenements
+        heuresPasFixe = dureePasFixe / 3600.0 / pasFixe
+        print(f"  {nb:3d} collecteurs | événements : {heuresEvenements:9.1f} h/s ({nbEvenements:,} évén.,"
+              f" {simulation.get_nb_tries():,} cubes triés) | pas fixe 0.1 s : {heuresPasFixe:7.3f} h/s"
+              f" | x{heuresEvenements / heuresPasFixe:,.0f}")
+    print()
+
+
+def bench_odometrie(frequence=5_000.0, duree=60.0, tailleBloc=1_000):
+    print(f"=== Bench odométrie encodeurs : {frequence / 1e3:.0f} kHz, {duree:.0f} s de trajectoire ===")
+    ecartement, metresParTick = 0.5, 1e-5
+    rng = np.random.default_rng(0)
+    # Trajectoire de référence : vitesses de roues variables, échantillonnage avec gigue,
+    # vérité terrain intégrée par arcs exacts sur 20 sous-pas non quantifiés
+    n = int(duree * frequence)
+    temps = np.cumsum(rng.uniform(0.5, 1.5, n) / frequence)
+    fin = np.linspace(0.0, temps[-1], 20 * n + 1)
+    vitesseG = 0.4 + 0.3 * np.sin(0.7 * fin)
+    vitesseD = 0.4 + 0.3 * np.sin(0.9 * fin + 1.0)
+    distG = np.concatenate(([0.0], np.cumsum(0.5 * (vitesseG[1:] + vitesseG[:-1]) * np.diff(fin))))
+    distD = np.concatenate(([0.0], np.cumsum(0.5 * (vitesseD[1:] + vitesseD[:-1]) * np.diff(fin))))
+    dG, dD = np.diff(distG), np.diff(distD)
+    ds, dTheta = 0.5 * (dD + dG), (dD - dG) / ecartement
+    theta = np.cumsum(dTheta)
+    corde = ds * np.sinc(dTheta / (2.0 * np.pi))
+    verite = (float((corde * np.cos(theta - 0.5 * dTheta)).sum()), float((corde * np.sin(theta - 0.5 * dTheta)).sum()))
+    gauche = np.floor(np.interp(temps, fin, distG) / metresParTick).astype(np.int64)
+    droite = np.floor(np.interp(temps, fin, distD) / metresParTick).astype(np.int64)
+    temps = np.concatenate(([0.0], temps))
+    gauche = np.concatenate(([0], gauche))
+    droite = np.concatenate(([0], droite))
+
+    def parBlocs(covariance):
+        odometrie = OdometrieEncodeurs(ecartement, metresParTick, covariance=covariance)
+        pose = (0.0, 0.0, 0.0)
+        for debut in range(0, n + 1, tailleBloc):
+            pose = odometrie.integrerBloc(pose, temps[debut:debut + tailleBloc],
+                                          gauche[debut:debut + tailleBloc], droite[debut:debut + tailleBloc])
+        return pose
+
+    def eulerParEchantillon():
+        # Euler depuis l'ancien θ, échantillon par échantillon en Python
+        x = y = th = 0.0
+        G, D = gauche.tolist(), droite.tolist()
+        for k in range(1, n + 1):
+            dL = (G[k] - G[k - 1]) * metresParTick
+            dR = (D[k] - D[k - 1]) * metresParTick
+            dsk = 0.5 * (dR + dL)
+            x += dsk * math.cos(th)
+            y += dsk * math.sin(th)
+            th += (dR - dL) / ecartement
+        return (x, y, th)
+
+    def eulerMove(dt=0.1):
+        # Mise à jour actuelle de move(dt) : un pas d'Euler par appel, vitesses moyennes sur dt
+        x = y = th = 0.0
+        pas = np.searchsorted(temps, np.arange(0.0, temps[-1], dt))
+        for a, b in zip(pas[:-1], pas[1:]):
+            dL = (gauche[b] - gauche[a]) * metresParTick
+            dR = (droite[b] - droite[a]) * metresParTick
+            x += 0.5 * (dR + dL) * np.cos(th)
+            y += 0.5 * (dR + dL) * np.sin(th)
+            th += (dR - dL) / ecartement
+        return (x, y, th)
+
+    for nom, methode in (("blocs, arc exact", lambda: parBlocs(False)),
+                         ("blocs + covariance", lambda: parBlocs(True)),
+                         ("Euler par échantillon", eulerParEchantillon),
+                         ("Euler move(0.1)", eulerMove)):
+        debut = time.perf_counter()
+        x, y, _ = methode()
+        ecoule = time.perf_counter() - debut
+        derive = np.hypot(x - verite[0], y - verite[1])
+        print(f"  {nom:<22} : {n / ecoule:14,.0f} échantillons/s | dérive finale {derive * 1e3:9.3f} mm")
+    print()
+
+
+def bench_energie(taille=100, nbLectures=200_000, dureeMission=4 * 3600.0):
+    print(f"=== Bench champ d'énergie de retour : grille {taille}x{taille} ===")
+    rng = np.random.default_rng(0)
+    grille = GrilleOccupation(taille, taille, resolution=0.2)
+    debut = time.perf_counter()
+    champ = ChampEnergie(grille, [(0, 0), (0, 1), (1, 0), (1, 1)], ModeleEnergie())
+    construction = time.perf_counter() - debut
+    # Obstacles ponctuels apparaissant / disparaissant : réparation incrémentale
+    durees = []
+    for _ in range(50):
+        l, c = rng.integers(2, taille, 2).tolist()
+        debut = time.perf_counter()
+        grille.set_obstacle(l, c, not np.isinf(grille.get_cout(l, c)))
+        durees.append(time.perf_counter() - debut)
+    positions = rng.uniform(0.0, taille * 0.2, (nbLectures, 3)).tolist()
+    debut = time.perf_counter()
+    for x, y, theta in positions:
+        champ.energieEn(x, y, theta)
+    lecture = (time.perf_counter() - debut) / nbLectures
+    print(f"  construction {construction * 1e3:8.1f} ms | mise à jour obstacle {np.median(durees) * 1e3:6.2f} ms"
+          f" (médiane, {champ.get_nb_recalculs()} recalcul(s) complet(s)) | energieEn() {lecture * 1e6:5.2f} µs")
+
+    # Mission limitée par la batterie (arène 20 m, 3 %/m) : seuil fixe de 20 %, seuil fixe sûr
+    # (retour depuis le coin opposé + marge) et champ d'énergie
+    corbeilles = {"bleu": (0.0, 0.6), "vert": (1.0, 0.0), "rouge": (0.8, 0.8), "doute": (-0.5, 0.5)}
+    modele = ModeleEnergie(parMetre=3.0)
+    seuilSur = modele.coutDeplacement(20.0 * math.sqrt(2.0)) + modele.marge
+    for nom, seuil, champ in (("seuil fixe 20 %", 20.0, None),
+                              (f"seuil fixe sûr {seuilSur:.0f} %", seuilSur, None),
+                              ("champ d'énergie", 20.0,
+                               ChampEnergie(GrilleOccupation(40, 40, resolution=0.5), [(0, 0)], modele))):
+        collecteurs = [RobotCollector(name=f"E{k}", ecartementRoues=0.5, stockageMax=20) for k in range(4)]
+        trieurs = [RobotTrieur(name="ET", nbArticulations=3, corbeilles=dict(corbeilles))]
+        for robot in collecteurs + trieurs:
+            robot.set_telemetrie(DESACTIVEE)
+        simulation = SimulateurMission(collecteurs, trieurs, graine=1, tailleArene=20.0, tauxApparition=1.0,
+                                       nbCubesInitiaux=200, consommation=3.0, seuilBatterie=seuil,
+                                       champEnergie=champ)
+        simulation.executer(dureeMission)
+        nbCubes = max(simulation.get_nb_collectes(), 1)
+        print(f"  {nom:<20} : {simulation.get_nb_collectes():6,} cubes | {100.0 * simulation.get_nb_retours() / nbCubes:6.1f}"
+              f" retours / 100 cubes | batterie à l'arrivée {simulation.get_batterie_retour_moyenne():5.1f} %"
+              f" | {simulation.get_nb_pannes():4d} arrivées batterie vide")
+    print()
+
+
+def bench_capteurs(duree=1.0, nbCapteursListe=2_000):
+    print("=== Bench capteurs : boucle de contrôle avec lectures synchrones / en cache ===")
+    # Caméra 30 Hz (E/S 20 ms), lidar 10 Hz (E/S 5 ms), encodeurs 200 Hz (non bloquants)
+    definitions = (("camera", 0.020, 30.0, True), ("lidar", 0.005, 10.0, True), ("encodeurs", 0.0, 200.0, False))
+
+    def lecteur(latence):
+        def lire():
+            if latence:
+                time.sleep(latence)
+            return time.monotonic()
+        return lire
+
+    def boucle(lire):
+        nb, pire, fin = 0, 0.0, time.perf_counter() + duree
+        while time.perf_counter() < fin:
+            debut = time.perf_counter()
+            lire()
+            pire = max(pire, time.perf_counter() - debut)
+            nb += 1
+        return nb / duree, pire
+
+    lecteurs = [lecteur(latence) for _, latence, _, _ in definitions]
+    frequence, pire = boucle(lambda: [lire() for lire in lecteurs])
+    print(f"  lectures synchrones  : boucle {frequence:10,.0f} Hz | itération la plus longue {pire * 1e3:7.3f} ms")
+
+    robot = RobotCollector(name="BenchCapteurs", ecartementRoues=0.5, stockageMax=5)
+    for nom, latence, frequenceCapteur, bloquant in definitions:
+        robot.add_sensor(Capteur(nom, lecteur(latence), frequenceCapteur, bloquant=bloquant))
+    noms = [nom for nom, _, _, _ in definitions]
+    robot.startSensors()
+    try:
+        frequence, pire = boucle(lambda: [robot.readSensor(nom) for nom in noms])
+        statistiques = robot.get_gestionnaire_capteurs().get_statistiques()
+    finally:
+        robot.stopSensors()
+    print(f"  cache (pool threads) : boucle {frequence:10,.0f} Hz | itération la plus longue {pire * 1e3:7.3f} ms")
+    for nom, stats in statistiques.items():
+        print(f"    {nom:<10} : {stats['frequenceMesuree']:6.1f} / {stats['frequence']:5.1f} Hz"
+              f" | ancienneté {stats['anciennete'] * 1e3:6.2f} ms | {stats['sauts']} échéances sautées")
+
+    # Enregistrement de capteurs : appartenance O(1) (dictionnaire) contre liste
+    capteurs = [f"capteur{k}" for k in range(nbCapteursListe)]
+    liste: list = []
+    debut = time.perf_counter()
+    for capteur in capteurs:
+        if capteur not in liste:
+            liste.append(capteur)
+    tempsListe = time.perf_counter() - debut
+    robot = RobotCollector(name="BenchListe", ecartementRoues=0.5, stockageMax=5)
+    debut = time.perf_counter()
+    for capteur in capteurs:
+        robot.add_sensor(capteur)
+    tempsDict = time.perf_counter() - debut
+    print(f"  add_sensor() x {nbCapteursListe:,} : liste {tempsListe * 1e3:8.2f} ms | dictionnaire {tempsDict * 1e3:6.2f} ms")
+    print()
+
+
+def bench_planification_tri(taillesCharge=(5, 20, 100), nbCharges=50, vitesseArticulaire=1.0, dureeDepot=0.5):
+    print(f"=== Bench ordre de tri : cubes/min simulés ({vitesseArticulaire} rad/s, dépôt {dureeDepot} s) ===")
+    rng = np.random.default_rng(0)
+    # 4 corbeilles de couleur (résolution exacte), puis 24 corbeilles en arc (heuristique)
+    scenarios = (("4 corbeilles", {"bleu": (0.0, 0.6), "vert": (1.0, 0.0), "rouge": (0.8, 0.8), "doute": (-0.5, 0.5)}),
+                 ("24 corbeilles", {f"c{k}": (1.2 * math.cos(a), 1.2 * math.sin(a))
+                                    for k, a in enumerate(np.linspace(-2.5, 2.5, 24).tolist())}))
+    for nomScenario, corbeilles in scenarios:
+        trieur = RobotTrieur(name="BenchPlan", nbArticulations=3, corbeilles=dict(corbeilles))
+        couleursPossibles = list(corbeilles)
+        for taille in taillesCharge:
+            debitLifo = debitPlan = planification = 0.0
+            for _ in range(nbCharges):
+                depart = rng.uniform(-1.0, 1.0, 3).tolist()
+                trieur.set_angles(depart)
+                charge = [couleursPossibles[k] for k in rng.integers(0, len(couleursPossibles), taille)]
+                cibles = [trieur._anglesCorbeille(c) for c in charge]
+                debitLifo += simulerDepots(depart, cibles, range(taille - 1, -1, -1), vitesseArticulaire, dureeDepot)[1]
+                debut = time.perf_counter()
+                ordre = trieur.planSortOrder(charge)
+                planification += time.perf_counter() - debut
+                debitPlan += simulerDepots(depart, cibles, ordre, vitesseArticulaire, dureeDepot)[1]
+            mode = trieur.get_planificateur_tri().get_dernier_mode()
+            print(f"  {nomScenario:<14} {taille:4d} cubes | LIFO {debitLifo / nbCharges:6.1f} cubes/min"
+                  f" | planifié ({mode}) {debitPlan / nbCharges:6.1f} cubes/min (x{debitPlan / debitLifo:4.2f})"
+                  f" | planification {planification / nbCharges * 1e3:7.2f} ms")
+    print()
+
+
+def bench_profilage(nbAppels=100_000):
+    print("=== Bench profilage : coût de l'instrumentation sur move() et sortNextCube() ===")
+    collector = RobotCollector(name="BenchProfil", ecartementRoues=0.5, stockageMax=5)
+    trieur = RobotTrieur(name="BenchProfilTri", nbArticulations=3,
+                         corbeilles={"bleu": (0.0, 0.6), "vert": (1.0, 0.0), "rouge": (0.8, 0.8), "doute": (-0.5, 0.5)})
+    for robot in (collector, trieur):
+        robot.set_telemetrie(DESACTIVEE)
+
+    def mesurer():
+        collector.set_battery_level(100.0)
+        debut = time.perf_counter()
+        for _ in range(nbAppels):
+            collector.move(0.001)
+            collector.set_battery_level(100.0)
+        deplacement = nbAppels / (time.perf_counter() - debut)
+        cubes = [{"id": k} for k in range(nbAppels // 10)]
+        debut = time.perf_counter()
+        while cubes:
+            trieur.sortNextCube(cubes)
+        return deplacement, nbAppels // 10 / (time.perf_counter() - debut)
+
+    reference = mesurer()
+    profileur = Profileur()
+    with profileur:
+        actif = mesurer()
+    apres = mesurer()
+    for nom, (deplacement, tri) in (("sans profilage", reference), ("profilage actif", actif),
+                                    ("après désactivation", apres)):
+        print(f"  {nom:<20} : move {deplacement:10,.0f} /s | sortNextCube {tri:9,.0f} /s")
+    move = profileur.histogramme("RobotCollector.move")
+    print(f"  RobotCollector.move mesuré : {move.get_nb():,} appels | p50 {move.quantile(0.5) / 1e3:.1f} µs"
+          f" | p99 {move.quantile(0.99) / 1e3:.1f} µs")
+
+    histogramme = HistogrammeLatence()
+    valeurs = np.random.default_rng(0).integers(100, 10_000_000, nbAppels).tolist()
+    debut = time.perf_counter()
+    for valeur in valeurs:
+        histogramme.enregistrer(valeur)
+    print(f"  HistogrammeLatence.enregistrer : {(time.perf_counter() - debut) / nbAppels * 1e9:6.0f} ns/valeur"
+          f" ({len(histogramme._compteurs):,} cases)")
+    print()
+
+
+def _acquerirFile(file, nbImages: int) -> None:
+    # Producteur de référence : chaque image est sérialisée (pickle) dans une multiprocessing.Queue
+    camera = CameraSynthetique(640, 480, cote=40, couleur="rouge", graine=1)
+    for numero in range(nbImages):
+        camera.avancer()
+        file.put((numero, time.monotonic_ns(), camera.derniereImage()[1]))
+    file.put(None)
+
+
+def bench_flux_camera(nbImages=600):
+    print("=== Bench flux caméra : anneau en mémoire partagée vs multiprocessing.Queue (640x480) ===")
+    detecteur = DetecteurCube()
+
+    # Anneau : le consommateur détecte sur la dernière image publiée, sans copie
+    with AnneauImages.creer(480, 640, nbCases=8) as anneau:
+        acquisition = multiprocessing.Process(target=acquerirSynthetique, args=(anneau.get_nom(), nbImages))
+        debut = time.perf_counter()
+        acquisition.start()
+        traitees, latences, dernier = 0, [], -1
+        while acquisition.is_alive() or dernier < anneau.get_dernier_numero():
+            numero = anneau.get_dernier_numero()
+            if numero == dernier:
+                time.sleep(0.0002)
+                continue
+            horodatage = anneau.get_horodatage(numero)
+            detecteur.detecter(anneau.lire(numero) if horodatage is not None else anneau.derniereImage()[1])
+            if horodatage is not None:
+                latences.append(time.monotonic_ns() - horodatage)
+            dernier, traitees = numero, traitees + 1
+        acquisition.join()
+        dureeAnneau = time.perf_counter() - debut
+    latencesAnneau = np.array(latences) / 1e6
+
+    # File : chaque image est copiée, sérialisée, transmise par tube puis désérialisée
+    file = multiprocessing.Queue(maxsize=8)
+    acquisition = multiprocessing.Process(target=_acquerirFile, args=(file, nbImages))
+    debut = time.perf_counter()
+    acquisition.start()
+    latences = []
+    while (element := file.get()) is not None:
+        numero, horodatage, image = element
+        detecteur.detecter(image)
+        latences.append(time.monotonic_ns() - horodatage)
+    acquisition.join()
+    dureeFile = time.perf_counter() - debut
+    latencesFile = np.array(latences) / 1e6
+
+    print(f"  anneau : {nbImages / dureeAnneau:7.0f} images/s acquises, {traitees / dureeAnneau:6.0f} traitées/s"
+          f" | latence p50 {np.median(latencesAnneau):6.2f} ms, p99 {np.percentile(latencesAnneau, 99):6.2f} ms")
+    print(f"  Queue  : {nbImages / dureeFile:7.0f} images/s acquises, {len(latences) / dureeFile:6.0f} traitées/s"
+          f" | latence p50 {np.median(latencesFile):6.2f} ms, p99 {np.percentile(latencesFile, 99):6.2f} ms")
+
+    # Coût du transport seul (sans détection) : copie dans l'anneau vs sérialisation d'une image
+    image = CameraSynthetique(640, 480).derniereImage()[1]
+    with AnneauImages.creer(480, 640) as anneau:
+        ecriture = min(timeit.repeat(lambda: anneau.ecrire(image), number=200, repeat=3)) / 200
+    serialisation = min(timeit.repeat(lambda: pickle.loads(pickle.dumps(image, protocol=pickle.HIGHEST_PROTOCOL)),
+                                      number=200, repeat=3)) / 200
+    print(f"  transport : ecrire() {ecriture * 1e6:6.0f} µs/image | pickle aller-retour {serialisation * 1e6:6.0f} µs/image")
+    print()
+
+
+def bench_journal_flotte(tailleGo=2.0, nbRobots=1000, nbAcces=10_000):
+    print(f"=== Bench journal de flotte : écriture en lot et accès direct (~{tailleGo:.0f} Go, {nbRobots} robots) ===")
+    dossier = tempfile.mkdtemp()
+    chemin = os.path.join(dossier, "mission.bin")
+    robots = [RobotCollector(name=f"J{i}", ecartementRoues=0.5, stockageMax=5) for i in range(nbRobots)]
+    for robot in robots:
+        robot.set_telemetrie(DESACTIVEE)
+    try:
+        # Chemin objet : un tick lit chaque robot (getters)
+        with JournalFlotte(os.path.join(dossier, "objets.bin"), robots[:100]) as journal:
+            duree = min(timeit.repeat(journal.enregistrer, number=200, repeat=3)) / 200
+        print(f"  enregistrer() (100 robots objets)    : {duree * 1e6:8.1f} µs/tick | {100 / duree:12,.0f} enregistrements/s")
+
+        # Chemin vectorisé : copie des colonnes d'une SimulationFlotte, jusqu'à tailleGo
+        flotte = SimulationFlotte(nbRobots)
+        flotte.set_vitesses(np.full(nbRobots, 0.5), np.linspace(-0.3, 0.3, nbRobots))
+        with JournalFlotte(chemin, robots) as journal:
+            nbTicks = int(tailleGo * 1e9) // (nbRobots * journal.get_dtype().itemsize)
+            ecriture = 0.0
+            for k in range(nbTicks):
+                flotte.step(0.01)
+                debut = time.perf_counter()
+                journal.enregistrerFlotte(flotte, 0.01 * k)
+                ecriture += time.perf_counter() - debut
+            debut = time.perf_counter()
+            journal.fermer()
+            ecriture += time.perf_counter() - debut
+        taille = os.path.getsize(chemin)
+        print(f"  enregistrerFlotte() ({nbTicks:,} ticks) : {nbTicks / ecriture:8,.0f} ticks/s | {taille / ecriture / 1e6:7.0f} Mo/s"
+              f" | fichier {taille / 1e9:.2f} Go")
+
+        # Lecture : ouverture (en-tête seul), ticks au hasard, recherche par instant, reprise
+        debut = time.perf_counter()
+        lecteur = LecteurJournal(chemin)
+        ouverture = time.perf_counter() - debut
+        hasard = np.random.default_rng(0).integers(0, lecteur.get_nb_ticks(), nbAcces).tolist()
+        debut = time.perf_counter()
+        for k in hasard:
+            float(lecteur.tick(k)["batterie"].sum())
+        tick = (time.perf_counter() - debut) / nbAcces
+        debut = time.perf_counter()
+        for k in hasard:
+            lecteur.chercherInstant(0.01 * k)
+        recherche = (time.perf_counter() - debut) / nbAcces
+        debut = time.perf_counter()
+        for k in hasard[:20]:
+            lecteur.restaurerDans(robots, k)
+        reprise = (time.perf_counter() - debut) / 20
+        debut = time.perf_counter()
+        moyenne = float(lecteur.trajectoire(nbRobots // 2)["x"].mean())
+        trajectoire = time.perf_counter() - debut
+        print(f"  ouverture {ouverture * 1e3:.2f} ms | tick au hasard {tick * 1e6:.1f} µs | chercherInstant {recherche * 1e6:.1f} µs"
+              f" | restaurerDans ({nbRobots} robots) {reprise * 1e3:.1f} ms")
+        print(f"  trajectoire complète d'un robot (colonne x, {lecteur.get_nb_ticks():,} ticks) : {trajectoire * 1e3:.0f} ms"
+              f" (x moyen {moyenne:.2f})")
+        lecteur.fermer()
+        del lecteur
+    finally:
+        for nom in os.listdir(dossier):
+            os.remove(os.path.join(dossier, nom))
+        os.rmdir(dossier)
+    print()
+
+
+def bench_calibration(nbCorbeilles=(2, 4, 8, 16, 32), nbImages=5):
+    print("=== Bench calibration de la zone de tri : temps par nombre de corbeilles (image 960x720) ===")
+    print(f"  {'corbeilles':>10} | {'1 image/corbeille':>17} | {'pipeline 1 thread':>17} | {'pipeline 4 threads':>18} | {'vérification':>12}")
+    for n in nbCorbeilles:
+        # Grille de corbeilles dans le champ de la caméra (2.4 m x 1.8 m), légèrement décalées de leur position nominale
+        grille = [(-1.0 + 0.28 * (k % 8), 0.7 - 0.35 * (k // 8)) for k in range(n)]
+        nominales = {f"c{k:02d}": pose for k, pose in enumerate(grille)}
+        reelles = {c: (x + 0.01, y - 0.008) for c, (x, y) in nominales.items()}
+        camera = CameraMarqueurs(reelles, graine=n)
+
+        # Boucle historique : une capture et une recherche dans toute l'image par corbeille
+        calibrateur = CalibrateurZone(nbThreads=1)
+        marqueurs = identifiantsMarqueurs(nominales)
+        debut = time.perf_counter()
+        for couleur in nominales:
+            image = acquerirImages(camera, 1)[0]
+            calibrateur._lireFenetre(image, 0, 0, image.shape[0], image.shape[1]).get(marqueurs[couleur])
+        boucle = time.perf_counter() - debut
+
+        durees = []
+        for nbThreads in (1, 4):
+            calibrateur = CalibrateurZone(nbImages=nbImages, nbThreads=nbThreads)
+            calibrateur.calibrer(camera, nominales)
+            durees.append(calibrateur.get_duree_derniere())
+        calibrateur.calibrer(camera, nominales)
+        verification = calibrateur.get_duree_derniere()
+        calibrateur.fermer()
+        print(f"  {n:>10} | {boucle * 1e3:14.0f} ms | {durees[0] * 1e3:14.0f} ms | {durees[1] * 1e3:15.0f} ms |"
+              f" {verification * 1e3:9.0f} ms")
+    print(f"  (pipeline : {nbImages} images fusionnées par corbeille recalibrée ; vérification : une image, aucune dérive)")
+    print()
+
+
+BENCHS = {
+    "simulation_flotte": bench_simulation_flotte,
+    "robot_compact": bench_robot_compact,
+    "navigation": bench_navigation,
+    "vision": bench_vision,
+    "classification": bench_classification,
+    "cinematique_bras": bench_cinematique_bras,
+    "ordonnanceur": bench_ordonnanceur,
+    "banque_pid": bench_banque_pid,
+    "telemetrie": bench_telemetrie,
+    "monde": bench_monde,
+    "allocation": bench_allocation,
+    "chaine_tri": bench_chaine_tri,
+    "simulation_evenements": bench_simulation_evenements,
+    "odometrie": bench_odometrie,
+    "energie": bench_energie,
+    "capteurs": bench_capteurs,
+    "planification_tri": bench_planification_tri,
+    "profilage": bench_profilage,
+    "flux_camera": bench_flux_camera,
+    "journal_flotte": bench_journal_flotte,
+    "calibration": bench_calibration,
+}
+
+
+if __name__ == "__main__":
+    for nom in sys.argv[1:] or list(BENCHS):
+        BENCHS[nom]()
@@ -0,0 +1,411 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import math
+import time
+import numpy as np
+from vision import extraireBlobs
+
+# Marqueur : grille de 6 x 6 cases, bord sombre d'une case et 16 bits de données
+# (identifiant sur 8 bits puis son complément, pour rejeter les lectures erronées)
+CASES_MARQUEUR = 6
+BITS_IDENTIFIANT = 8
+# Écart minimal (niveaux de gris) entre fond et case sombre pour chercher des marqueurs
+CONTRASTE_MIN = 50
+
+Pose = Tuple[float, float]
+
+
+def identifiantsMarqueurs(couleurs: Sequence[str]) -> Dict[str, int]:
+    """
+    Identifiant du marqueur de chaque corbeille par défaut : rang de la couleur dans l'ordre alphabétique.
+    """
+    return {couleur: i for i, couleur in enumerate(sorted(couleurs))}
+
+
+def motifMarqueur(identifiant: int) -> np.ndarray:
+    """
+    Grille (6, 6) booléenne du marqueur (True = case sombre).
+    """
+    if not 0 <= identifiant < 1 << BITS_IDENTIFIANT:
+        raise ValueError(f"Identifiant de marqueur hors de [0, {(1 << BITS_IDENTIFIANT) - 1}].")
+    mot = identifiant << BITS_IDENTIFIANT | (~identifiant & ((1 << BITS_IDENTIFIANT) - 1))
+    bits = (mot >> np.arange(2 * BITS_IDENTIFIANT - 1, -1, -1)) & 1
+    motif = np.ones((CASES_MARQUEUR, CASES_MARQUEUR), dtype=bool)
+    motif[1:-1, 1:-1] = bits.reshape(CASES_MARQUEUR - 2, CASES_MARQUEUR - 2).astype(bool)
+    return motif
+
+
+def lireMarqueur(gris: np.ndarray, boite: Tuple[int, int, int, int]) -> Optional[int]:
+    """
+    Décode le marqueur occupant boite (l0, c0, l1, c1) d'une image en niveaux de gris :
+    moyenne du centre de chaque case, seuil à mi-chemin entre cases claires et sombres.
+    Retourne l'identifiant, ou None si le bord n'est pas sombre ou si le complément ne correspond pas.
+    """
+    l0, c0, l1, c1 = boite
+    pasL, pasC = (l1 - l0) / CASES_MARQUEUR, (c1 - c0) / CASES_MARQUEUR
+    centresL = (l0 + (np.arange(CASES_MARQUEUR) + 0.5) * pasL).astype(int)
+    centresC = (c0 + (np.arange(CASES_MARQUEUR) + 0.5) * pasC).astype(int)
+    rayon = max(int(min(pasL, pasC) / 4), 0)
+    valeurs = np.zeros((CASES_MARQUEUR, CASES_MARQUEUR))
+    for dl in range(-rayon, rayon + 1):
+        for dc in range(-rayon, rayon + 1):
+            valeurs += gris[np.ix_(centresL + dl, centresC + dc)]
+    sombres = valeurs < (valeurs.min() + valeurs.max()) / 2
+    if not (sombres[0].all() and sombres[-1].all() and sombres[:, 0].all() and sombres[:, -1].all()):
+        return None
+    mot = int(np.dot(sombres[1:-1, 1:-1].ravel(), 1 << np.arange(2 * BITS_IDENTIFIANT - 1, -1, -1)))
+    identifiant = mot >> BITS_IDENTIFIANT
+    if mot & ((1 << BITS_IDENTIFIANT) - 1) != ~identifiant & ((1 << BITS_IDENTIFIANT) - 1):
+        return None
+    return identifiant
+
+
+def acquerirImages(source, nbImages: int, delai: float = 1.0) -> List[np.ndarray]:
+    """
+    Copie de nbImages acquisitions distinctes (numéros différents) de source.derniereImage(),
+    en attendant au plus delai secondes ; au moins une image est toujours rendue.
+    """
+    numero, image = source.derniereImage()
+    images, dernier = [image.copy()], numero
+    limite = time.monotonic() + delai
+    while len(images) < nbImages and time.monotonic() < limite:
+        numero, image = source.derniereImage()
+        if numero == dernier:
+            time.sleep(0.001)
+            continue
+        images.append(image.copy())
+        dernier = numero
+    return images
+
+
+class FiltrePose:
+    """
+    Fusion récursive des observations de la position d'une corbeille (filtre de Kalman
+    pour un point fixe, variance isotrope). Une observation à plus de seuilRejet écarts-types
+    (variance de l'estimation + variance de la mesure) est rejetée comme aberrante.
+    """
+
+    def __init__(self, x: float, y: float, variance: float, seuilRejet: float = 4.0):
+        self._x: float = x
+        self._y: float = y
+        self._variance: float = variance
+        self._seuilRejet: float = seuilRejet
+        self._nbMesures: int = 0
+        self._nbRejets: int = 0
+
+    def get_pose(self) -> Pose:
+        return (self._x, self._y)
+
+    def get_ecart_type(self) -> float:
+        return math.sqrt(self._variance)
+
+    def get_nb_mesures(self) -> int:
+        return self._nbMesures
+
+    def get_nb_rejets(self) -> int:
+        return self._nbRejets
+
+    def mettreAJour(self, x: float, y: float, varianceMesure: float) -> bool:
+        """
+        Intègre l'observation (x, y). Retourne False si elle est rejetée.
+        """
+        innovation = self._variance + varianceMesure
+        if ((x - self._x) ** 2 + (y - self._y) ** 2) / innovation > 2 * self._seuilRejet ** 2:
+            self._nbRejets += 1
+            return False
+        gain = self._variance / innovation
+        self._x += gain * (x - self._x)
+        self._y += gain * (y - self._y)
+        self._variance *= 1.0 - gain
+        self._nbMesures += 1
+        return True
+
+    @classmethod
+    def fusionner(cls, observations: Sequence[Pose], varianceMesure: float,
+                  seuilRejet: float = 4.0) -> "FiltrePose":
+        """
+        Filtre initialisé à la médiane des observations (robuste à une lecture aberrante),
+        avec une incertitude de départ large, puis mis à jour par chacune d'elles.
+        """
+        mediane = np.median(np.asarray(observations, dtype=float), axis=0)
+        filtre = cls(float(mediane[0]), float(mediane[1]), 100.0 * varianceMesure, seuilRejet)
+        for x, y in observations:
+            filtre.mettreAJour(x, y, varianceMesure)
+        return filtre
+
+
+class CachePoses:
+    """
+    Positions calibrées des corbeilles. Une mesure à moins de seuilDerive (m) de la position
+    en cache la confirme : la corbeille n'est pas recalibrée.
+    """
+
+    def __init__(self, seuilDerive: float = 0.01):
+        if seuilDerive <= 0:
+            raise ValueError("Le seuil de dérive doit être positif.")
+        self._seuilDerive: float = seuilDerive
+        self._poses: Dict[str, Tuple[float, float, float]] = {}
+
+    def __contains__(self, couleur: str) -> bool:
+        return couleur in self._poses
+
+    def get_seuil_derive(self) -> float:
+        return self._seuilDerive
+
+    def get(self, couleur: str) -> Optional[Tuple[float, float, float]]:
+        """
+        (x, y, écart-type) de la corbeille, ou None si elle n'a jamais été calibrée.
+        """
+        return self._poses.get(couleur)
+
+    def enregistrer(self, couleur: str, x: float, y: float, ecartType: float) -> None:
+        self._poses[couleur] = (x, y, ecartType)
+
+    def derive(self, couleur: str, x: float, y: float) -> float:
+        """
+        Distance (m) entre la mesure et la position en cache ; math.inf sans position en cache.
+        """
+        pose = self._poses.get(couleur)
+        return math.inf if pose is None else math.hypot(x - pose[0], y - pose[1])
+
+    def estAJour(self, couleur: str, x: float, y: float) -> bool:
+        return self.derive(couleur, x, y) <= self._seuilDerive
+
+    def invalider(self, couleur: Optional[str] = None) -> None:
+        if couleur is None:
+            self._poses.clear()
+        else:
+            self._poses.pop(couleur, None)
+
+
+class CalibrateurZone:
+    """
+    Calibration de la zone de tri par marqueurs (un marqueur 6 x 6 devant chaque corbeille),
+    vus par une caméra fixe au-dessus de la zone : echelle pixels par mètre, origine = pixel
+    (ligne, colonne) de l'origine du repère du bras (centre de l'image par défaut), y vers le haut.
+    - Une première image suffit à vérifier toutes les corbeilles : chaque marqueur est cherché
+      dans une fenêtre autour de sa position attendue, une tâche par (image, corbeille) sur un
+      pool de threads ; un marqueur hors de sa fenêtre est cherché dans toute l'image.
+    - Seules les corbeilles dont la mesure s'écarte du cache de plus de seuilDerive sont
+      recalibrées, par fusion (FiltrePose) des observations de nbImages images.
+    """
+
+    def __init__(self, marqueurs: Optional[Dict[str, int]] = None, echelle: float = 400.0,
+                 origine: Optional[Tuple[float, float]] = None, coteMarqueur: float = 0.09,
+                 rayonRecherche: float = 0.15, seuilDerive: float = 0.01, nbImages: int = 5,
+                 ecartMesure: float = 0.002, nbThreads: int = 4):
+        if echelle <= 0 or coteMarqueur <= 0 or nbImages < 1 or nbThreads < 1:
+            raise ValueError("Paramètres de calibration invalides.")
+        self._marqueurs: Optional[Dict[str, int]] = marqueurs
+        self._echelle: float = echelle
+        self._origine: Optional[Tuple[float, float]] = origine
+        self._cotePixels: float = coteMarqueur * echelle
+        self._rayonRecherche: float = rayonRecherche
+        self._nbImages: int = nbImages
+        self._varianceMesure: float = ecartMesure ** 2
+        self._nbThreads: int = nbThreads
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._cache: CachePoses = CachePoses(seuilDerive)
+        self._nbVerifications: int = 0
+        self._nbRecalibrations: int = 0
+        self._nonVues: List[str] = []
+        self._dureeDerniere: float = 0.0
+
+    # ---------- Getters ----------
+
+    def get_cache(self) -> CachePoses:
+        return self._cache
+
+    def get_nb_verifications(self) -> int:
+        return self._nbVerifications
+
+    def get_nb_recalibrations(self) -> int:
+        return self._nbRecalibrations
+
+    def get_non_vues(self) -> List[str]:
+        """
+        Corbeilles dont le marqueur n'a été vu dans aucune image lors du dernier calibrer().
+        """
+        return list(self._nonVues)
+
+    def get_duree_derniere(self) -> float:
+        return self._dureeDerniere
+
+    # ---------- Repères ----------
+
+    def _origineImage(self, forme: Tuple[int, ...]) -> Tuple[float, float]:
+        if self._origine is not None:
+            return self._origine
+        return ((forme[0] - 1) / 2, (forme[1] - 1) / 2)
+
+    def pixelVersZone(self, ligne: float, colonne: float, forme: Tuple[int, ...]) -> Pose:
+        origineL, origineC = self._origineImage(forme)
+        return ((colonne - origineC) / self._echelle, (origineL - ligne) / self._echelle)
+
+    def zoneVersPixel(self, x: float, y: float, forme: Tuple[int, ...]) -> Tuple[float, float]:
+        origineL, origineC = self._origineImage(forme)
+        return (origineL - y * self._echelle, origineC + x * self._echelle)
+
+    # ---------- Détection ----------
+
+    def _candidats(self, gris: np.ndarray) -> List[Tuple[int, int, int, int]]:
+        # Boîtes des composantes sombres ayant la taille d'un marqueur (à 30 % près), presque carrées.
+        # Seuil à mi-chemin entre le plus sombre et le fond (médiane) ; sans contraste, pas de marqueur
+        sombre, fond = float(gris.min()), float(np.median(gris))
+        if fond - sombre < CONTRASTE_MIN:
+            return []
+        masque = gris < (sombre + fond) / 2
+        boites = []
+        for blob in extraireBlobs(masque, "marqueur", int(self._cotePixels ** 2 / 4)):
+            l0, c0, l1, c1 = blob.boite
+            hauteur, largeur = l1 - l0, c1 - c0
+            if abs(hauteur - largeur) <= max(2, 0.15 * hauteur) and abs(hauteur - self._cotePixels) <= 0.3 * self._cotePixels:
+                boites.append(blob.boite)
+        return boites
+
+    def _lireFenetre(self, image: np.ndarray, l0: int, c0: int, l1: int, c1: int) -> Dict[int, Pose]:
+        # Marqueurs décodés dans image[l0:l1, c0:c1] : identifiant → centre (repère du bras)
+        gris = image[l0:l1, c0:c1]
+        if gris.ndim == 3:
+            gris = gris.mean(axis=2)
+        trouves = {}
+        for boite in self._candidats(gris):
+            identifiant = lireMarqueur(gris, boite)
+            if identifiant is not None:
+                bl0, bc0, bl1, bc1 = boite
+                trouves[identifiant] = self.pixelVersZone(l0 + (bl0 + bl1 - 1) / 2, c0 + (bc0 + bc1 - 1) / 2,
+                                                          image.shape)
+        return trouves
+
+    def _detecterCorbeille(self, image: np.ndarray, identifiant: int, attendue: Pose) -> Optional[Pose]:
+        # Tâche du pool : recherche d'un marqueur dans la fenêtre autour de sa position attendue
+        ligne, colonne = self.zoneVersPixel(*attendue, image.shape)
+        rayon = self._rayonRecherche * self._echelle + self._cotePixels
+        l0, c0 = max(int(ligne - rayon), 0), max(int(colonne - rayon), 0)
+        l1, c1 = min(int(ligne + rayon) + 1, image.shape[0]), min(int(colonne + rayon) + 1, image.shape[1])
+        if l1 - l0 < self._cotePixels or c1 - c0 < self._cotePixels:
+            return None
+        return self._lireFenetre(image, l0, c0, l1, c1).get(identifiant)
+
+    def _executer(self, fonction, *arguments) -> List:
+        if self._nbThreads == 1:
+            return list(map(fonction, *arguments))
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self._nbThreads, thread_name_prefix="calibration")
+        return list(self._pool.map(fonction, *arguments))
+
+    def detecter(self, images: Sequence[np.ndarray], attendues: Dict[str, Pose],
+                 marqueurs: Optional[Dict[str, int]] = None) -> Dict[str, List[Pose]]:
+        """
+        Observations (repère du bras) du marqueur de chaque corbeille de attendues dans chaque image.
+        """
+        marqueurs = marqueurs or self._marqueurs or identifiantsMarqueurs(attendues)
+        couleurs = [c for c in attendues if c in marqueurs]
+        taches = [(image, couleur) for image in images for couleur in couleurs]
+        resultats = self._executer(lambda tache: self._detecterCorbeille(tache[0], marqueurs[tache[1]],
+                                                                         attendues[tache[1]]), taches)
+        observations: Dict[str, List[Pose]] = {couleur: [] for couleur in couleurs}
+        manquantes: Dict[int, List[str]] = {}
+        for (image, couleur), pose in zip(taches, resultats):
+            if pose is not None:
+                observations[couleur].append(pose)
+            else:
+                manquantes.setdefault(id(image), []).append(couleur)
+        # Marqueurs hors de leur fenêtre (corbeille déplacée) : une recherche dans l'image entière
+        for image in images:
+            if id(image) in manquantes:
+                trouves = self._lireFenetre(image, 0, 0, image.shape[0], image.shape[1])
+                for couleur in manquantes[id(image)]:
+                    if marqueurs[couleur] in trouves:
+                        observations[couleur].append(trouves[marqueurs[couleur]])
+        return observations
+
+    # ---------- Calibration ----------
+
+    def calibrer(self, source, corbeilles: Dict[str, Pose]) -> Dict[str, Pose]:
+        """
+        Vérifie toutes les corbeilles sur une image de source (objet exposant derniereImage())
+        et recalibre celles qui ont dérivé (ou jamais calibrées) sur nbImages images.
+        Retourne les nouvelles positions des seules corbeilles recalibrées.
+        """
+        debut = time.perf_counter()
+        marqueurs = self._marqueurs or identifiantsMarqueurs(corbeilles)
+        attendues = {}
+        for couleur, coords in corbeilles.items():
+            pose = self._cache.get(couleur)
+            attendues[couleur] = tuple(coords) if pose is None else pose[:2]
+        images = acquerirImages(source, 1)
+        observations = self.detecter(images, attendues, marqueurs)
+        self._nbVerifications += len(corbeilles)
+        aCalibrer = [c for c in corbeilles
+                     if not (observations.get(c) and self._cache.estAJour(c, *observations[c][0]))]
+        nouvelles: Dict[str, Pose] = {}
+        self._nonVues = []
+        if aCalibrer:
+            supplement = self.detecter(acquerirImages(source, self._nbImages)[1:],
+                                       {c: observations[c][0] if observations.get(c) else attendues[c]
+                                        for c in aCalibrer}, marqueurs) if self._nbImages > 1 else {}
+            for couleur in aCalibrer:
+                mesures = observations.get(couleur, []) + supplement.get(couleur, [])
+                if not mesures:
+                    self._nonVues.append(couleur)
+                    continue
+                filtre = FiltrePose.fusionner(mesures, self._varianceMesure)
+                self._cache.enregistrer(couleur, *filtre.get_pose(), filtre.get_ecart_type())
+                nouvelles[couleur] = filtre.get_pose()
+                self._nbRecalibrations += 1
+        self._dureeDerniere = time.perf_counter() - debut
+        return nouvelles
+
+    def fermer(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+
+class CameraMarqueurs:
+    """
+    Caméra de test au-dessus de la zone de tri : fond clair bruité, un marqueur par corbeille
+    à sa position réelle (même repère et même échelle que CalibrateurZone).
+    Caméra en acquisition continue : chaque appel à derniereImage() rend une nouvelle image,
+    dont chaque marqueur tremble de ecartPixels (bruit de mesure).
+    """
+
+    def __init__(self, corbeilles: Dict[str, Pose], marqueurs: Optional[Dict[str, int]] = None,
+                 largeur: int = 960, hauteur: int = 720, echelle: float = 400.0,
+                 coteMarqueur: float = 0.09, ecartPixels: float = 0.7, graine: int = 0):
+        self._positions: Dict[str, Pose] = dict(corbeilles)
+        self._marqueurs: Dict[str, int] = marqueurs or identifiantsMarqueurs(corbeilles)
+        self._forme: Tuple[int, int] = (hauteur, largeur)
+        self._echelle: float = echelle
+        self._cote: int = CASES_MARQUEUR * max(int(round(coteMarqueur * echelle / CASES_MARQUEUR)), 1)
+        self._ecartPixels: float = ecartPixels
+        self._rng = np.random.default_rng(graine)
+        self._fond: np.ndarray = self._rng.integers(170, 230, (hauteur, largeur), dtype=np.uint8)
+        self._numero: int = -1
+
+    def deplacer(self, couleur: str, x: float, y: float) -> None:
+        self._positions[couleur] = (x, y)
+
+    def get_positions(self) -> Dict[str, Pose]:
+        return dict(self._positions)
+
+    def derniereImage(self) -> Tuple[int, np.ndarray]:
+        self._numero += 1
+        return self._numero, self._dessiner()
+
+    def _dessiner(self) -> np.ndarray:
+        gris = self._fond.copy()
+        hauteur, largeur = self._forme
+        taille = self._cote // CASES_MARQUEUR
+        for couleur, (x, y) in self._positions.items():
+            dl, dc = self._rng.normal(0.0, self._ecartPixels, 2)
+            ligne = (hauteur - 1) / 2 - y * self._echelle + dl
+            colonne = (largeur - 1) / 2 + x * self._echelle + dc
+            l0, c0 = int(round(ligne - (self._cote - 1) / 2)), int(round(colonne - (self._cote - 1) / 2))
+            if l0 < 0 or c0 < 0 or l0 + self._cote > hauteur or c0 + self._cote > largeur:
+                continue
+            motif = np.kron(motifMarqueur(self._marqueurs[couleur]), np.ones((taille, taille), dtype=bool))
+            zone = gris[l0:l0 + self._cote, c0:c0 + self._cote]
+            zone[motif] = 40
+        return np.repeat(gris[:, :, None], 3, axis=2)
@@ -0,0 +1,300 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import heapq
+import math
+import threading
+import time
+
+# Noms de capteurs lus par les robots (move(), detectCube(), classifyCube())
+CAPTEUR_CAMERA = "camera"           # valeur : (numéro, image), comme derniereImage()
+CAPTEUR_ENCODEURS = "encodeurs"     # valeur : (vitesse roue gauche, vitesse roue droite) en m/s
+CAPTEUR_CAMERA_TRI = "camera_tri"   # valeur : image recadrée du cube présenté au trieur
+
+# Lecture horodatée : (instant de fin de lecture, valeur)
+Lecture = Tuple[float, Any]
+
+
+class Capteur:
+    """
+    Capteur échantillonné à sa propre fréquence (Hz) par un GestionnaireCapteurs.
+    - lire : fonction de lecture, éventuellement bloquante (E/S) ; un capteur bloquant est lu
+      sur le pool de threads, un capteur non bloquant directement par l'ordonnanceur.
+    - La dernière lecture et un court historique sont des tuples immuables remplacés en une
+      seule affectation : les lecteurs (boucle de contrôle) n'attendent jamais de verrou.
+    Une seule lecture est en cours à la fois : une échéance atteinte pendant une lecture
+    encore en cours est sautée (comptée dans get_nb_sauts()).
+    """
+
+    def __init__(self, nom: str, lire: Callable[[], Any], frequence: float, bloquant: bool = True,
+                 tailleHistorique: int = 16, horloge: Callable[[], float] = time.monotonic):
+        if not nom:
+            raise ValueError("Le nom du capteur ne peut pas être vide.")
+        if frequence <= 0 or tailleHistorique < 2:
+            raise ValueError("La fréquence doit être positive et l'historique contenir au moins 2 lectures.")
+        self._nom: str = nom
+        self._lire: Callable[[], Any] = lire
+        self._frequence: float = frequence
+        self._bloquant: bool = bloquant
+        self._tailleHistorique: int = tailleHistorique
+        self._horloge: Callable[[], float] = horloge
+        self._derniere: Optional[Lecture] = None
+        self._historique: Tuple[Lecture, ...] = ()
+        self._enCours: bool = False
+        self._jeton: int = -1          # Numéro de la seule échéance valide dans l'échéancier
+        self._nbLectures: int = 0
+        self._nbErreurs: int = 0
+        self._nbSauts: int = 0
+        self._derniereErreur: Optional[BaseException] = None
+
+    def __str__(self) -> str:
+        return self._nom
+
+    # ---------- Getters / Setters ----------
+
+    def get_nom(self) -> str:
+        return self._nom
+
+    def get_frequence(self) -> float:
+        return self._frequence
+
+    def set_frequence(self, frequence: float) -> None:
+        if frequence <= 0:
+            raise ValueError("La fréquence doit être positive.")
+        self._frequence = frequence
+
+    def get_periode(self) -> float:
+        return 1.0 / self._frequence
+
+    def est_bloquant(self) -> bool:
+        return self._bloquant
+
+    def get_nb_lectures(self) -> int:
+        return self._nbLectures
+
+    def get_nb_erreurs(self) -> int:
+        return self._nbErreurs
+
+    def get_nb_sauts(self) -> int:
+        return self._nbSauts
+
+    def get_derniere_erreur(self) -> Optional[BaseException]:
+        return self._derniereErreur
+
+    # ---------- Cache ----------
+
+    def derniere(self) -> Optional[Lecture]:
+        """
+        Dernière lecture (instant, valeur), ou None ; sans verrou ni attente.
+        """
+        return self._derniere
+
+    def valeur(self, ageMax: Optional[float] = None) -> Any:
+        """
+        Dernière valeur lue, ou None si aucune lecture ou si elle date de plus de ageMax secondes.
+        """
+        lecture = self._derniere
+        if lecture is None or (ageMax is not None and self._horloge() - lecture[0] > ageMax):
+            return None
+        return lecture[1]
+
+    def historique(self) -> List[Lecture]:
+        """
+        Dernières lectures, de la plus ancienne à la plus récente.
+        """
+        return list(self._historique)
+
+    def get_frequence_mesuree(self) -> float:
+        """
+        Fréquence effectivement atteinte sur l'historique (Hz) ; 0 avant deux lectures.
+        """
+        historique = self._historique
+        if len(historique) < 2 or historique[-1][0] <= historique[0][0]:
+            return 0.0
+        return (len(historique) - 1) / (historique[-1][0] - historique[0][0])
+
+    def get_anciennete(self) -> float:
+        """
+        Âge de la dernière lecture (s) ; math.inf si le capteur n'a jamais été lu.
+        """
+        lecture = self._derniere
+        return math.inf if lecture is None else self._horloge() - lecture[0]
+
+    # ---------- Lecture ----------
+
+    def echantillonner(self) -> Optional[Lecture]:
+        """
+        Lit le capteur et met le cache à jour. Une exception de lecture est comptée et
+        conservée (get_derniere_erreur()) ; le cache garde alors la lecture précédente.
+        """
+        try:
+            valeur = self._lire()
+        except Exception as erreur:
+            self._nbErreurs += 1
+            self._derniereErreur = erreur
+            self._enCours = False
+            return None
+        lecture = (self._horloge(), valeur)
+        self._historique = self._historique[1 - self._tailleHistorique:] + (lecture,)
+        self._derniere = lecture
+        self._nbLectures += 1
+        # Libéré après la mise à jour du cache : un seul écrivain par capteur
+        self._enCours = False
+        return lecture
+
+
+class GestionnaireCapteurs:
+    """
+    Échantillonnage multi-fréquence des capteurs d'un robot.
+    Un thread ordonnanceur tient un échéancier (heapq) des prochaines lectures ; les capteurs
+    bloquants sont lus sur un pool de threads, les autres directement. La boucle de contrôle
+    ne fait que lire les caches (valeur(), derniere()) : elle n'attend jamais une E/S.
+    Sans threads (demarrer() non appelé), interroger() lit les capteurs échus dans le thread
+    appelant.
+    """
+
+    def __init__(self, nbThreads: int = 4, horloge: Callable[[], float] = time.monotonic):
+        if nbThreads <= 0:
+            raise ValueError("Il faut au moins un thread de lecture.")
+        self._nbThreads: int = nbThreads
+        self._horloge: Callable[[], float] = horloge
+        self._capteurs: Dict[str, Capteur] = {}
+        # Échéancier : (instant, numéro d'ordre, capteur)
+        self._echeancier: List[Tuple[float, int, Capteur]] = []
+        self._sequence: int = 0
+        self._condition: threading.Condition = threading.Condition()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._actif: bool = False
+
+    # ---------- Capteurs ----------
+
+    def __contains__(self, nom: str) -> bool:
+        return nom in self._capteurs
+
+    def __len__(self) -> int:
+        return len(self._capteurs)
+
+    def get_capteur(self, nom: str) -> Optional[Capteur]:
+        return self._capteurs.get(nom)
+
+    def get_capteurs(self) -> List[Capteur]:
+        return list(self._capteurs.values())
+
+    def ajouter(self, capteur: Capteur) -> None:
+        """
+        Enregistre un capteur (remplace un capteur de même nom) ; sa première lecture est immédiate.
+        """
+        with self._condition:
+            self._capteurs[capteur.get_nom()] = capteur
+            self._planifier(self._horloge(), capteur)
+            self._condition.notify()
+
+    def retirer(self, nom: str) -> Optional[Capteur]:
+        # L'échéance restante est ignorée à son tour (capteur absent du dictionnaire ou réenregistré)
+        with self._condition:
+            return self._capteurs.pop(nom, None)
+
+    def _planifier(self, instant: float, capteur: Capteur) -> None:
+        heapq.heappush(self._echeancier, (instant, self._sequence, capteur))
+        capteur._jeton = self._sequence
+        self._sequence += 1
+
+    # ---------- Cache ----------
+
+    def valeur(self, nom: str, ageMax: Optional[float] = None) -> Any:
+        """
+        Dernière valeur du capteur nom (None si absent, jamais lu ou plus vieux que ageMax).
+        """
+        capteur = self._capteurs.get(nom)
+        return None if capteur is None else capteur.valeur(ageMax)
+
+    def derniere(self, nom: str) -> Optional[Lecture]:
+        capteur = self._capteurs.get(nom)
+        return None if capteur is None else capteur.derniere()
+
+    def get_statistiques(self) -> Dict[str, Dict[str, float]]:
+        """
+        Par capteur : fréquence demandée et atteinte (Hz), ancienneté de la dernière lecture (s),
+        nombres de lectures, d'erreurs et d'échéances sautées.
+        """
+        return {nom: {"frequence": capteur.get_frequence(),
+                      "frequenceMesuree": capteur.get_frequence_mesuree(),
+                      "anciennete": capteur.get_anciennete(),
+                      "lectures": capteur.get_nb_lectures(),
+                      "erreurs": capteur.get_nb_erreurs(),
+                      "sauts": capteur.get_nb_sauts()}
+                for nom, capteur in list(self._capteurs.items())}
+
+    # ---------- Échantillonnage ----------
+
+    def _echus(self, maintenant: float) -> List[Capteur]:
+        # Dépile les échéances atteintes et replanifie chaque capteur (sans rattrapage en rafale)
+        echus = []
+        while self._echeancier and self._echeancier[0][0] <= maintenant:
+            instant, sequence, capteur = heapq.heappop(self._echeancier)
+            if self._capteurs.get(capteur.get_nom()) is not capteur or capteur._jeton != sequence:
+                continue
+            suivant = instant + capteur.get_periode()
+            self._planifier(suivant if suivant > maintenant else maintenant + capteur.get_periode(), capteur)
+            if capteur._enCours:
+                capteur._nbSauts += 1
+            else:
+                capteur._enCours = True
+                echus.append(capteur)
+        return echus
+
+    def interroger(self) -> int:
+        """
+        Lit dans le thread appelant tous les capteurs dont l'échéance est atteinte. Retourne leur nombre.
+        """
+        with self._condition:
+            echus = self._echus(self._horloge())
+        for capteur in echus:
+            capteur.echantillonner()
+        return len(echus)
+
+    def demarrer(self) -> None:
+        if self._thread is not None:
+            return
+        self._actif = True
+        self._pool = ThreadPoolExecutor(max_workers=self._nbThreads, thread_name_prefix="capteur")
+        self._thread = threading.Thread(target=self._boucle, name="ordonnanceur-capteurs", daemon=True)
+        self._thread.start()
+
+    def arreter(self) -> None:
+        """
+        Arrête l'ordonnanceur et attend la fin des lectures en cours.
+        """
+        if self._thread is None:
+            return
+        with self._condition:
+            self._actif = False
+            self._condition.notify()
+        self._thread.join()
+        self._pool.shutdown(wait=True)
+        self._thread = None
+        self._pool = None
+
+    def __enter__(self) -> "GestionnaireCapteurs":
+        self.demarrer()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.arreter()
+
+    def _boucle(self) -> None:
+        while True:
+            with self._condition:
+                if not self._actif:
+                    return
+                maintenant = self._horloge()
+                echus = self._echus(maintenant)
+                if not echus:
+                    attente = self._echeancier[0][0] - maintenant if self._echeancier else None
+                    self._condition.wait(attente)
+                    continue
+            for capteur in echus:
+                if capteur.est_bloquant():
+                    self._pool.submit(capteur.echantillonner)
+                else:
+                    capteur.echantillonner()
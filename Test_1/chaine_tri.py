@@ -0,0 +1,286 @@
+from typing import Any, Callable, List, Optional
+import queue
+import threading
+import time
+from robot_trieur import RobotTrieur
+
+# Marqueur de fin de flux (un par trieur, placé après le dernier cube)
+_FIN = object()
+
+
+class StatistiquesChaine:
+    """
+    Compteurs de la chaîne collecte → tri (durées en secondes).
+    - profondeur : nombre de cubes en file au moment de chaque dépôt ;
+    - attenteProducteur : temps passé bloqué par la contre-pression (file pleine) ;
+    - attenteTrieurs : temps passé par les trieurs à attendre un cube (file vide) ;
+    - sejour : du dépôt d'un cube (attente de place comprise) à sa prise par un trieur ;
+    - latence : du dépôt par le collecteur au lâcher dans la corbeille.
+    """
+
+    def __init__(self):
+        self.nbEntres: int = 0
+        self.nbTries: int = 0
+        self.profondeurMax: int = 0
+        self.profondeurTotale: int = 0
+        self.attenteProducteurTotale: float = 0.0
+        self.attenteProducteurMax: float = 0.0
+        self.attenteTrieursTotale: float = 0.0
+        self.sejourTotal: float = 0.0
+        self.sejourMax: float = 0.0
+        self.latenceTotale: float = 0.0
+        self.latenceMax: float = 0.0
+        self.tPremier: Optional[float] = None
+        self.tDernier: Optional[float] = None
+
+    def get_profondeur_moyenne(self) -> float:
+        return self.profondeurTotale / self.nbEntres if self.nbEntres else 0.0
+
+    def get_sejour_moyen(self) -> float:
+        return self.sejourTotal / self.nbTries if self.nbTries else 0.0
+
+    def get_latence_moyenne(self) -> float:
+        return self.latenceTotale / self.nbTries if self.nbTries else 0.0
+
+    def get_cubes_par_minute(self) -> float:
+        """
+        Débit de bout en bout : cubes triés par minute, du premier dépôt au dernier lâcher.
+        """
+        if not self.nbTries or self.tDernier is None or self.tDernier <= self.tPremier:
+            return 0.0
+        return 60.0 * self.nbTries / (self.tDernier - self.tPremier)
+
+    def __repr__(self) -> str:
+        return (f"{self.nbTries}/{self.nbEntres} cubes triés | {self.get_cubes_par_minute():.1f} cubes/min"
+                f" | file moy {self.get_profondeur_moyenne():.2f} max {self.profondeurMax}"
+                f" | séjour moy {self.get_sejour_moyen() * 1e3:.2f} ms"
+                f" | latence moy {self.get_latence_moyenne() * 1e3:.2f} ms max {self.latenceMax * 1e3:.2f} ms"
+                f" | blocage collecteurs {self.attenteProducteurTotale * 1e3:.2f} ms")
+
+
+class _Element:
+    __slots__ = ("cube", "tDepot", "tPrise", "couleur")
+
+    def __init__(self, cube: Any, tDepot: float):
+        self.cube = cube
+        self.tDepot = tDepot
+        self.tPrise = 0.0
+        self.couleur = "doute"
+
+
+class ChaineTri:
+    """
+    Étage producteur/consommateur entre collecteurs et trieurs.
+    - Les collecteurs déposent leurs cubes dans une file bornée partagée (deposer()) ; si elle est
+      pleine, ils attendent (contre-pression) au lieu d'accumuler sans limite.
+    - Chaque trieur tourne sur deux threads reliés par une petite file : l'un prend les cubes
+      et les classifie par lots (classifyBatch()), l'autre déplace le bras et lâche le cube.
+      La classification du cube suivant se fait donc pendant le mouvement du bras, et plusieurs
+      trieurs vident la file en parallèle.
+    get_statistiques() donne profondeur de file, attentes et débit pour dimensionner le
+    rapport trieurs / collecteurs.
+    Si un trieur lève une exception, la chaîne passe en échec : les trieurs vident la file sans
+    trier (aucun collecteur ne reste bloqué) et deposer() / fermer() lèvent RuntimeError.
+    """
+
+    def __init__(self, trieurs: List[RobotTrieur], capacite: int = 8, tailleLot: int = 4,
+                 horloge: Callable[[], float] = time.perf_counter):
+        if not trieurs:
+            raise ValueError("Il faut au moins un trieur.")
+        if capacite <= 0 or tailleLot <= 0:
+            raise ValueError("La capacité et la taille de lot doivent être positives.")
+        self._trieurs: List[RobotTrieur] = list(trieurs)
+        self._file: queue.Queue = queue.Queue(maxsize=capacite)
+        self._tailleLot: int = tailleLot
+        self._horloge: Callable[[], float] = horloge
+        self._stats: StatistiquesChaine = StatistiquesChaine()
+        self._verrou: threading.Lock = threading.Lock()
+        # Dépôts en cours : fermer() attend qu'ils soient dans la file avant les marqueurs de fin
+        self._depotsEnCours: int = 0
+        self._depotsTermines: threading.Condition = threading.Condition(self._verrou)
+        self._threads: List[threading.Thread] = []
+        self._ferme: bool = False
+        self._finPostee: bool = False      # Marqueurs de fin placés dans la file
+        self._erreur: Optional[BaseException] = None
+
+    # ---------- Getters ----------
+
+    def get_capacite(self) -> int:
+        return self._file.maxsize
+
+    def get_profondeur(self) -> int:
+        return self._file.qsize()
+
+    def get_nb_trieurs(self) -> int:
+        return len(self._trieurs)
+
+    def get_statistiques(self) -> StatistiquesChaine:
+        return self._stats
+
+    def get_erreur(self) -> Optional[BaseException]:
+        return self._erreur
+
+    # ---------- Cycle de vie ----------
+
+    def demarrer(self) -> None:
+        if self._threads:
+            return
+        for trieur in self._trieurs:
+            # File interne : un lot d'avance au plus entre classification et bras
+            fileBras: queue.Queue = queue.Queue(maxsize=self._tailleLot)
+            for cible, nom in ((self._boucleClassification, "classif"), (self._boucleBras, "bras")):
+                thread = threading.Thread(target=cible, args=(trieur, fileBras),
+                                          name=f"{nom}-{trieur.get_name()}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def fermer(self, timeout: Optional[float] = None) -> bool:
+        """
+        N'accepte plus de cube, laisse les trieurs vider la file puis attend la fin des threads.
+        Les dépôts déjà commencés sont placés avant les marqueurs de fin : si l'un d'eux n'est pas
+        terminé après timeout secondes, la chaîne reste fermée aux nouveaux cubes mais les trieurs
+        continuent, et fermer() retourne False (à rappeler plus tard). Lève RuntimeError si un
+        trieur a échoué.
+        """
+        with self._verrou:
+            if self._finPostee:
+                return True
+            self._ferme = True
+            if not self._depotsTermines.wait_for(lambda: self._depotsEnCours == 0, timeout):
+                return False
+            self._finPostee = True
+        for _ in self._trieurs:
+            self._file.put(_FIN)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        self._verifier()
+        return True
+
+    def __enter__(self) -> "ChaineTri":
+        self.demarrer()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fermer()
+
+    # ---------- Côté collecteurs ----------
+
+    def deposer(self, cube: Any, timeout: Optional[float] = None) -> bool:
+        """
+        Place un cube dans la file ; bloque tant qu'elle est pleine (au plus timeout secondes).
+        Retourne False si le délai expire ou si la chaîne est fermée ; lève RuntimeError si un
+        trieur a échoué.
+        """
+        self._verifier()
+        with self._verrou:
+            if self._ferme:
+                return False
+            self._depotsEnCours += 1
+        try:
+            return self._placer(cube, timeout)
+        finally:
+            with self._verrou:
+                self._depotsEnCours -= 1
+                if not self._depotsEnCours:
+                    self._depotsTermines.notify_all()
+
+    def _placer(self, cube: Any, timeout: Optional[float]) -> bool:
+        debut = self._horloge()
+        element = _Element(cube, debut)
+        if self._stats.tPremier is None:
+            with self._verrou:
+                if self._stats.tPremier is None:
+                    self._stats.tPremier = debut
+        try:
+            self._file.put(element, timeout=timeout)
+        except queue.Full:
+            attente = self._horloge() - debut
+            with self._verrou:
+                self._stats.attenteProducteurTotale += attente
+                self._stats.attenteProducteurMax = max(self._stats.attenteProducteurMax, attente)
+            return False
+        fin = self._horloge()
+        profondeur = self._file.qsize()
+        with self._verrou:
+            stats = self._stats
+            stats.nbEntres += 1
+            stats.profondeurTotale += profondeur
+            stats.profondeurMax = max(stats.profondeurMax, profondeur)
+            stats.attenteProducteurTotale += fin - debut
+            stats.attenteProducteurMax = max(stats.attenteProducteurMax, fin - debut)
+        # Cube accepté par une chaîne entrée en échec pendant l'attente : il ne sera pas trié
+        self._verifier()
+        return True
+
+    def _verifier(self) -> None:
+        if self._erreur is not None:
+            raise RuntimeError(f"Chaîne de tri en échec : {self._erreur!r}") from self._erreur
+
+    def _signalerErreur(self, erreur: BaseException) -> None:
+        # Première erreur conservée ; les suivantes en sont souvent la conséquence
+        with self._verrou:
+            if self._erreur is None:
+                self._erreur = erreur
+
+    # ---------- Côté trieurs ----------
+
+    def _boucleClassification(self, trieur: RobotTrieur, fileBras: queue.Queue) -> None:
+        fin = False
+        while not fin:
+            debut = self._horloge()
+            premier = self._file.get()
+            prise = self._horloge()
+            lot = []
+            if premier is _FIN:
+                fin = True
+            else:
+                lot.append(premier)
+                # Lot : cubes déjà en attente, sans bloquer (un seul marqueur de fin par trieur)
+                while len(lot) < self._tailleLot:
+                    try:
+                        element = self._file.get_nowait()
+                    except queue.Empty:
+                        break
+                    if element is _FIN:
+                        fin = True
+                        break
+                    lot.append(element)
+            # Chaîne en échec : les cubes sont retirés de la file sans être triés
+            if lot and self._erreur is None:
+                try:
+                    couleurs = trieur.classifyBatch([trieur.cropCube(element.cube) for element in lot])
+                except Exception as erreur:
+                    self._signalerErreur(erreur)
+                    continue
+                for element, couleur in zip(lot, couleurs):
+                    element.tPrise = prise
+                    element.couleur = couleur
+                    fileBras.put(element)
+                with self._verrou:
+                    self._stats.attenteTrieursTotale += prise - debut
+        fileBras.put(_FIN)
+
+    def _boucleBras(self, trieur: RobotTrieur, fileBras: queue.Queue) -> None:
+        while True:
+            element = fileBras.get()
+            if element is _FIN:
+                return
+            if self._erreur is not None:
+                continue
+            try:
+                trieur.depositCube(element.couleur)
+            except Exception as erreur:
+                self._signalerErreur(erreur)
+                continue
+            fin = self._horloge()
+            with self._verrou:
+                stats = self._stats
+                stats.nbTries += 1
+                sejour = element.tPrise - element.tDepot
+                stats.sejourTotal += sejour
+                stats.sejourMax = max(stats.sejourMax, sejour)
+                latence = fin - element.tDepot
+                stats.latenceTotale += latence
+                stats.latenceMax = max(stats.latenceMax, latence)
+                stats.tDernier = fin
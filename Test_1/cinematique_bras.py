@@ -0,0 +1,139 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+import math
+import numpy as np
+
+
+class BrasPlanaire:
+    """
+    Bras planaire à N articulations rotoïdes en série, base à l'origine.
+    Les angles sont relatifs : angles[k] est l'angle du segment k par rapport au segment k-1.
+    """
+
+    def __init__(self, longueurs: Sequence[float]):
+        if not longueurs or any(l <= 0 for l in longueurs):
+            raise ValueError("Les longueurs des segments doivent être positives.")
+        self._longueurs: np.ndarray = np.asarray(longueurs, dtype=float)
+
+    def get_longueurs(self) -> List[float]:
+        return self._longueurs.tolist()
+
+    def get_nb_articulations(self) -> int:
+        return len(self._longueurs)
+
+    def get_portee(self) -> float:
+        return float(self._longueurs.sum())
+
+    def positionEffecteur(self, angles: Sequence[float]) -> Tuple[float, float]:
+        """
+        Cinématique directe : position (x, y) de l'extrémité du bras.
+        """
+        phi = np.cumsum(angles)
+        return (float(self._longueurs @ np.cos(phi)), float(self._longueurs @ np.sin(phi)))
+
+    def resoudre(self, x: float, y: float, anglesInitiaux: Optional[Sequence[float]] = None,
+                 tolerance: float = 1e-6, iterMax: int = 200) -> Tuple[np.ndarray, float, int]:
+        """
+        Cinématique inverse vers (x, y).
+        - 1 ou 2 articulations : solution analytique (coude en haut pour 2 articulations).
+        - N > 2 : moindres carrés amortis itératifs sur la jacobienne, depuis anglesInitiaux.
+        Une cible hors de portée donne la configuration la plus proche.
+        Retourne (angles, erreur résiduelle en m, nombre d'itérations).
+        """
+        n = len(self._longueurs)
+        if n <= 2:
+            angles = self._resoudreAnalytique(x, y)
+            xE, yE = self.positionEffecteur(angles)
+            return angles, math.hypot(x - xE, y - yE), 0
+
+        L = self._longueurs
+        if math.hypot(x, y) >= L.sum():
+            # Hors de portée : bras tendu dans la direction de la cible
+            angles = np.zeros(n)
+            angles[0] = math.atan2(y, x)
+            return angles, math.hypot(x, y) - float(L.sum()), 0
+        if anglesInitiaux is None:
+            # Configuration repliée en arc : évite la singularité du bras tendu
+            theta = np.full(n, 0.4)
+            theta[0] = math.atan2(y, x) - 0.4 * (n - 1) / 2.0
+        else:
+            theta = np.array(anglesInitiaux, dtype=float)
+        cible = np.array([x, y])
+        amortissement2 = 1e-4 * float(L.sum()) ** 2
+        iteration = 0
+        while iteration < iterMax:
+            phi = np.cumsum(theta)
+            px = L * np.cos(phi)
+            py = L * np.sin(phi)
+            e = cible - (px.sum(), py.sum())
+            erreur = math.hypot(e[0], e[1])
+            if erreur < tolerance:
+                return theta, erreur, iteration
+            # Jacobienne 2xN : sommes cumulées inverses des contributions des segments
+            J = np.vstack((-np.cumsum(py[::-1])[::-1], np.cumsum(px[::-1])[::-1]))
+            JJt = J @ J.T
+            JJt[0, 0] += amortissement2
+            JJt[1, 1] += amortissement2
+            pas = J.T @ np.linalg.solve(JJt, e)
+            theta += pas
+            iteration += 1
+            if float(np.abs(pas).max()) < 1e-12:
+                break   # Stagnation : cible hors de portée
+        xE, yE = self.positionEffecteur(theta)
+        return theta, math.hypot(x - xE, y - yE), iteration
+
+    def _resoudreAnalytique(self, x: float, y: float) -> np.ndarray:
+        L = self._longueurs
+        if len(L) == 1:
+            return np.array([math.atan2(y, x)])
+        l1, l2 = L
+        d2 = x * x + y * y
+        cosCoude = (d2 - l1 * l1 - l2 * l2) / (2.0 * l1 * l2)
+        coude = math.acos(min(max(cosCoude, -1.0), 1.0))      # borné si hors de portée
+        epaule = math.atan2(y, x) - math.atan2(l2 * math.sin(coude), l1 + l2 * math.cos(coude))
+        return np.array([epaule, coude])
+
+
+class TableIK:
+    """
+    Table précalculée des angles articulaires pour chaque corbeille.
+    - reconstruire() ne recalcule que si la carte des corbeilles a changé.
+    - angles() : lecture directe pour une cible de la table.
+    - resoudreProche() : cible quelconque, démarrage à chaud depuis la solution en cache la plus proche.
+    """
+
+    def __init__(self, bras: BrasPlanaire):
+        self._bras: BrasPlanaire = bras
+        self._signature: Optional[Tuple] = None
+        self._solutions: Dict[Tuple[float, float], np.ndarray] = {}
+        self._cibles: np.ndarray = np.empty((0, 2))
+        self._anglesCibles: List[np.ndarray] = []
+        self._nbReconstructions: int = 0
+
+    def get_nb_reconstructions(self) -> int:
+        return self._nbReconstructions
+
+    def reconstruire(self, corbeilles: Dict[str, Tuple[float, float]]) -> bool:
+        """
+        Résout (à froid) la cinématique inverse de chaque corbeille. Retourne True si la table a changé.
+        """
+        signature = tuple(sorted((nom, tuple(coords)) for nom, coords in corbeilles.items()))
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        self._solutions = {}
+        for coords in {tuple(coords) for coords in corbeilles.values()}:
+            self._solutions[coords] = self._bras.resoudre(*coords)[0]
+        self._cibles = np.array(list(self._solutions), dtype=float).reshape(-1, 2)
+        self._anglesCibles = list(self._solutions.values())
+        self._nbReconstructions += 1
+        return True
+
+    def angles(self, x: float, y: float) -> Optional[np.ndarray]:
+        solution = self._solutions.get((x, y))
+        return None if solution is None else solution.copy()
+
+    def resoudreProche(self, x: float, y: float) -> Tuple[np.ndarray, float, int]:
+        if not self._anglesCibles:
+            return self._bras.resoudre(x, y)
+        k = int(np.argmin(((self._cibles - (x, y)) ** 2).sum(axis=1)))
+        return self._bras.resoudre(x, y, anglesInitiaux=self._anglesCibles[k])
@@ -0,0 +1,98 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+from collections import OrderedDict
+import hashlib
+import numpy as np
+from vision import rgbVersHsv
+
+# Teinte centrale (degrés) de chaque couleur de cube
+TEINTES_DEFAUT: Dict[str, float] = {"rouge": 0.0, "vert": 120.0, "bleu": 240.0}
+
+
+def cleCrop(crop: np.ndarray) -> bytes:
+    """
+    Empreinte d'une image recadrée (contenu + forme + type), utilisée comme clé de cache.
+    """
+    crop = np.ascontiguousarray(crop)
+    empreinte = hashlib.blake2b(crop.data, digest_size=16)
+    empreinte.update(repr((crop.shape, crop.dtype.str)).encode())
+    return empreinte.digest()
+
+
+class ClassifieurCouleur:
+    """
+    Classifieur de couleur par teinte moyenne, vectorisé sur un lot d'images recadrées.
+    - Les images de même forme sont empilées et traitées en un seul passage NumPy.
+    - Caractéristique : moyenne circulaire de la teinte pondérée par la saturation ;
+      la confiance combine la pureté de la couleur et l'écart à la teinte de la classe.
+    - Cache LRU indexé par empreinte de l'image : une image déjà vue n'est pas reclassée.
+    """
+
+    def __init__(self, teintes: Optional[Dict[str, float]] = None, ecartMax: float = 60.0,
+                 tailleCache: int = 1024):
+        self._teintes: Dict[str, float] = dict(teintes or TEINTES_DEFAUT)
+        self._ecartMax: float = ecartMax        # Écart de teinte (degrés) où la confiance tombe à 0
+        self._tailleCache: int = tailleCache
+        self._cache: "OrderedDict[bytes, Tuple[str, float]]" = OrderedDict()
+        self._succesCache: int = 0
+        self._echecsCache: int = 0
+        self._noms: List[str] = list(self._teintes)
+        self._centres: np.ndarray = np.radians([self._teintes[n] for n in self._noms])
+
+    def get_statistiques_cache(self) -> Tuple[int, int]:
+        # (succès, échecs)
+        return (self._succesCache, self._echecsCache)
+
+    def viderCache(self) -> None:
+        self._cache.clear()
+
+    def classifierLot(self, crops: Sequence[np.ndarray]) -> Tuple[List[str], np.ndarray]:
+        """
+        Classifie N images recadrées (H, W, 3).
+        Retourne (couleurs, confiances) ; la confiance est dans [0, 1].
+        """
+        n = len(crops)
+        couleurs: List[str] = [""] * n
+        confiances = np.zeros(n)
+        cles = [cleCrop(crop) for crop in crops]
+
+        # Images absentes du cache, regroupées par forme (une image vue deux fois n'est traitée qu'une fois)
+        aTraiter: Dict[Tuple[int, ...], Dict[bytes, List[int]]] = {}
+        for i, cle in enumerate(cles):
+            resultat = self._cache.get(cle)
+            if resultat is not None:
+                self._cache.move_to_end(cle)
+                self._succesCache += 1
+                couleurs[i], confiances[i] = resultat
+            else:
+                self._echecsCache += 1
+                aTraiter.setdefault(np.shape(crops[i]), {}).setdefault(cle, []).append(i)
+
+        for groupe in aTraiter.values():
+            lot = np.stack([np.asarray(crops[indices[0]]) for indices in groupe.values()])
+            for (cle, indices), resultat in zip(groupe.items(), zip(*self._classifierPile(lot))):
+                self._memoriser(cle, resultat)
+                for i in indices:
+                    couleurs[i], confiances[i] = resultat
+        return couleurs, confiances
+
+    def _classifierPile(self, pile: np.ndarray) -> Tuple[List[str], List[float]]:
+        # pile : (N, H, W, 3) ; un seul passage HSV pour tout le lot
+        h, s, _ = rgbVersHsv(pile)
+        angle = np.radians(h, dtype=np.float32)
+        nbPixels = h.shape[1] * h.shape[2]
+        c = (s * np.cos(angle)).sum(axis=(1, 2)) / nbPixels
+        sn = (s * np.sin(angle)).sum(axis=(1, 2)) / nbPixels
+        purete = np.hypot(c, sn)                     # 0 = gris, 1 = couleur pure et uniforme
+        teinte = np.arctan2(sn, c)
+
+        ecarts = np.abs(np.angle(np.exp(1j * (teinte[:, None] - self._centres[None, :]))))
+        meilleurs = ecarts.argmin(axis=1)
+        ecart = np.degrees(ecarts[np.arange(len(pile)), meilleurs])
+        confiance = np.clip(purete * (1.0 - ecart / self._ecartMax), 0.0, 1.0)
+        return [self._noms[k] for k in meilleurs], confiance.tolist()
+
+    def _memoriser(self, cle: bytes, resultat: Tuple[str, float]) -> None:
+        self._cache[cle] = resultat
+        self._cache.move_to_end(cle)
+        while len(self._cache) > self._tailleCache:
+            self._cache.popitem(last=False)
@@ -0,0 +1,250 @@
+from typing import Iterable, List, Optional, Tuple
+from heapq import heappush, heappop
+import math
+import numpy as np
+from navigation import GrilleOccupation, Cellule, Changement, INF
+
+# Caps de déplacement sur la grille : est (+x), nord (+y), ouest, sud ; θ = cap * π/2
+NB_CAPS = 4
+
+
+class ModeleEnergie:
+    """
+    Coûts énergétiques d'un collecteur, en % de batterie :
+    - parMetre : déplacement en ligne droite (multiplié par le coût de traversée des cellules) ;
+    - parQuartDeTour : rotation de 90° sur place ;
+    - parRamassage : prise d'un cube ;
+    - marge : réserve de sécurité conservée à l'arrivée en zone de tri ;
+    - parPas : consommation minimale d'un appel à move(), même à l'arrêt (électronique, capteurs).
+    """
+
+    def __init__(self, parMetre: float = 0.5, parQuartDeTour: float = 0.05, parRamassage: float = 0.2,
+                 marge: float = 2.0, parPas: float = 0.02):
+        if min(parMetre, parQuartDeTour, parRamassage, marge) < 0 or parPas <= 0:
+            raise ValueError("Les coûts énergétiques doivent être positifs ou nuls (parPas strictement positif).")
+        self.parMetre: float = parMetre
+        self.parQuartDeTour: float = parQuartDeTour
+        self.parRamassage: float = parRamassage
+        self.marge: float = marge
+        self.parPas: float = parPas
+
+    def coutDeplacement(self, distance: float, angle: float = 0.0) -> float:
+        """
+        Énergie d'un déplacement de distance mètres avec une rotation totale de angle radians.
+        """
+        return self.parMetre * distance + self.parQuartDeTour * abs(angle) / (math.pi / 2.0)
+
+
+class ChampEnergie:
+    """
+    Champ d'énergie nécessaire pour rejoindre la zone de tri, calculé une fois pour toute l'arène.
+    Un état est (cellule, cap) : avancer d'une cellule coûte parMetre · résolution · coût de la
+    cellule atteinte, changer de cap coûte parQuartDeTour par quart de tour. Dijkstra inverse
+    depuis les cellules cibles sur les 4 · N états ; energieEn() est ensuite une lecture O(1).
+    Le champ observe la grille : un changement d'obstacles est réparé localement (sous-arbres
+    invalidés puis ré-ensemencés, comme ChampDistance.mettreAJour()).
+    """
+
+    def __init__(self, grille: GrilleOccupation, cibles: Iterable[Cellule], modele: Optional[ModeleEnergie] = None,
+                 suivreGrille: bool = True):
+        self._grille: GrilleOccupation = grille
+        self._modele: ModeleEnergie = modele if modele is not None else ModeleEnergie()
+        self._cibles: List[int] = [grille.index(l, c) for l, c in cibles]
+        if not self._cibles:
+            raise ValueError("Un champ d'énergie nécessite au moins une cellule cible.")
+        W = grille.get_nb_colonnes()
+        self._pas: Tuple[int, ...] = (1, W, -1, -W)
+        self._coutMetre: float = self._modele.parMetre * grille.get_resolution()
+        self._coutTours: Tuple[float, ...] = tuple(self._modele.parQuartDeTour * min(k, NB_CAPS - k)
+                                                   for k in range(NB_CAPS))
+        n = NB_CAPS * grille.get_nb_lignes() * W
+        self._energie: List[float] = [INF] * n
+        self._parent: List[int] = [-1] * n
+        self._nbRecalculs: int = 0
+        self.calculer()
+        if suivreGrille:
+            grille.ajouterObservateur(self.mettreAJour)
+
+    # ---------- Getters ----------
+
+    def get_modele(self) -> ModeleEnergie:
+        return self._modele
+
+    def get_grille(self) -> GrilleOccupation:
+        return self._grille
+
+    def get_nb_recalculs(self) -> int:
+        return self._nbRecalculs
+
+    def energie(self, ligne: int, colonne: int, cap: Optional[int] = None) -> float:
+        """
+        Énergie pour rejoindre la zone de tri depuis (ligne, colonne), orienté selon cap
+        (0 = est, 1 = nord, 2 = ouest, 3 = sud), ou avec le meilleur cap si cap est None.
+        """
+        s = NB_CAPS * self._grille.index(ligne, colonne)
+        if cap is None:
+            return min(self._energie[s:s + NB_CAPS])
+        return self._energie[s + cap % NB_CAPS]
+
+    def energieEn(self, x: float, y: float, theta: Optional[float] = None) -> float:
+        """
+        Lecture O(1) à partir d'une position monde ; theta est arrondi au cap le plus proche.
+        """
+        ligne, colonne = self._grille.versCellule(x, y)
+        cap = None if theta is None else int(round(theta / (math.pi / 2.0)))
+        return self.energie(ligne, colonne, cap)
+
+    def toArray(self) -> np.ndarray:
+        """
+        Énergie de retour par cellule (meilleur cap), de forme (nbLignes, nbColonnes).
+        """
+        grille = self._grille
+        return np.array(self._energie).reshape(grille.get_nb_lignes(), grille.get_nb_colonnes(), NB_CAPS).min(axis=2)
+
+    def fermer(self) -> None:
+        self._grille.retirerObservateur(self.mettreAJour)
+
+    # ---------- Calcul ----------
+
+    def calculer(self) -> None:
+        """
+        Recalcul complet du champ.
+        """
+        n = len(self._energie)
+        self._energie = [INF] * n
+        self._parent = [-1] * n
+        couts = self._grille._couts
+        tas = []
+        for i in self._cibles:
+            if couts[i] != INF:
+                for cap in range(NB_CAPS):
+                    self._energie[NB_CAPS * i + cap] = 0.0
+                    tas.append((0.0, NB_CAPS * i + cap))
+        self._propager(tas)
+        self._nbRecalculs += 1
+
+    def _predecesseur(self, v: int, cap: int) -> int:
+        # Cellule d'où l'on atteint v en avançant selon cap (-1 hors grille)
+        W = self._pas[1]
+        u = v - self._pas[cap]
+        if cap == 0 and v % W == 0 or cap == 2 and v % W == W - 1:
+            return -1
+        return u if 0 <= u < len(self._grille._couts) else -1
+
+    def _propager(self, tas: List[Tuple[float, int]]) -> None:
+        # Dijkstra inverse : l'état (v, cap') est atteint depuis (u, cap) pour tout cap, u = v - pas(cap')
+        couts = self._grille._couts
+        energie = self._energie
+        parent = self._parent
+        coutMetre = self._coutMetre
+        coutTours = self._coutTours
+        tas.sort()
+        while tas:
+            e, s = heappop(tas)
+            if e > energie[s]:
+                continue
+            v, capArrivee = divmod(s, NB_CAPS)
+            u = self._predecesseur(v, capArrivee)
+            if u < 0 or couts[u] == INF:
+                continue
+            base = e + coutMetre * couts[v]
+            for cap in range(NB_CAPS):
+                ne = base + coutTours[(cap - capArrivee) % NB_CAPS]
+                p = NB_CAPS * u + cap
+                if ne < energie[p]:
+                    energie[p] = ne
+                    parent[p] = s
+                    heappush(tas, (ne, p))
+
+    def _successeurs(self, s: int) -> List[Tuple[int, float]]:
+        # États atteignables depuis s (cellule, cap) avec le coût de la transition
+        u, cap = divmod(s, NB_CAPS)
+        couts = self._grille._couts
+        resultat = []
+        for capSuivant in range(NB_CAPS):
+            v = u + self._pas[capSuivant]
+            if not 0 <= v < len(couts) or self._predecesseur(v, capSuivant) != u or couts[v] == INF:
+                continue
+            resultat.append((NB_CAPS * v + capSuivant,
+                             self._coutMetre * couts[v] + self._coutTours[(cap - capSuivant) % NB_CAPS]))
+        return resultat
+
+    def mettreAJour(self, changements: List[Changement]) -> List[int]:
+        """
+        Réparation incrémentale après modification de coûts de la grille (même principe que
+        ChampDistance.mettreAJour()). Retourne les états invalidés (vide si recalcul complet).
+        """
+        couts = self._grille._couts
+        energie = self._energie
+        parent = self._parent
+        cibles = set(self._cibles)
+
+        # 1. Invalidation : états dont le meilleur chemin entre dans une cellule devenue plus chère
+        racines: List[int] = []
+        for k, ancien, nouveau in changements:
+            if nouveau > ancien:
+                etatsK = range(NB_CAPS * k, NB_CAPS * k + NB_CAPS)
+                if nouveau == INF:
+                    racines.extend(etatsK)
+                else:
+                    racines.extend(p for s in etatsK for p in self._enfants(s))
+        invalides = self._sousArbre(racines, len(energie) // 4)
+        if invalides is None:
+            self.calculer()
+            return []
+        for s in invalides:
+            energie[s] = INF
+            parent[s] = -1
+
+        # 2. Ré-ensemencement depuis les successeurs valides, puis propagation des baisses
+        tas: List[Tuple[float, int]] = []
+        for s in invalides:
+            if couts[s // NB_CAPS] == INF:
+                continue
+            self._reevaluer(s, cibles)
+            if energie[s] != INF:
+                heappush(tas, (energie[s], s))
+        for k, ancien, nouveau in changements:
+            if nouveau < ancien:
+                for s in range(NB_CAPS * k, NB_CAPS * k + NB_CAPS):
+                    if energie[s] == INF:
+                        self._reevaluer(s, cibles)
+                    if energie[s] != INF:
+                        heappush(tas, (energie[s], s))
+        self._propager(tas)
+        return invalides
+
+    def _reevaluer(self, s: int, cibles: set) -> None:
+        energie = self._energie
+        if s // NB_CAPS in cibles:
+            energie[s] = 0.0
+            self._parent[s] = -1
+            return
+        for t, cout in self._successeurs(s):
+            if energie[t] != INF and energie[t] + cout < energie[s]:
+                energie[s] = energie[t] + cout
+                self._parent[s] = t
+
+    def _enfants(self, s: int) -> List[int]:
+        # États dont le parent est s : ceux de la cellule d'où l'on arrive en s
+        v, cap = divmod(s, NB_CAPS)
+        u = self._predecesseur(v, cap)
+        if u < 0:
+            return []
+        return [p for p in range(NB_CAPS * u, NB_CAPS * u + NB_CAPS) if self._parent[p] == s]
+
+    def _sousArbre(self, racines: List[int], limite: int) -> Optional[List[int]]:
+        # Descendants des racines dans l'arbre des chemins d'énergie minimale ; None au-delà de limite
+        marque = set(racines)
+        pile = list(marque)
+        etats: List[int] = []
+        while pile:
+            s = pile.pop()
+            etats.append(s)
+            if len(etats) > limite:
+                return None
+            for p in self._enfants(s):
+                if p not in marque:
+                    marque.add(p)
+                    pile.append(p)
+        return etats
@@ -0,0 +1,183 @@
+from typing import Optional, Tuple
+from multiprocessing import shared_memory, resource_tracker
+import time
+import numpy as np
+from vision import CameraSynthetique
+
+# En-tête : [nombre de cases, hauteur, largeur, canaux, dernier numéro écrit]
+_TAILLE_ENTETE = 5
+# Métadonnées d'une case : [verrou de séquence, numéro de l'image, horodatage (ns, time.monotonic_ns)]
+_TAILLE_META = 3
+
+
+class AnneauImages:
+    """
+    Anneau d'images en mémoire partagée (multiprocessing.shared_memory) entre un processus
+    d'acquisition (écrivain unique) et des processus de vision (lecteurs).
+    - L'image n est écrite dans la case n % nbCases ; chaque case a un verrou de séquence
+      (impair pendant l'écriture, pair ensuite), son numéro d'image et son horodatage.
+    - derniereImage() renvoie (numéro, vue NumPy) sans copie, comme CameraSynthetique :
+      l'anneau se branche directement sur RobotCollector.set_camera() ou un Capteur.
+    - Une vue reste valable tant que l'écrivain n'a pas refait le tour de l'anneau
+      (nbCases - 1 images plus tard) : est_valide(numero) le vérifie après usage.
+    """
+
+    def __init__(self, memoire: shared_memory.SharedMemory, proprietaire: bool):
+        self._memoire: shared_memory.SharedMemory = memoire
+        self._proprietaire: bool = proprietaire
+        self._entete: np.ndarray = np.ndarray((_TAILLE_ENTETE,), dtype=np.int64, buffer=memoire.buf)
+        nbCases, hauteur, largeur, canaux = (int(v) for v in self._entete[:4])
+        decalage = self._entete.nbytes
+        self._metas: np.ndarray = np.ndarray((nbCases, _TAILLE_META), dtype=np.int64, buffer=memoire.buf,
+                                             offset=decalage)
+        decalage += self._metas.nbytes
+        self._images: np.ndarray = np.ndarray((nbCases, hauteur, largeur, canaux), dtype=np.uint8,
+                                              buffer=memoire.buf, offset=decalage)
+        self._nbCases: int = nbCases
+
+    @classmethod
+    def creer(cls, hauteur: int, largeur: int, canaux: int = 3, nbCases: int = 8,
+              nom: Optional[str] = None) -> "AnneauImages":
+        """
+        Alloue l'anneau (côté acquisition). Le segment est détruit par detruire().
+        """
+        if min(hauteur, largeur, canaux) <= 0 or nbCases < 2:
+            raise ValueError("Dimensions invalides ou moins de 2 cases.")
+        taille = 8 * (_TAILLE_ENTETE + nbCases * _TAILLE_META) + nbCases * hauteur * largeur * canaux
+        memoire = shared_memory.SharedMemory(name=nom, create=True, size=taille)
+        entete = np.ndarray((_TAILLE_ENTETE,), dtype=np.int64, buffer=memoire.buf)
+        entete[:] = (nbCases, hauteur, largeur, canaux, -1)
+        del entete
+        anneau = cls(memoire, proprietaire=True)
+        anneau._metas[:] = 0
+        anneau._metas[:, 1] = -1
+        return anneau
+
+    @classmethod
+    def ouvrir(cls, nom: str) -> "AnneauImages":
+        """
+        Se rattache à un anneau existant (côté vision, éventuellement dans un autre processus).
+        """
+        memoire = shared_memory.SharedMemory(name=nom, create=False)
+        # Seul le créateur détruit le segment : le lecteur ne doit pas être suivi par resource_tracker
+        resource_tracker.unregister(memoire._name, "shared_memory")
+        return cls(memoire, proprietaire=False)
+
+    # ---------- Getters ----------
+
+    def get_nom(self) -> str:
+        return self._memoire.name
+
+    def get_nb_cases(self) -> int:
+        return self._nbCases
+
+    def get_forme(self) -> Tuple[int, int, int]:
+        return tuple(self._images.shape[1:])
+
+    def get_dernier_numero(self) -> int:
+        """
+        Numéro de la dernière image complète (-1 si aucune).
+        """
+        return int(self._entete[4])
+
+    # ---------- Écriture (processus d'acquisition) ----------
+
+    def ecrire(self, image: np.ndarray, horodatage: Optional[int] = None) -> int:
+        """
+        Copie image dans la case suivante (seule copie du trajet) et la publie. Retourne son numéro.
+        """
+        numero = int(self._entete[4]) + 1
+        meta = self._metas[numero % self._nbCases]
+        meta[0] += 1                    # Impair : écriture en cours
+        np.copyto(self._images[numero % self._nbCases], image)
+        meta[1] = numero
+        meta[2] = time.monotonic_ns() if horodatage is None else horodatage
+        meta[0] += 1                    # Pair : case stable
+        self._entete[4] = numero
+        return numero
+
+    # ---------- Lecture (processus de vision) ----------
+
+    def derniereImage(self) -> Tuple[int, np.ndarray]:
+        """
+        (numéro, vue sans copie) de la dernière image publiée ; (-1, vue de la case 0) si aucune.
+        """
+        numero = int(self._entete[4])
+        return numero, self._images[max(numero, 0) % self._nbCases]
+
+    def lire(self, numero: int) -> Optional[np.ndarray]:
+        """
+        Vue de l'image numero si elle est encore dans l'anneau, sinon None.
+        """
+        if numero < 0 or not self.est_valide(numero):
+            return None
+        return self._images[numero % self._nbCases]
+
+    def est_valide(self, numero: int) -> bool:
+        """
+        Vrai si la case de numero contient toujours cette image, stable (pas d'écriture en cours).
+        À appeler après avoir exploité une vue pour détecter un recouvrement par l'écrivain.
+        """
+        meta = self._metas[numero % self._nbCases]
+        sequence = int(meta[0])
+        return sequence % 2 == 0 and int(meta[1]) == numero and int(meta[0]) == sequence
+
+    def get_horodatage(self, numero: int) -> Optional[int]:
+        """
+        Instant d'acquisition (time.monotonic_ns, commun à tous les processus) de numero, ou None.
+        """
+        meta = self._metas[numero % self._nbCases]
+        horodatage = int(meta[2])
+        return horodatage if int(meta[1]) == numero and self.est_valide(numero) else None
+
+    # ---------- Cycle de vie ----------
+
+    def fermer(self) -> None:
+        # Les vues NumPy doivent être libérées avant de fermer le segment
+        self._entete = self._metas = self._images = None
+        try:
+            self._memoire.close()
+        except BufferError:
+            # Des vues (recadrages en cache...) sont encore référencées : libéré avec elles
+            pass
+
+    def detruire(self) -> None:
+        self.fermer()
+        if self._proprietaire:
+            # Un lecteur partageant notre resource_tracker (même processus, fork) a pu désinscrire le segment
+            resource_tracker.register(self._memoire._name, "shared_memory")
+            self._memoire.unlink()
+
+    def __enter__(self) -> "AnneauImages":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._proprietaire:
+            self.detruire()
+        else:
+            self.fermer()
+
+
+def acquerirSynthetique(nomAnneau: str, nbImages: int, frequence: float = 0.0, graine: int = 0,
+                        couleur: Optional[str] = "rouge", cote: int = 40) -> int:
+    """
+    Processus d'acquisition de test : une CameraSynthetique publie nbImages images dans l'anneau
+    nomAnneau, à frequence Hz (0 = au plus vite). Retourne le nombre d'images écrites.
+    """
+    anneau = AnneauImages.ouvrir(nomAnneau)
+    try:
+        hauteur, largeur, _ = anneau.get_forme()
+        camera = CameraSynthetique(largeur, hauteur, cote=cote, couleur=couleur, graine=graine)
+        periode = 1.0 / frequence if frequence > 0 else 0.0
+        prochaine = time.perf_counter()
+        for _ in range(nbImages):
+            camera.avancer()
+            if periode:
+                prochaine += periode
+                attente = prochaine - time.perf_counter()
+                if attente > 0:
+                    time.sleep(attente)
+            anneau.ecrire(camera.derniereImage()[1])
+        return nbImages
+    finally:
+        anneau.fermer()
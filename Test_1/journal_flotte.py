@@ -0,0 +1,293 @@
+from typing import Any, Dict, List, Optional, Sequence, Union
+import bisect
+import json
+import math
+import struct
+import time
+import numpy as np
+from robot_collector import RobotCollector
+from robot_trieur import RobotTrieur
+from robot_compact import CODES_ETAT, LIBELLES_ETAT
+from simulation_flotte import SimulationFlotte, X, Y, THETA, V, OMEGA, BATTERIE
+
+MAGIQUE = b"TEKFLOT1"
+VERSION = 1
+# Préambule : magique, version, taille de l'en-tête, nb robots, nb angles, taille d'un enregistrement,
+# longueur de la description JSON des robots (suivie de la description, puis de remplissage)
+STRUCT_PREAMBULE = struct.Struct("<8sIIIIII")
+# Les enregistrements commencent sur une frontière de page : memmap sans décalage partiel
+ALIGNEMENT_ENTETE = 4096
+
+TYPE_COLLECTEUR = "collecteur"
+TYPE_TRIEUR = "trieur"
+
+
+def dtypeEnregistrement(nbAngles: int) -> np.dtype:
+    """
+    Enregistrement d'un robot à un tick (sans alignement) : instant, code d'état (EtatRobot),
+    stock, pose, vitesses, batterie, angles du bras (NaN au-delà des articulations du robot).
+    """
+    return np.dtype([("t", "<f8"), ("etat", "u1"), ("stock", "<u2"),
+                     ("x", "<f8"), ("y", "<f8"), ("theta", "<f8"), ("v", "<f8"), ("omega", "<f8"),
+                     ("batterie", "<f8"), ("angles", "<f8", (nbAngles,))])
+
+
+def decrireRobot(robot: Union[RobotCollector, RobotTrieur]) -> Dict[str, Any]:
+    """
+    Configuration statique d'un robot (écrite une fois dans l'en-tête), de quoi le reconstruire.
+    """
+    if isinstance(robot, RobotCollector):
+        return {"type": TYPE_COLLECTEUR, "nom": robot.get_name(),
+                "ecartementRoues": robot.get_ecartement_roues(), "stockageMax": robot.get_stockage_max()}
+    if isinstance(robot, RobotTrieur):
+        return {"type": TYPE_TRIEUR, "nom": robot.get_name(), "nbArticulations": robot.get_nb_articulations(),
+                "corbeilles": {c: list(p) for c, p in robot.get_corbeilles().items()},
+                "seuilConfiance": robot.get_seuil_confiance(),
+                "longueursSegments": robot.get_bras().get_longueurs()}
+    raise TypeError(f"Robot non journalisable : {type(robot).__name__}.")
+
+
+def construireRobot(description: Dict[str, Any]) -> Union[RobotCollector, RobotTrieur]:
+    if description["type"] == TYPE_COLLECTEUR:
+        return RobotCollector(description["nom"], description["ecartementRoues"], description["stockageMax"])
+    return RobotTrieur(description["nom"], description["nbArticulations"],
+                       {c: tuple(p) for c, p in description["corbeilles"].items()},
+                       seuilConfiance=description["seuilConfiance"],
+                       longueursSegments=description["longueursSegments"])
+
+
+class JournalFlotte:
+    """
+    Écriture d'un journal binaire de mission : à chaque tick, un enregistrement de taille fixe
+    par robot (dtypeEnregistrement()), dans l'ordre des robots donné à la création.
+    - L'en-tête décrit la flotte (JSON) ; le tick k commence donc à l'octet
+      tailleEntete + k * nbRobots * tailleEnregistrement (accès direct, voir LecteurJournal).
+    - Les ticks s'accumulent dans un lot NumPy préalloué (ticksParLot ticks) écrit d'un bloc.
+    """
+
+    def __init__(self, chemin: str, robots: Sequence[Union[RobotCollector, RobotTrieur]],
+                 ticksParLot: int = 1024):
+        if not robots:
+            raise ValueError("La flotte journalisée doit contenir au moins un robot.")
+        if ticksParLot <= 0:
+            raise ValueError("Un lot contient au moins un tick.")
+        self._robots: List[Union[RobotCollector, RobotTrieur]] = list(robots)
+        descriptions = [decrireRobot(robot) for robot in self._robots]
+        self._nbAngles: int = max([len(robot.get_angles()) for robot in self._robots
+                                   if isinstance(robot, RobotTrieur)] + [1])
+        self._dtype: np.dtype = dtypeEnregistrement(self._nbAngles)
+        self._lot: np.ndarray = np.zeros((ticksParLot, len(self._robots)), dtype=self._dtype)
+        self._dansLot: int = 0
+        self._nbTicks: int = 0
+        self._origine: float = time.perf_counter()
+        self._fichier = open(chemin, "wb")
+        self._fichier.write(self._entete(descriptions))
+
+    def _entete(self, descriptions: List[Dict[str, Any]]) -> bytes:
+        texte = json.dumps(descriptions, ensure_ascii=False).encode("utf-8")
+        taille = -(-(STRUCT_PREAMBULE.size + len(texte)) // ALIGNEMENT_ENTETE) * ALIGNEMENT_ENTETE
+        preambule = STRUCT_PREAMBULE.pack(MAGIQUE, VERSION, taille, len(self._robots), self._nbAngles,
+                                          self._dtype.itemsize, len(texte))
+        return (preambule + texte).ljust(taille, b"\0")
+
+    # ---------- Getters ----------
+
+    def get_nb_ticks(self) -> int:
+        """
+        Ticks enregistrés (y compris ceux du lot pas encore écrit).
+        """
+        return self._nbTicks
+
+    def get_dtype(self) -> np.dtype:
+        return self._dtype
+
+    # ---------- Enregistrement ----------
+
+    def enregistrer(self, t: Optional[float] = None) -> int:
+        """
+        Ajoute un tick : état courant de chaque robot (t par défaut : secondes depuis la création).
+        Retourne le numéro du tick.
+        """
+        if t is None:
+            t = time.perf_counter() - self._origine
+        ligne = self._lot[self._dansLot]
+        vide = [math.nan] * self._nbAngles
+        for i, robot in enumerate(self._robots):
+            x, y, theta = robot.get_position()
+            v, omega = robot.get_vitesse()
+            if isinstance(robot, RobotTrieur):
+                stock, angles = 0, robot.get_angles()
+                angles = angles + vide[len(angles):]
+            else:
+                stock, angles = robot.get_stock_actuel(), vide
+            ligne[i] = (t, CODES_ETAT[robot.get_etat()], stock, x, y, theta, v, omega,
+                        robot.get_battery_level(), angles)
+        return self._suivant()
+
+    def enregistrerFlotte(self, flotte: SimulationFlotte, t: float, stocks: Optional[np.ndarray] = None) -> int:
+        """
+        Ajoute un tick depuis une SimulationFlotte de même taille (robots tous collecteurs) :
+        copie colonne par colonne de l'état struct-of-arrays, sans boucle Python par robot.
+        La flotte ne simulant pas le stock, il est fourni par stocks (0 par défaut).
+        """
+        if flotte.get_nb_robots() != len(self._robots):
+            raise ValueError("La flotte doit avoir autant de robots que le journal.")
+        etat = flotte.get_etat()
+        ligne = self._lot[self._dansLot]
+        ligne["t"] = t
+        ligne["etat"] = np.where(flotte.get_actifs(), CODES_ETAT["en mouvement"], CODES_ETAT["à l'arrêt"])
+        ligne["stock"] = 0 if stocks is None else stocks
+        for nom, indice in (("x", X), ("y", Y), ("theta", THETA), ("v", V), ("omega", OMEGA),
+                            ("batterie", BATTERIE)):
+            ligne[nom] = etat[indice]
+        ligne["angles"] = math.nan
+        return self._suivant()
+
+    def _suivant(self) -> int:
+        numero = self._nbTicks
+        self._nbTicks += 1
+        self._dansLot += 1
+        if self._dansLot == len(self._lot):
+            self.vider()
+        return numero
+
+    def vider(self) -> None:
+        """
+        Écrit d'un bloc les ticks du lot courant.
+        """
+        if self._dansLot:
+            self._fichier.write(self._lot[:self._dansLot].data)
+            self._dansLot = 0
+        self._fichier.flush()
+
+    def fermer(self) -> None:
+        if self._fichier is not None:
+            self.vider()
+            self._fichier.close()
+            self._fichier = None
+
+    def __enter__(self) -> "JournalFlotte":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fermer()
+
+
+class LecteurJournal:
+    """
+    Lecture d'un journal écrit par JournalFlotte, projeté en mémoire (np.memmap) :
+    - enregistrements() est un tableau (ticks, robots) de dtypeEnregistrement() ; colonne("x"),
+      trajectoire(robot) et tick(k) en sont des vues : rien n'est copié ni lu avant d'être accédé ;
+    - un tick incomplet en fin de fichier (écriture interrompue) est ignoré ;
+    - restaurer(k) reconstruit la flotte telle qu'au tick k, restaurerDans() l'applique à des robots existants.
+    """
+
+    def __init__(self, chemin: str):
+        with open(chemin, "rb") as fichier:
+            preambule = fichier.read(STRUCT_PREAMBULE.size)
+            if len(preambule) < STRUCT_PREAMBULE.size:
+                raise ValueError("Fichier trop court pour un journal de flotte.")
+            magique, version, tailleEntete, nbRobots, nbAngles, tailleEnregistrement, longueurTexte = \
+                STRUCT_PREAMBULE.unpack(preambule)
+            if magique != MAGIQUE or version != VERSION:
+                raise ValueError("Ce fichier n'est pas un journal de flotte (ou version inconnue).")
+            self._descriptions: List[Dict[str, Any]] = json.loads(fichier.read(longueurTexte).decode("utf-8"))
+            fichier.seek(0, 2)
+            taille = fichier.tell()
+        self._dtype: np.dtype = dtypeEnregistrement(nbAngles)
+        if self._dtype.itemsize != tailleEnregistrement:
+            raise ValueError("Taille d'enregistrement incohérente avec l'en-tête.")
+        self._nbRobots: int = nbRobots
+        self._indices: Dict[str, int] = {d["nom"]: i for i, d in enumerate(self._descriptions)}
+        nbTicks = (taille - tailleEntete) // (nbRobots * tailleEnregistrement)
+        if nbTicks > 0:
+            self._donnees: np.ndarray = np.memmap(chemin, dtype=self._dtype, mode="r", offset=tailleEntete,
+                                                  shape=(nbTicks, nbRobots))
+        else:
+            self._donnees = np.zeros((0, nbRobots), dtype=self._dtype)
+
+    # ---------- Getters ----------
+
+    def get_nb_ticks(self) -> int:
+        return len(self._donnees)
+
+    def get_nb_robots(self) -> int:
+        return self._nbRobots
+
+    def get_noms(self) -> List[str]:
+        return [d["nom"] for d in self._descriptions]
+
+    def get_descriptions(self) -> List[Dict[str, Any]]:
+        return self._descriptions
+
+    # ---------- Vues sans copie ----------
+
+    def enregistrements(self) -> np.ndarray:
+        return self._donnees
+
+    def colonne(self, nom: str) -> np.ndarray:
+        """
+        Vue (ticks, robots) d'un champ : "t", "etat", "stock", "x", "y", "theta", "v", "omega",
+        "batterie" ou "angles" (ticks, robots, nbAngles).
+        """
+        return self._donnees[nom]
+
+    def tick(self, k: int) -> np.ndarray:
+        """
+        Enregistrements des robots au tick k (négatif : depuis la fin).
+        """
+        return self._donnees[k]
+
+    def trajectoire(self, robot: Union[int, str]) -> np.ndarray:
+        return self._donnees[:, self._indice(robot)]
+
+    def _indice(self, robot: Union[int, str]) -> int:
+        return self._indices[robot] if isinstance(robot, str) else robot
+
+    def chercherInstant(self, t: float) -> int:
+        """
+        Dernier tick d'instant <= t (0 si t précède le journal), par dichotomie :
+        seules O(log n) pages du fichier sont lues.
+        """
+        instants = self._donnees["t"][:, 0]
+        return max(bisect.bisect_right(instants, t) - 1, 0)
+
+    # ---------- Restauration ----------
+
+    def restaurer(self, k: int = -1) -> List[Union[RobotCollector, RobotTrieur]]:
+        """
+        Nouvelle flotte (mêmes configurations que les robots journalisés) dans l'état du tick k.
+        """
+        robots = [construireRobot(description) for description in self._descriptions]
+        self.restaurerDans(robots, k)
+        return robots
+
+    def restaurerDans(self, robots: Sequence[Union[RobotCollector, RobotTrieur]], k: int = -1) -> None:
+        """
+        Applique l'état du tick k aux robots (dans l'ordre du journal). Le contenu des cubes
+        transportés n'étant pas journalisé, le stock est restauré avec des cubes stub
+        à la position du robot.
+        """
+        if len(robots) != self._nbRobots:
+            raise ValueError("Le nombre de robots doit correspondre au journal.")
+        for robot, (t, etat, stock, x, y, theta, v, omega, batterie, angles) in zip(robots, self._donnees[k].tolist()):
+            robot.set_position(x, y, theta)
+            robot.set_vitesse(v, omega)
+            robot.set_battery_level(batterie)
+            robot.set_etat(LIBELLES_ETAT[etat])
+            if isinstance(robot, RobotTrieur):
+                robot.set_angles([float(a) for a in angles[:robot.get_nb_articulations()]])
+            else:
+                robot.restoreStorage([{"position": (x, y)} for _ in range(stock)])
+
+    # ---------- Cycle de vie ----------
+
+    def fermer(self) -> None:
+        # Libère la projection (les vues déjà rendues la gardent ouverte jusqu'à leur destruction)
+        self._donnees = np.zeros((0, self._nbRobots), dtype=self._dtype)
+
+    def __enter__(self) -> "LecteurJournal":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fermer()
@@ -0,0 +1,240 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import math
+
+Cle = Tuple[int, int]
+
+
+class CarteCubes:
+    """
+    Modèle du monde partagé par les collecteurs : cubes repérés mais pas encore ramassés.
+    Index spatial par grille uniforme (table de hachage cellule → cubes) :
+    - ajouter() / retirer() en O(1), une observation proche d'un cube connu le met à jour ;
+    - plusProche() parcourt les anneaux de cellules autour du point et s'arrête dès que
+      l'anneau suivant ne peut plus contenir de cube plus proche ;
+    - dansRayon() ne visite que les cellules couvrant le disque.
+    Un cube peut être réservé par un collecteur pour que les autres ne le visent pas.
+    """
+
+    SEUIL_BALAYAGE = 32     # En dessous, plusProche() parcourt directement tous les cubes
+
+    def __init__(self, tailleCellule: float = 0.5, rayonFusion: float = 0.05):
+        if tailleCellule <= 0:
+            raise ValueError("La taille des cellules doit être positive.")
+        self._taille: float = tailleCellule
+        self._rayonFusion: float = rayonFusion      # Deux observations plus proches = même cube
+        self._cellules: Dict[Cle, Dict[int, Tuple[float, float]]] = {}
+        self._positions: Dict[int, Tuple[float, float]] = {}
+        self._reservations: Dict[int, str] = {}
+        self._prochainId: int = 0
+        # Emprise des cellules occupées (bornes des anneaux de plusProche)
+        self._iMin = self._jMin = math.inf
+        self._iMax = self._jMax = -math.inf
+
+    # ---------- Getters ----------
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, ident: int) -> bool:
+        return ident in self._positions
+
+    def get_taille_cellule(self) -> float:
+        return self._taille
+
+    def get_position(self, ident: int) -> Tuple[float, float]:
+        return self._positions[ident]
+
+    def get_cubes(self) -> Dict[int, Tuple[float, float]]:
+        return dict(self._positions)
+
+    def get_reservation(self, ident: int) -> Optional[str]:
+        return self._reservations.get(ident)
+
+    def get_nb_reservations(self) -> int:
+        return len(self._reservations)
+
+    # ---------- Mises à jour ----------
+
+    def _cle(self, x: float, y: float) -> Cle:
+        return (math.floor(x / self._taille), math.floor(y / self._taille))
+
+    def ajouter(self, x: float, y: float) -> int:
+        """
+        Enregistre une observation de cube. Si un cube connu est à moins de rayonFusion,
+        sa position est mise à jour et son identifiant renvoyé ; sinon un nouveau cube est créé.
+        """
+        if self._rayonFusion > 0:
+            # Un cube réservé reste le même cube : la fusion ignore les réservations
+            proche = self.plusProche(x, y, rayonMax=self._rayonFusion, ignorerReservations=True)
+            if proche is not None:
+                ident = proche[0]
+                self._deplacer(ident, x, y)
+                return ident
+        ident = self._prochainId
+        self._prochainId += 1
+        self._inserer(ident, x, y)
+        return ident
+
+    def ajouterLot(self, positions: Iterable[Tuple[float, float]]) -> List[int]:
+        return [self.ajouter(x, y) for x, y in positions]
+
+    def _inserer(self, ident: int, x: float, y: float) -> None:
+        cle = self._cle(x, y)
+        self._cellules.setdefault(cle, {})[ident] = (x, y)
+        self._positions[ident] = (x, y)
+        i, j = cle
+        self._iMin, self._iMax = min(self._iMin, i), max(self._iMax, i)
+        self._jMin, self._jMax = min(self._jMin, j), max(self._jMax, j)
+
+    def _deplacer(self, ident: int, x: float, y: float) -> None:
+        xA, yA = self._positions[ident]
+        cle = self._cle(xA, yA)
+        if cle == self._cle(x, y):
+            self._cellules[cle][ident] = (x, y)
+            self._positions[ident] = (x, y)
+        else:
+            self._enlever(ident, cle)
+            self._inserer(ident, x, y)
+
+    def _enlever(self, ident: int, cle: Cle) -> None:
+        cellule = self._cellules[cle]
+        del cellule[ident]
+        if not cellule:
+            del self._cellules[cle]
+        del self._positions[ident]
+
+    def retirer(self, ident: int) -> bool:
+        """
+        Retire un cube (ramassé ou disparu). Retourne False s'il n'était pas connu.
+        """
+        position = self._positions.get(ident)
+        if position is None:
+            return False
+        self._enlever(ident, self._cle(*position))
+        self._reservations.pop(ident, None)
+        return True
+
+    def retirerProche(self, x: float, y: float, rayon: Optional[float] = None) -> Optional[int]:
+        """
+        Retire le cube le plus proche de (x, y) à moins de rayon (rayonFusion par défaut).
+        """
+        proche = self.plusProche(x, y, rayonMax=self._rayonFusion if rayon is None else rayon,
+                                 ignorerReservations=True)
+        if proche is None:
+            return None
+        self.retirer(proche[0])
+        return proche[0]
+
+    def reserver(self, ident: int, proprietaire: str) -> bool:
+        """
+        Réserve un cube pour un collecteur ; échoue s'il est déjà réservé par un autre.
+        """
+        if ident not in self._positions:
+            return False
+        actuel = self._reservations.setdefault(ident, proprietaire)
+        return actuel == proprietaire
+
+    def liberer(self, ident: int) -> None:
+        self._reservations.pop(ident, None)
+
+    # ---------- Requêtes ----------
+
+    def plusProche(self, x: float, y: float, rayonMax: float = math.inf, proprietaire: Optional[str] = None,
+                   exclus: Optional[Set[int]] = None,
+                   ignorerReservations: bool = False) -> Optional[Tuple[int, float, float]]:
+        """
+        Cube le plus proche de (x, y) à distance <= rayonMax, ou None.
+        - proprietaire : ignore les cubes réservés par un autre collecteur ;
+        - exclus : identifiants à ignorer (ex. cibles inaccessibles) ;
+        - ignorerReservations : considère aussi les cubes réservés (fusion d'observations, retrait).
+        Retourne (identifiant, x_cube, y_cube).
+        """
+        if not self._positions:
+            return None
+        reservations = None if ignorerReservations else self._reservations
+        if len(self._positions) <= self.SEUIL_BALAYAGE:
+            # Peu de cubes : un balayage direct coûte moins que le parcours des anneaux
+            meilleur = None
+            meilleureD2 = rayonMax * rayonMax
+            for ident, (xC, yC) in self._positions.items():
+                d2 = (xC - x) * (xC - x) + (yC - y) * (yC - y)
+                if d2 > meilleureD2 or (d2 == meilleureD2 and meilleur is not None):
+                    continue
+                if exclus and ident in exclus:
+                    continue
+                if reservations and reservations.get(ident, proprietaire) != proprietaire:
+                    continue
+                meilleur, meilleureD2 = (ident, xC, yC), d2
+            return meilleur
+        t = self._taille
+        ci, cj = self._cle(x, y)
+        # Distance minimale du point aux bords de sa propre cellule
+        fx, fy = x - ci * t, y - cj * t
+        marge = min(fx, t - fx, fy, t - fy)
+        # Au-delà de rMax anneaux, plus aucune cellule occupée
+        rMax = int(max(ci - self._iMin, self._iMax - ci, cj - self._jMin, self._jMax - cj))
+        if rayonMax != math.inf:
+            rMax = min(rMax, int(rayonMax / t) + 1)
+        cellules = self._cellules
+        meilleur = None
+        meilleureD2 = rayonMax * rayonMax
+        # Les anneaux plus proches que l'emprise sont vides : on commence directement au premier utile
+        rMin = int(max(0, self._iMin - ci, ci - self._iMax, self._jMin - cj, cj - self._jMax))
+        for r in range(rMin, rMax + 1):
+            if r > 0:
+                borne = (r - 1) * t + marge
+                if borne * borne > meilleureD2:
+                    break
+            for cle in self._anneau(ci, cj, r):
+                cellule = cellules.get(cle)
+                if cellule is None:
+                    continue
+                for ident, (xC, yC) in cellule.items():
+                    d2 = (xC - x) * (xC - x) + (yC - y) * (yC - y)
+                    if d2 > meilleureD2 or (d2 == meilleureD2 and meilleur is not None):
+                        continue
+                    if exclus and ident in exclus:
+                        continue
+                    if reservations and reservations.get(ident, proprietaire) != proprietaire:
+                        continue
+                    meilleur, meilleureD2 = (ident, xC, yC), d2
+        return meilleur
+
+    @staticmethod
+    def _anneau(ci: int, cj: int, r: int) -> Iterable[Cle]:
+        # Cellules à distance de Tchebychev exactement r de (ci, cj)
+        if r == 0:
+            return ((ci, cj),)
+        cles = [(i, cj - r) for i in range(ci - r, ci + r + 1)]
+        cles += [(i, cj + r) for i in range(ci - r, ci + r + 1)]
+        cles += [(ci - r, j) for j in range(cj - r + 1, cj + r)]
+        cles += [(ci + r, j) for j in range(cj - r + 1, cj + r)]
+        return cles
+
+    def dansRayon(self, x: float, y: float, rayon: float) -> List[int]:
+        """
+        Identifiants des cubes à distance <= rayon de (x, y).
+        """
+        if not self._positions:
+            return []
+        i0, j0 = self._cle(x - rayon, y - rayon)
+        i1, j1 = self._cle(x + rayon, y + rayon)
+        # Disque plus grand que l'emprise : on borne aux cellules occupées
+        i0, i1 = max(i0, self._iMin), min(i1, self._iMax)
+        j0, j1 = max(j0, self._jMin), min(j1, self._jMax)
+        r2 = rayon * rayon
+        resultat = []
+        cellules = self._cellules
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > len(cellules):
+            # Moins de cellules occupées que de cellules couvertes : on parcourt les occupées
+            cles = [cle for cle in cellules if i0 <= cle[0] <= i1 and j0 <= cle[1] <= j1]
+        else:
+            cles = [(i, j) for i in range(int(i0), int(i1) + 1) for j in range(int(j0), int(j1) + 1)]
+        for cle in cles:
+            cellule = cellules.get(cle)
+            if cellule is None:
+                continue
+            for ident, (xC, yC) in cellule.items():
+                if (xC - x) * (xC - x) + (yC - y) * (yC - y) <= r2:
+                    resultat.append(ident)
+        return resultat
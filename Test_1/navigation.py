@@ -0,0 +1,434 @@
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from heapq import heappush, heappop
+import math
+import numpy as np
+
+INF = math.inf
+ZONE_TRI = "tri"            # Nom du champ de distance vers la zone de tri
+
+Cellule = Tuple[int, int]   # (ligne, colonne)
+# Changement de coût d'une cellule : (index, ancien coût, nouveau coût)
+Changement = Tuple[int, float, float]
+
+
+class GrilleOccupation:
+    """
+    Grille d'occupation de l'arène.
+    Chaque cellule porte un coût de traversée (>= 1.0) ; math.inf signifie obstacle.
+    Les cellules sont identifiées par un index entier ligne * nbColonnes + colonne.
+    Les observateurs (planificateurs, champs) sont notifiés de chaque modification.
+    """
+
+    def __init__(self, nbLignes: int, nbColonnes: int, resolution: float = 0.05,
+                 origine: Tuple[float, float] = (0.0, 0.0)):
+        if nbLignes <= 0 or nbColonnes <= 0:
+            raise ValueError("La grille doit contenir au moins une cellule.")
+        if resolution <= 0:
+            raise ValueError("La résolution doit être positive.")
+        self._nbLignes: int = nbLignes
+        self._nbColonnes: int = nbColonnes
+        self._resolution: float = resolution          # Taille d'une cellule (m)
+        self._origine: Tuple[float, float] = origine  # Coordonnées monde du coin (0, 0)
+        # Liste plate : l'accès indexé en Python pur est plus rapide que sur un tableau NumPy
+        self._couts: List[float] = [1.0] * (nbLignes * nbColonnes)
+        self._observateurs: List[Callable[[List[Changement]], None]] = []
+
+    @classmethod
+    def fromArray(cls, couts: np.ndarray, resolution: float = 0.05,
+                  origine: Tuple[float, float] = (0.0, 0.0)) -> "GrilleOccupation":
+        """
+        Construit une grille à partir d'un tableau 2D de coûts (np.inf = obstacle).
+        """
+        couts = np.asarray(couts, dtype=float)
+        if np.any(couts < 1.0):
+            raise ValueError("Les coûts de traversée doivent être >= 1.")
+        grille = cls(couts.shape[0], couts.shape[1], resolution, origine)
+        grille._couts = couts.ravel().tolist()
+        return grille
+
+    # ---------- Getters ----------
+
+    def get_nb_lignes(self) -> int:
+        return self._nbLignes
+
+    def get_nb_colonnes(self) -> int:
+        return self._nbColonnes
+
+    def get_resolution(self) -> float:
+        return self._resolution
+
+    def get_cout(self, ligne: int, colonne: int) -> float:
+        return self._couts[self.index(ligne, colonne)]
+
+    def toArray(self) -> np.ndarray:
+        return np.array(self._couts).reshape(self._nbLignes, self._nbColonnes)
+
+    # ---------- Conversions ----------
+
+    def index(self, ligne: int, colonne: int) -> int:
+        if not (0 <= ligne < self._nbLignes and 0 <= colonne < self._nbColonnes):
+            raise ValueError(f"Cellule ({ligne}, {colonne}) hors de la grille.")
+        return ligne * self._nbColonnes + colonne
+
+    def cellule(self, index: int) -> Cellule:
+        return divmod(index, self._nbColonnes)
+
+    def versCellule(self, x: float, y: float) -> Cellule:
+        """
+        Coordonnées monde (m) → cellule (ligne = axe y, colonne = axe x), bornée à la grille.
+        """
+        colonne = int((x - self._origine[0]) // self._resolution)
+        ligne = int((y - self._origine[1]) // self._resolution)
+        return (min(max(ligne, 0), self._nbLignes - 1), min(max(colonne, 0), self._nbColonnes - 1))
+
+    def versMonde(self, ligne: int, colonne: int) -> Tuple[float, float]:
+        # Centre de la cellule
+        return (self._origine[0] + (colonne + 0.5) * self._resolution,
+                self._origine[1] + (ligne + 0.5) * self._resolution)
+
+    def estLibre(self, ligne: int, colonne: int) -> bool:
+        return self._couts[self.index(ligne, colonne)] != INF
+
+    # ---------- Modifications ----------
+
+    def ajouterObservateur(self, observateur: Callable[[List[Changement]], None]) -> None:
+        if observateur not in self._observateurs:
+            self._observateurs.append(observateur)
+
+    def retirerObservateur(self, observateur: Callable[[List[Changement]], None]) -> None:
+        if observateur in self._observateurs:
+            self._observateurs.remove(observateur)
+
+    def set_cout(self, ligne: int, colonne: int, cout: float) -> None:
+        self.set_couts({(ligne, colonne): cout})
+
+    def set_obstacle(self, ligne: int, colonne: int, obstacle: bool = True) -> None:
+        self.set_cout(ligne, colonne, INF if obstacle else 1.0)
+
+    def set_couts(self, couts: Dict[Cellule, float]) -> None:
+        """
+        Modifie plusieurs cellules à la fois ; les observateurs reçoivent un seul lot de changements.
+        """
+        changements: List[Changement] = []
+        for (ligne, colonne), cout in couts.items():
+            if cout < 1.0:
+                raise ValueError("Les coûts de traversée doivent être >= 1.")
+            i = self.index(ligne, colonne)
+            ancien = self._couts[i]
+            if ancien != cout:
+                self._couts[i] = cout
+                changements.append((i, ancien, cout))
+        if changements:
+            for observateur in self._observateurs:
+                observateur(changements)
+
+    def _voisins(self, i: int) -> List[int]:
+        # 4-connexité
+        W = self._nbColonnes
+        c = i % W
+        voisins = []
+        if i >= W:
+            voisins.append(i - W)
+        if i + W < len(self._couts):
+            voisins.append(i + W)
+        if c > 0:
+            voisins.append(i - 1)
+        if c < W - 1:
+            voisins.append(i + 1)
+        return voisins
+
+
+class ChampDistance:
+    """
+    Champ de distance vers un ensemble de cellules cibles (Dijkstra inverse).
+    - distance() est une lecture O(1) ; chemin() suit les pointeurs parents jusqu'à la cible.
+    - mettreAJour() répare le champ localement quand des coûts changent, sans tout recalculer.
+    La distance d'une cellule est la somme des coûts des cellules traversées pour atteindre la cible.
+    """
+
+    def __init__(self, grille: GrilleOccupation, cibles: Iterable[Cellule]):
+        self._grille: GrilleOccupation = grille
+        self._cibles: List[int] = [grille.index(l, c) for l, c in cibles]
+        if not self._cibles:
+            raise ValueError("Un champ de distance nécessite au moins une cellule cible.")
+        n = len(grille._couts)
+        self._dist: List[float] = [INF] * n
+        self._parent: List[int] = [-1] * n
+        self.calculer()
+
+    def calculer(self) -> None:
+        """
+        Recalcul complet du champ.
+        """
+        n = len(self._grille._couts)
+        self._dist = [INF] * n
+        self._parent = [-1] * n
+        tas = []
+        for i in self._cibles:
+            if self._grille._couts[i] != INF:
+                self._dist[i] = 0.0
+                tas.append((0.0, i))
+        self._propager(tas)
+
+    def _propager(self, tas: List[Tuple[float, int]]) -> None:
+        # Dijkstra à suppression paresseuse : relâche u depuis v avec dist[v] + coût(v)
+        grille = self._grille
+        couts = grille._couts
+        dist = self._dist
+        parent = self._parent
+        W = grille._nbColonnes
+        n = len(couts)
+        tas.sort()
+        while tas:
+            d, v = heappop(tas)
+            if d > dist[v]:
+                continue
+            nd = d + couts[v]
+            c = v % W
+            for u in (v - W, v + W, v - 1 if c > 0 else -1, v + 1 if c < W - 1 else -1):
+                if 0 <= u < n and nd < dist[u] and couts[u] != INF:
+                    dist[u] = nd
+                    parent[u] = v
+                    heappush(tas, (nd, u))
+
+    def mettreAJour(self, changements: List[Changement]) -> List[int]:
+        """
+        Réparation incrémentale après modification de coûts.
+        - Hausse de coût (ou nouvel obstacle) : le sous-arbre des plus courts chemins passant
+          par la cellule est invalidé puis ré-ensemencé depuis sa frontière.
+        - Baisse de coût (ou obstacle retiré) : la baisse est propagée depuis la cellule.
+        Retourne les index des cellules invalidées (liste vide si le champ a été recalculé en entier).
+        """
+        grille = self._grille
+        couts = grille._couts
+        dist = self._dist
+        parent = self._parent
+        cibles = set(self._cibles)
+
+        # 1. Invalidation des sous-arbres dépendant d'une cellule devenue plus chère
+        racines: List[int] = []
+        for k, ancien, nouveau in changements:
+            if nouveau > ancien:
+                if nouveau == INF:
+                    racines.append(k)
+                else:
+                    racines.extend(u for u in grille._voisins(k) if parent[u] == k)
+        invalides = self._sousArbre(racines, len(couts) // 4)
+        if invalides is None:
+            # Réparer une grande partie du champ coûte plus cher qu'un recalcul complet
+            self.calculer()
+            return []
+        for x in invalides:
+            dist[x] = INF
+            parent[x] = -1
+
+        # 2. Ré-ensemencement : frontière des zones invalidées + cellules devenues moins chères
+        tas: List[Tuple[float, int]] = []
+        for x in invalides:
+            if couts[x] == INF:
+                continue
+            if x in cibles:
+                dist[x] = 0.0
+                heappush(tas, (0.0, x))
+                continue
+            for v in grille._voisins(x):
+                if dist[v] != INF:
+                    nd = dist[v] + couts[v]
+                    if nd < dist[x]:
+                        dist[x] = nd
+                        parent[x] = v
+            if dist[x] != INF:
+                heappush(tas, (dist[x], x))
+        for k, ancien, nouveau in changements:
+            if nouveau < ancien:
+                if dist[k] == INF:
+                    if k in cibles:
+                        dist[k] = 0.0
+                    for v in grille._voisins(k):
+                        if dist[v] != INF and dist[v] + couts[v] < dist[k]:
+                            dist[k] = dist[v] + couts[v]
+                            parent[k] = v
+                if dist[k] != INF:
+                    heappush(tas, (dist[k], k))
+        self._propager(tas)
+        return invalides
+
+    def _sousArbre(self, racines: List[int], limite: int) -> Optional[List[int]]:
+        # Descendants des racines dans l'arbre des plus courts chemins ; None au-delà de limite
+        grille = self._grille
+        parent = self._parent
+        marque = set(racines)
+        pile = list(marque)
+        noeuds: List[int] = []
+        while pile:
+            x = pile.pop()
+            noeuds.append(x)
+            if len(noeuds) > limite:
+                return None
+            for u in grille._voisins(x):
+                if parent[u] == x and u not in marque:
+                    marque.add(u)
+                    pile.append(u)
+        return noeuds
+
+    def distance(self, ligne: int, colonne: int) -> float:
+        return self._dist[self._grille.index(ligne, colonne)]
+
+    def chemin(self, ligne: int, colonne: int) -> Optional[List[Cellule]]:
+        """
+        Chemin (liste de cellules) depuis (ligne, colonne) jusqu'à la cible la plus proche.
+        """
+        i = self._grille.index(ligne, colonne)
+        if self._dist[i] == INF:
+            return None
+        W = self._grille._nbColonnes
+        chemin = [divmod(i, W)]
+        while self._parent[i] != -1:
+            i = self._parent[i]
+            chemin.append(divmod(i, W))
+        return chemin
+
+    def toArray(self) -> np.ndarray:
+        return np.array(self._dist).reshape(self._grille._nbLignes, self._grille._nbColonnes)
+
+
+class PlanificateurAStar:
+    """
+    Planificateur de chemins sur GrilleOccupation.
+    - planifier() : A* à tas binaire sur des nœuds indexés par entier (4-connexité).
+    - Champs de distance mis en cache vers la zone de tri et chaque département :
+      distanceVers() est une lecture O(1), cheminVers() suit le champ.
+    - Replanification incrémentale : les champs sont réparés localement et seuls les chemins
+      mis en cache touchés par un changement sont recalculés.
+    """
+
+    def __init__(self, grille: GrilleOccupation):
+        self._grille: GrilleOccupation = grille
+        self._champs: Dict[str, ChampDistance] = {}
+        self._departements: List[str] = []
+        self._cheminsCache: Dict[Tuple[int, int], List[Cellule]] = {}
+        # Coût minimal d'une cellule : rend l'heuristique de Manhattan admissible
+        self._coutMin: float = min(grille._couts)
+        grille.ajouterObservateur(self._surChangement)
+
+    def get_grille(self) -> GrilleOccupation:
+        return self._grille
+
+    def get_departements(self) -> List[str]:
+        return list(self._departements)
+
+    # ---------- Champs de distance mis en cache ----------
+
+    def definirZoneTri(self, cibles: Iterable[Cellule]) -> None:
+        self._champs[ZONE_TRI] = ChampDistance(self._grille, cibles)
+
+    def ajouterDepartement(self, nom: str, cibles: Iterable[Cellule]) -> None:
+        if nom == ZONE_TRI:
+            raise ValueError(f"Le nom '{ZONE_TRI}' est réservé à la zone de tri.")
+        self._champs[nom] = ChampDistance(self._grille, cibles)
+        if nom not in self._departements:
+            self._departements.append(nom)
+
+    def possedeChamp(self, nom: str) -> bool:
+        return nom in self._champs
+
+    def get_champ(self, nom: str) -> ChampDistance:
+        if nom not in self._champs:
+            raise KeyError(f"Aucun champ de distance nommé '{nom}'.")
+        return self._champs[nom]
+
+    def distanceVers(self, nom: str, cellule: Cellule) -> float:
+        return self.get_champ(nom).distance(*cellule)
+
+    def cheminVers(self, nom: str, cellule: Cellule) -> Optional[List[Cellule]]:
+        return self.get_champ(nom).chemin(*cellule)
+
+    # ---------- A* ----------
+
+    def planifier(self, depart: Cellule, arrivee: Cellule) -> Optional[List[Cellule]]:
+        """
+        Plus court chemin de depart à arrivee (liste de cellules, extrémités incluses), ou None.
+        Les chemins sont mis en cache jusqu'à ce qu'un changement de la grille les invalide.
+        """
+        grille = self._grille
+        s = grille.index(*depart)
+        t = grille.index(*arrivee)
+        cle = (s, t)
+        if cle in self._cheminsCache:
+            return list(self._cheminsCache[cle])
+
+        couts = grille._couts
+        if couts[s] == INF or couts[t] == INF:
+            return None
+        W = grille._nbColonnes
+        n = len(couts)
+        lt, ct = divmod(t, W)
+        h0 = self._coutMin
+
+        g: Dict[int, float] = {s: 0.0}
+        parent: Dict[int, int] = {s: -1}
+        ls, cs = divmod(s, W)
+        # Entrées (f, -g, nœud) : à f égal, le nœud le plus avancé est développé en premier
+        tas = [((abs(ls - lt) + abs(cs - ct)) * h0, -0.0, s)]
+        while tas:
+            _, mg, v = heappop(tas)
+            if v == t:
+                break
+            gv = -mg
+            if gv > g[v]:
+                continue
+            c = v % W
+            for u in (v - W, v + W, v - 1 if c > 0 else -1, v + 1 if c < W - 1 else -1):
+                if u < 0 or u >= n:
+                    continue
+                cu = couts[u]
+                if cu == INF:
+                    continue
+                gu = gv + cu
+                if gu < g.get(u, INF):
+                    g[u] = gu
+                    parent[u] = v
+                    lu, cu_ = divmod(u, W)
+                    heappush(tas, (gu + (abs(lu - lt) + abs(cu_ - ct)) * h0, -gu, u))
+        else:
+            return None
+
+        chemin = []
+        i = t
+        while i != -1:
+            chemin.append(divmod(i, W))
+            i = parent[i]
+        chemin.reverse()
+        self._cheminsCache[cle] = chemin
+        return list(chemin)
+
+    # ---------- Replanification incrémentale ----------
+
+    def _surChangement(self, changements: List[Changement]) -> None:
+        for champ in self._champs.values():
+            champ.mettreAJour(changements)
+
+        self._coutMin = min(self._coutMin, min(nouveau for _, _, nouveau in changements))
+        if any(nouveau < ancien for _, ancien, nouveau in changements):
+            # Une baisse de coût peut raccourcir n'importe quel chemin
+            self._cheminsCache.clear()
+            return
+        # Hausse seule : seuls les chemins traversant une cellule modifiée sont invalidés
+        W = self._grille._nbColonnes
+        modifiees = {divmod(i, W) for i, _, _ in changements}
+        for cle in [cle for cle, chemin in self._cheminsCache.items() if not modifiees.isdisjoint(chemin)]:
+            del self._cheminsCache[cle]
+
+
+def simplifierChemin(chemin: List[Cellule]) -> List[Cellule]:
+    """
+    Ne conserve que les points de passage où la direction change (plus l'arrivée).
+    """
+    if len(chemin) <= 2:
+        return list(chemin[1:])
+    points = []
+    for precedent, courant, suivant in zip(chemin, chemin[1:], chemin[2:]):
+        if (courant[0] - precedent[0], courant[1] - precedent[1]) != (suivant[0] - courant[0], suivant[1] - courant[1]):
+            points.append(courant)
+    points.append(chemin[-1])
+    return points
@@ -0,0 +1,150 @@
+from typing import Optional, Sequence, Tuple
+import numpy as np
+
+Pose = Tuple[float, float, float]
+
+
+class OdometrieEncodeurs:
+    """
+    Odométrie différentielle à partir des compteurs d'encodeurs, intégrée par blocs.
+    Chaque bloc contient des échantillons horodatés (pas de temps variable) des compteurs gauche et
+    droit. Les incréments de chaque échantillon sont intégrés par la mise à jour exacte sur un arc
+    de cercle (vitesses constantes entre deux échantillons) :
+        Δx = Δs · sinc(Δθ/2) · cos(θ + Δθ/2),   Δy = Δs · sinc(Δθ/2) · sin(θ + Δθ/2)
+    où les θ de tous les échantillons s'obtiennent par une somme cumulée : le bloc entier est
+    traité par quelques opérations NumPy, sans boucle Python.
+    Covariance (optionnelle) : bruit de roue proportionnel à la distance parcourue
+    (variance kDroite·|Δd|, kGauche·|Δg|), propagée en forme fermée sur le bloc.
+    """
+
+    def __init__(self, ecartementRoues: float, metresParTick: float, covariance: bool = False,
+                 kDroite: float = 1e-4, kGauche: float = 1e-4, bitsCompteur: Optional[int] = None):
+        if ecartementRoues <= 0 or metresParTick <= 0:
+            raise ValueError("L'écartement des roues et la résolution des encodeurs doivent être positifs.")
+        self._ecartement: float = ecartementRoues
+        self._metresParTick: float = metresParTick
+        self._kDroite: float = kDroite
+        self._kGauche: float = kGauche
+        # Compteurs matériels sur N bits : les incréments sont corrigés du rebouclage
+        self._modulo: Optional[int] = None if bitsCompteur is None else 1 << bitsCompteur
+        self._covariance: Optional[np.ndarray] = np.zeros((3, 3)) if covariance else None
+        self._dernierTemps: Optional[float] = None
+        self._derniersTicks: Optional[Tuple[int, int]] = None
+        self._vitesses: Tuple[float, float] = (0.0, 0.0)
+        self._nbEchantillons: int = 0
+
+    # ---------- Getters / Setters ----------
+
+    def get_covariance(self) -> Optional[np.ndarray]:
+        return None if self._covariance is None else self._covariance.copy()
+
+    def set_covariance(self, covariance: np.ndarray) -> None:
+        self._covariance = np.array(covariance, dtype=float).reshape(3, 3)
+
+    def get_vitesses(self) -> Tuple[float, float]:
+        """
+        Vitesses (linéaire, angulaire) moyennes mesurées sur le dernier bloc.
+        """
+        return self._vitesses
+
+    def get_nb_echantillons(self) -> int:
+        return self._nbEchantillons
+
+    def reinitialiser(self) -> None:
+        """
+        Oublie les derniers compteurs : le prochain échantillon sert de nouvelle référence.
+        """
+        self._dernierTemps = None
+        self._derniersTicks = None
+        if self._covariance is not None:
+            self._covariance[:] = 0.0
+
+    # ---------- Intégration ----------
+
+    def _increments(self, temps: np.ndarray, ticksGauche: np.ndarray,
+                    ticksDroite: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Différences successives, en reprenant le dernier échantillon du bloc précédent
+        if self._derniersTicks is None:
+            self._dernierTemps = float(temps[0])
+            self._derniersTicks = (int(ticksGauche[0]), int(ticksDroite[0]))
+            temps, ticksGauche, ticksDroite = temps[1:], ticksGauche[1:], ticksDroite[1:]
+        dt = np.diff(temps, prepend=self._dernierTemps)
+        dG = np.diff(ticksGauche, prepend=self._derniersTicks[0])
+        dD = np.diff(ticksDroite, prepend=self._derniersTicks[1])
+        if self._modulo is not None:
+            moitie = self._modulo >> 1
+            dG = (dG + moitie) % self._modulo - moitie
+            dD = (dD + moitie) % self._modulo - moitie
+        if len(temps):
+            self._dernierTemps = float(temps[-1])
+            self._derniersTicks = (int(ticksGauche[-1]), int(ticksDroite[-1]))
+        return dt, dG * self._metresParTick, dD * self._metresParTick
+
+    def integrerBloc(self, pose: Pose, temps: Sequence[float], ticksGauche: Sequence[int],
+                     ticksDroite: Sequence[int]) -> Pose:
+        """
+        Intègre un bloc d'échantillons (temps en s, compteurs cumulés en ticks) à partir de pose.
+        Le tout premier échantillon reçu ne sert que de référence. Retourne la pose en fin de bloc.
+        """
+        temps = np.asarray(temps, dtype=float)
+        ticksGauche = np.asarray(ticksGauche, dtype=np.int64)
+        ticksDroite = np.asarray(ticksDroite, dtype=np.int64)
+        if not (len(temps) == len(ticksGauche) == len(ticksDroite)):
+            raise ValueError("Les temps et les compteurs doivent avoir la même longueur.")
+        if not len(temps):
+            return pose
+        dt, dG, dD = self._increments(temps, ticksGauche, ticksDroite)
+        if not len(dt):
+            return pose
+        self._nbEchantillons += len(dt)
+
+        x0, y0, theta0 = pose
+        ds = 0.5 * (dD + dG)
+        dTheta = (dD - dG) / self._ecartement
+        theta = theta0 + np.cumsum(dTheta)
+        milieu = theta - 0.5 * dTheta
+        # Corde de l'arc : sinc(Δθ/2) (np.sinc(u) = sin(πu)/(πu)), égal à 1 en ligne droite
+        corde = ds * np.sinc(dTheta / (2.0 * np.pi))
+        dx = corde * np.cos(milieu)
+        dy = corde * np.sin(milieu)
+
+        duree = float(dt.sum())
+        if duree > 0:
+            self._vitesses = (float(ds.sum()) / duree, float(dTheta.sum()) / duree)
+        if self._covariance is None:
+            return (x0 + float(dx.sum()), y0 + float(dy.sum()), float(theta[-1]))
+
+        x = x0 + np.cumsum(dx)
+        y = y0 + np.cumsum(dy)
+        self._propagerCovariance(x, y, x0, y0, ds, dTheta, milieu, dG, dD)
+        return (float(x[-1]), float(y[-1]), float(theta[-1]))
+
+    def _propagerCovariance(self, x: np.ndarray, y: np.ndarray, x0: float, y0: float, ds: np.ndarray,
+                            dTheta: np.ndarray, milieu: np.ndarray, dG: np.ndarray, dD: np.ndarray) -> None:
+        """
+        P_k = F_k P_{k-1} F_kᵀ + G_k Q_k G_kᵀ, avec F_k = I + [[0, 0, -Δy], [0, 0, Δx], [0, 0, 0]].
+        Le produit F_N ... F_{k+1} vaut I + [[0, 0, -(y_N - y_k)], [0, 0, x_N - x_k], [0, 0, 0]] :
+        toute la récurrence se ramène à une somme sur les échantillons.
+        """
+        b = self._ecartement
+        c, s = np.cos(milieu), np.sin(milieu)
+        n = len(ds)
+        # Jacobiennes de l'incrément (Δx, Δy, Δθ) par rapport à (Δd, Δg), approximation au point milieu
+        G = np.empty((n, 3, 2))
+        G[:, 0, 0] = 0.5 * c - ds / (2.0 * b) * s
+        G[:, 0, 1] = 0.5 * c + ds / (2.0 * b) * s
+        G[:, 1, 0] = 0.5 * s + ds / (2.0 * b) * c
+        G[:, 1, 1] = 0.5 * s - ds / (2.0 * b) * c
+        G[:, 2, 0] = 1.0 / b
+        G[:, 2, 1] = -1.0 / b
+        # Transport du bruit de l'échantillon k jusqu'à la fin du bloc
+        J = G.copy()
+        J[:, 0, :] -= (y[-1] - y)[:, None] * G[:, 2, :]
+        J[:, 1, :] += (x[-1] - x)[:, None] * G[:, 2, :]
+        # Somme des J_k Q_k J_kᵀ = AᵀA, avec A les colonnes de J_k pondérées par les écarts-types
+        ecarts = np.sqrt(np.stack((self._kDroite * np.abs(dD), self._kGauche * np.abs(dG)), axis=1))
+        A = (J * ecarts[:, None, :]).transpose(0, 2, 1).reshape(-1, 3)
+        F = np.eye(3)
+        F[0, 2] = -(y[-1] - y0)
+        F[1, 2] = x[-1] - x0
+        self._covariance = F @ self._covariance @ F.T + A.T @ A
@@ -0,0 +1,180 @@
+from typing import Callable, Dict, List, Optional
+import asyncio
+import time
+from robot_collector import RobotCollector
+
+
+class StatistiquesTache:
+    """
+    Compteurs temps réel d'une tâche périodique.
+    - gigue : retard du démarrage d'un tick par rapport à son instant de déclenchement (s).
+    - depassements : ticks dont l'exécution a duré plus d'une période.
+    - echeancesManquees : ticks terminés après leur échéance (déclenchement + période).
+    - ticksSautes : déclenchements abandonnés pour rattraper le retard.
+    """
+
+    def __init__(self, nom: str, periode: float):
+        self.nom: str = nom
+        self.periode: float = periode
+        self.nbTicks: int = 0
+        self.depassements: int = 0
+        self.echeancesManquees: int = 0
+        self.ticksSautes: int = 0
+        self.gigueMax: float = 0.0
+        self.gigueTotale: float = 0.0
+        self.dtMin: float = float("inf")
+        self.dtMax: float = 0.0
+        self.dureeMax: float = 0.0
+
+    def get_gigue_moyenne(self) -> float:
+        return self.gigueTotale / self.nbTicks if self.nbTicks else 0.0
+
+    def get_frequence_mesuree(self, duree: float) -> float:
+        return self.nbTicks / duree if duree > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return (f"{self.nom}: {self.nbTicks} ticks | gigue moy {self.get_gigue_moyenne() * 1e3:.3f} ms"
+                f" max {self.gigueMax * 1e3:.3f} ms | dépassements {self.depassements}"
+                f" | échéances manquées {self.echeancesManquees} | ticks sautés {self.ticksSautes}")
+
+
+class _Tache:
+    def __init__(self, nom: str, periode: float, callback: Callable[[float], None], groupe: Optional[str]):
+        self.nom = nom
+        self.periode = periode
+        self.callback = callback
+        self.groupe = groupe
+        self.stats = StatistiquesTache(nom, periode)
+        self.active = True
+
+
+class OrdonnanceurTempsReel:
+    """
+    Ordonnanceur asyncio à fréquences fixes.
+    Chaque tâche tourne à sa propre fréquence sur une même boucle d'événements ; son callback
+    reçoit le dt réellement mesuré depuis le tick précédent.
+    Les déclenchements sont calés sur une grille absolue (début + k * période) : le retard
+    d'un tick ne décale pas les suivants, et les ticks déjà dépassés sont sautés.
+    """
+
+    def __init__(self, horloge: Callable[[], float] = time.perf_counter):
+        self._horloge: Callable[[], float] = horloge
+        self._taches: List[_Tache] = []
+        self._arret: bool = False
+        self._dureeExecution: float = 0.0
+
+    def ajouterTache(self, nom: str, frequence: float, callback: Callable[[float], None],
+                     groupe: Optional[str] = None) -> None:
+        if frequence <= 0:
+            raise ValueError("La fréquence doit être positive.")
+        if any(t.nom == nom for t in self._taches):
+            raise ValueError(f"Une tâche nommée '{nom}' existe déjà.")
+        self._taches.append(_Tache(nom, 1.0 / frequence, callback, groupe))
+
+    def ajouterRobotCollector(self, robot: RobotCollector, frequenceControle: float = 100.0,
+                              frequenceVision: float = 30.0, frequenceOdometrie: float = 100.0,
+                              frequenceBatterie: float = 1.0) -> None:
+        """
+        Enregistre les tâches d'un collecteur (plusieurs robots peuvent partager l'ordonnanceur) :
+        perception (detectCube / pickUpCube), régulation PID (commande envoyée aux moteurs),
+        odométrie avec consommation de batterie (odometryStep()) et surveillance batterie.
+        Quand shouldReturnToSort() devient vrai, ou si la batterie est vide, les tâches du robot s'arrêtent.
+        """
+        nom = robot.get_name()
+
+        def perception(dt: float) -> None:
+            if robot.detectCube() is not None and robot.get_stock_actuel() < robot.get_stockage_max():
+                robot.pickUpCube()
+
+        def odometrie(dt: float) -> None:
+            try:
+                robot.odometryStep(dt)
+            except RuntimeError:
+                # Batterie vide : ce robot s'arrête, les autres continuent
+                robot.set_etat("à l'arrêt")
+                self.arreterGroupe(nom)
+
+        def batterie(dt: float) -> None:
+            if robot.shouldReturnToSort():
+                robot.set_etat("à l'arrêt")
+                self.arreterGroupe(nom)
+
+        robot.set_etat("en mouvement")
+        self.ajouterTache(f"{nom}/vision", frequenceVision, perception, nom)
+        self.ajouterTache(f"{nom}/controle", frequenceControle, robot.controlStep, nom)
+        self.ajouterTache(f"{nom}/odometrie", frequenceOdometrie, odometrie, nom)
+        self.ajouterTache(f"{nom}/batterie", frequenceBatterie, batterie, nom)
+
+    def arreterGroupe(self, groupe: str) -> None:
+        for tache in self._taches:
+            if tache.groupe == groupe:
+                tache.active = False
+
+    def arreter(self) -> None:
+        self._arret = True
+
+    def get_statistiques(self) -> Dict[str, StatistiquesTache]:
+        return {tache.nom: tache.stats for tache in self._taches}
+
+    def get_duree_execution(self) -> float:
+        return self._dureeExecution
+
+    def lancer(self, duree: float) -> None:
+        asyncio.run(self.executer(duree))
+
+    async def executer(self, duree: float) -> None:
+        """
+        Exécute toutes les tâches pendant duree secondes (ou jusqu'à arreter()).
+        """
+        self._arret = False
+        debut = self._horloge()
+        fin = debut + duree
+        await asyncio.gather(*(self._boucle(tache, debut, fin) for tache in self._taches))
+        self._dureeExecution = self._horloge() - debut
+
+    async def _boucle(self, tache: _Tache, debut: float, fin: float) -> None:
+        horloge = self._horloge
+        stats = tache.stats
+        periode = tache.periode
+        declenchement = debut
+        precedent = debut
+        while tache.active and not self._arret:
+            attente = min(declenchement, fin) - horloge()
+            if attente > 0:
+                await asyncio.sleep(attente)
+            else:
+                await asyncio.sleep(0)   # Laisse tourner les autres tâches même en retard
+            if not tache.active or self._arret:
+                break
+            maintenant = horloge()
+            if maintenant >= fin:
+                break
+            if maintenant < declenchement:
+                continue
+
+            gigue = maintenant - declenchement
+            dt = maintenant - precedent
+            precedent = maintenant
+            tache.callback(dt if stats.nbTicks else periode)
+            termine = horloge()
+
+            duree = termine - maintenant
+            stats.nbTicks += 1
+            stats.gigueTotale += gigue
+            stats.gigueMax = max(stats.gigueMax, gigue)
+            stats.dureeMax = max(stats.dureeMax, duree)
+            if stats.nbTicks > 1:
+                stats.dtMin = min(stats.dtMin, dt)
+                stats.dtMax = max(stats.dtMax, dt)
+            if duree > periode:
+                stats.depassements += 1
+            echeance = declenchement + periode
+            if termine > echeance:
+                stats.echeancesManquees += 1
+
+            declenchement = echeance
+            if termine > declenchement + periode:
+                # Déclenchements déjà dépassés : on les saute pour garder la cadence
+                sautes = int((termine - declenchement) / periode)
+                stats.ticksSautes += sautes
+                declenchement += sautes * periode
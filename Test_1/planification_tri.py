@@ -0,0 +1,156 @@
+from typing import List, Sequence, Tuple
+import numpy as np
+
+
+def distancesArticulaires(configurations: np.ndarray) -> np.ndarray:
+    """
+    Matrice (n, n) des déplacements articulaires Σ|Δq_i| entre n configurations du bras.
+    """
+    configurations = np.asarray(configurations, dtype=float)
+    return np.abs(configurations[:, None, :] - configurations[None, :, :]).sum(axis=2)
+
+
+class PlanificateurTri:
+    """
+    Ordre de dépôt minimisant le déplacement articulaire total du bras (somme des |Δq|),
+    depuis la configuration courante : problème du voyageur de commerce en chemin ouvert.
+    - Les dépôts vers une même configuration (même corbeille) sont regroupés : avec une
+      distance qui vérifie l'inégalité triangulaire, un ordre optimal les enchaîne toujours.
+    - Jusqu'à seuilExact configurations distinctes : Held-Karp (programmation dynamique sur
+      les sous-ensembles, O(2ⁿ·n²), vectorisée par sous-ensemble), optimal.
+    - Au-delà : plus proche voisin puis 2-opt jusqu'à ce qu'aucune inversion ne gagne.
+    """
+
+    def __init__(self, seuilExact: int = 10):
+        if seuilExact < 1:
+            raise ValueError("Le seuil de résolution exacte doit être au moins 1.")
+        self._seuilExact: int = seuilExact
+        self._dernierMode: str = ""
+
+    def get_seuil_exact(self) -> int:
+        return self._seuilExact
+
+    def get_dernier_mode(self) -> str:
+        """
+        "exact" ou "heuristique" selon la méthode utilisée par le dernier appel à ordonner().
+        """
+        return self._dernierMode
+
+    # ---------- Interface ----------
+
+    def ordonner(self, depart: Sequence[float], cibles: Sequence[Sequence[float]]) -> List[int]:
+        """
+        Permutation des indices de cibles (configurations articulaires des dépôts) à suivre
+        depuis la configuration depart.
+        """
+        if len(cibles) == 0:
+            return []
+        cibles = np.asarray(cibles, dtype=float)
+        distinctes, groupes = np.unique(cibles, axis=0, return_inverse=True)
+        groupes = groupes.ravel()
+        D = distancesArticulaires(np.vstack((np.asarray(depart, dtype=float)[None, :], distinctes)))
+        if len(distinctes) <= self._seuilExact:
+            self._dernierMode = "exact"
+            tournee = self._heldKarp(D)
+        else:
+            self._dernierMode = "heuristique"
+            tournee = self._deuxOpt(D, self._plusProcheVoisin(D))
+        # Tournée sur les configurations distinctes (0 = départ) → indices des cibles, groupés
+        membres: List[List[int]] = [[] for _ in range(len(distinctes))]
+        for i, g in enumerate(groupes.tolist()):
+            membres[g].append(i)
+        return [i for g in tournee for i in membres[g - 1]]
+
+    @staticmethod
+    def cout(depart: Sequence[float], cibles: Sequence[Sequence[float]], ordre: Sequence[int]) -> float:
+        """
+        Déplacement articulaire total pour visiter cibles dans l'ordre donné depuis depart.
+        """
+        if len(ordre) == 0:
+            return 0.0
+        chemin = np.vstack((np.asarray(depart, dtype=float)[None, :], np.asarray(cibles, dtype=float)[list(ordre)]))
+        return float(np.abs(np.diff(chemin, axis=0)).sum())
+
+    # ---------- Résolution ----------
+
+    @staticmethod
+    def _heldKarp(D: np.ndarray) -> List[int]:
+        # cout[S, j] : meilleur chemin depuis le départ (nœud 0) visitant l'ensemble S de cibles, fini en j
+        n = len(D) - 1
+        if n == 1:
+            return [1]
+        entre = D[1:, 1:]
+        cout = np.full((1 << n, n), np.inf)
+        precedent = np.full((1 << n, n), -1, dtype=np.int64)
+        for j in range(n):
+            cout[1 << j, j] = D[0, j + 1]
+        bits = 1 << np.arange(n)
+        for S in range(1, (1 << n) - 1):
+            # Prolongement de tous les chemins finissant dans S vers chaque cible hors de S
+            # (T = S ∪ {j} n'est complété qu'après S : les sous-ensembles sont parcourus par valeur croissante)
+            candidats = cout[S][:, None] + entre
+            meilleurs = candidats.argmin(axis=0)
+            hors = np.flatnonzero((S & bits) == 0)
+            T = S | bits[hors]
+            valeurs = candidats[meilleurs[hors], hors]
+            mieux = valeurs < cout[T, hors]
+            cout[T[mieux], hors[mieux]] = valeurs[mieux]
+            precedent[T[mieux], hors[mieux]] = meilleurs[hors[mieux]]
+        # Reconstruction depuis la meilleure fin
+        S = (1 << n) - 1
+        j = int(cout[S].argmin())
+        tournee = []
+        while j >= 0:
+            tournee.append(j + 1)
+            S, j = S ^ 1 << j, int(precedent[S, j])
+        return tournee[::-1]
+
+    @staticmethod
+    def _plusProcheVoisin(D: np.ndarray) -> List[int]:
+        restants = set(range(1, len(D)))
+        tournee, courant = [], 0
+        while restants:
+            courant = min(restants, key=D[courant].__getitem__)
+            restants.remove(courant)
+            tournee.append(courant)
+        return tournee
+
+    @staticmethod
+    def _deuxOpt(D: np.ndarray, tournee: List[int]) -> List[int]:
+        """
+        Inverse le segment tournee[i..j] tant qu'une inversion raccourcit le chemin ouvert
+        (départ fixe, fin libre).
+        """
+        d = D.tolist()
+        chemin = [0] + tournee
+        n = len(chemin)
+        ameliore = True
+        while ameliore:
+            ameliore = False
+            for i in range(1, n - 1):
+                a, b = chemin[i - 1], chemin[i]
+                dAB = d[a][b]
+                for j in range(i + 1, n):
+                    c = chemin[j]
+                    # Arêtes (a, b) et (c, e) remplacées par (a, c) et (b, e) ; pas de e en fin de chemin
+                    if j + 1 < n:
+                        e = chemin[j + 1]
+                        gain = dAB + d[c][e] - d[a][c] - d[b][e]
+                    else:
+                        gain = dAB - d[a][c]
+                    if gain > 1e-12:
+                        chemin[i:j + 1] = chemin[i:j + 1][::-1]
+                        ameliore = True
+                        b = chemin[i]
+                        dAB = d[a][b]
+        return chemin[1:]
+
+
+def simulerDepots(depart: Sequence[float], cibles: Sequence[Sequence[float]], ordre: Sequence[int],
+                  vitesseArticulaire: float = 1.0, dureeDepot: float = 1.0) -> Tuple[float, float]:
+    """
+    Temps de tri simulé : déplacement articulaire / vitesseArticulaire (rad/s) plus dureeDepot
+    par cube (descente, ouverture de la pince). Retourne (durée en s, cubes par minute).
+    """
+    duree = PlanificateurTri.cout(depart, cibles, ordre) / vitesseArticulaire + dureeDepot * len(ordre)
+    return duree, (60.0 * len(ordre) / duree if duree > 0 else 0.0)
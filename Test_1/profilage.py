@@ -0,0 +1,305 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, TextIO, Tuple
+import contextlib
+import functools
+import io
+import json
+import sys
+import threading
+import time
+from robot import Robot
+from robot_collector import RobotCollector, PIDController
+from robot_trieur import RobotTrieur
+
+# Méthodes instrumentées par défaut, par classe (seules celles définies dans la classe elle-même)
+METHODES_PAR_DEFAUT: Dict[type, Tuple[str, ...]] = {
+    Robot: ("move", "status", "recordStatus"),
+    RobotCollector: ("move", "updateOdometry", "controlStep", "detectCube", "pickUpCube", "storeCube",
+                     "shouldReturnToSort", "collectCycle", "returnToSort", "unloadCubes", "navigateTo"),
+    RobotTrieur: ("move", "classifyCube", "classifyBatch", "sortNextCube", "sortAll", "sortBatch",
+                  "navigateArmTo", "depositCube", "handleError", "calibrateSortingZone"),
+    PIDController: ("compute",),
+}
+
+QUANTILES: Tuple[float, ...] = (0.5, 0.9, 0.99, 0.999)
+
+
+class HistogrammeLatence:
+    """
+    Histogramme de latences à précision relative bornée (principe HDR) sur des entiers (ns).
+    Les valeurs < 2^bitsPrecision ont chacune leur case ; au-delà, chaque puissance de deux est
+    découpée en 2^(bitsPrecision-1) cases égales : erreur relative ≤ 2^(1-bitsPrecision)
+    (1.6 % par défaut), quelle que soit l'échelle, pour quelques milliers de compteurs.
+    """
+
+    def __init__(self, bitsPrecision: int = 7, valeurMax: int = 1 << 40):
+        if bitsPrecision < 2:
+            raise ValueError("Il faut au moins 2 bits de précision.")
+        self._bits: int = bitsPrecision
+        self._moitie: int = 1 << (bitsPrecision - 1)
+        self._valeurMax: int = valeurMax
+        self._compteurs: List[int] = [0] * (self.index(valeurMax) + 1)
+        self._nb: int = 0
+        self._total: int = 0
+        self._min: int = valeurMax      # get_min() vaut 0 tant que rien n'est enregistré
+        self._max: int = 0
+
+    # ---------- Cases ----------
+
+    def index(self, valeur: int) -> int:
+        # Case = exposant · 2^(bits-1) + mantisse sur bits bits (l'exposant vaut 0 pour les petites valeurs)
+        exposant = max(valeur.bit_length() - self._bits, 0)
+        return (exposant << (self._bits - 1)) + (valeur >> exposant)
+
+    def bornes(self, index: int) -> Tuple[int, int]:
+        """
+        Plus petite et plus grande valeur rangées dans la case index.
+        """
+        exposant = max(index // self._moitie - 1, 0)
+        mantisse = index - (exposant << (self._bits - 1))
+        return mantisse << exposant, ((mantisse + 1) << exposant) - 1
+
+    # ---------- Enregistrement ----------
+
+    def enregistrer(self, valeur: int) -> None:
+        if valeur > self._valeurMax:
+            valeur = self._valeurMax
+        exposant = valeur.bit_length() - self._bits
+        if exposant > 0:
+            self._compteurs[(exposant << (self._bits - 1)) + (valeur >> exposant)] += 1
+        else:
+            self._compteurs[valeur] += 1
+        if valeur > self._max:
+            self._max = valeur
+        if valeur < self._min:
+            self._min = valeur
+        self._nb += 1
+        self._total += valeur
+
+    def fusionner(self, autre: "HistogrammeLatence") -> None:
+        if (autre._bits, autre._valeurMax) != (self._bits, self._valeurMax):
+            raise ValueError("Les histogrammes doivent avoir la même précision et la même borne.")
+        if autre._nb == 0:
+            return
+        for i, nombre in enumerate(autre._compteurs):
+            if nombre:
+                self._compteurs[i] += nombre
+        self._min = min(self._min, autre._min)
+        self._max = max(self._max, autre._max)
+        self._nb += autre._nb
+        self._total += autre._total
+
+    def reinitialiser(self) -> None:
+        self._compteurs = [0] * len(self._compteurs)
+        self._nb = self._total = self._max = 0
+        self._min = self._valeurMax
+
+    # ---------- Lecture ----------
+
+    def get_nb(self) -> int:
+        return self._nb
+
+    def get_total(self) -> int:
+        return self._total
+
+    def get_min(self) -> int:
+        return self._min if self._nb else 0
+
+    def get_max(self) -> int:
+        return self._max
+
+    def get_moyenne(self) -> float:
+        return self._total / self._nb if self._nb else 0.0
+
+    def quantile(self, q: float) -> int:
+        """
+        Valeur sous laquelle se trouve la fraction q des mesures (borne haute de la case, ≤ max).
+        """
+        if self._nb == 0:
+            return 0
+        rang = max(1, int(q * self._nb + 0.5))
+        cumul = 0
+        for i, nombre in enumerate(self._compteurs):
+            cumul += nombre
+            if cumul >= rang:
+                return min(self.bornes(i)[1], self._max)
+        return self._max
+
+    def cases(self) -> List[Tuple[int, int]]:
+        """
+        Cases non vides : (borne haute en ns, nombre de mesures).
+        """
+        return [(self.bornes(i)[1], nombre) for i, nombre in enumerate(self._compteurs) if nombre]
+
+
+class Profileur:
+    """
+    Instrumentation optionnelle des méthodes chaudes des robots.
+    instrumenter() remplace chaque méthode listée par une enveloppe qui mesure sa durée
+    (time.perf_counter_ns) et l'enregistre dans un HistogrammeLatence par (méthode, robot) ;
+    desinstrumenter() remet les méthodes d'origine. Désactivé, rien n'est enveloppé : le coût
+    est nul. Les durées sont inclusives (pickUpCube() contient son appel à detectCube()).
+    """
+
+    def __init__(self, methodes: Optional[Dict[type, Iterable[str]]] = None, bitsPrecision: int = 7):
+        self._methodes: Dict[type, Tuple[str, ...]] = {classe: tuple(noms) for classe, noms in
+                                                       (methodes if methodes is not None else METHODES_PAR_DEFAUT).items()}
+        self._bitsPrecision: int = bitsPrecision
+        self._histogrammes: Dict[Tuple[str, str], HistogrammeLatence] = {}
+        self._originaux: List[Tuple[type, str, Callable]] = []
+        self._verrou: threading.Lock = threading.Lock()
+
+    # ---------- Activation ----------
+
+    def est_actif(self) -> bool:
+        return bool(self._originaux)
+
+    def instrumenter(self) -> None:
+        if self._originaux:
+            return
+        for classe, noms in self._methodes.items():
+            for nom in noms:
+                fonction = vars(classe).get(nom)
+                if fonction is None or not callable(fonction):
+                    continue
+                self._originaux.append((classe, nom, fonction))
+                setattr(classe, nom, self._envelopper(f"{classe.__name__}.{nom}", fonction))
+
+    def desinstrumenter(self) -> None:
+        for classe, nom, fonction in reversed(self._originaux):
+            setattr(classe, nom, fonction)
+        self._originaux = []
+
+    def __enter__(self) -> "Profileur":
+        self.instrumenter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.desinstrumenter()
+
+    def _envelopper(self, methode: str, fonction: Callable) -> Callable:
+        enregistrer = self._enregistrer
+        horloge = time.perf_counter_ns
+
+        @functools.wraps(fonction)
+        def enveloppe(objet, *args, **kwargs):
+            debut = horloge()
+            try:
+                return fonction(objet, *args, **kwargs)
+            finally:
+                enregistrer(methode, objet, horloge() - debut)
+
+        return enveloppe
+
+    def _enregistrer(self, methode: str, objet: Any, duree: int) -> None:
+        nomObjet = getattr(objet, "get_name", None)
+        cle = (methode, nomObjet() if nomObjet is not None else "")
+        with self._verrou:
+            histogramme = self._histogrammes.get(cle)
+            if histogramme is None:
+                histogramme = self._histogrammes[cle] = HistogrammeLatence(self._bitsPrecision)
+            histogramme.enregistrer(duree)
+
+    # ---------- Résultats ----------
+
+    def reinitialiser(self) -> None:
+        with self._verrou:
+            self._histogrammes = {}
+
+    def histogramme(self, methode: str, robot: Optional[str] = None) -> HistogrammeLatence:
+        """
+        Histogramme d'une méthode ("Classe.methode") pour un robot, ou tous robots confondus.
+        """
+        resultat = HistogrammeLatence(self._bitsPrecision)
+        with self._verrou:
+            for (nom, objet), histogramme in self._histogrammes.items():
+                if nom == methode and (robot is None or objet == robot):
+                    resultat.fusionner(histogramme)
+        return resultat
+
+    def instantane(self, parRobot: bool = True) -> Dict[str, Any]:
+        """
+        Copie sérialisable (JSON) des mesures : une entrée par méthode (et par robot si parRobot),
+        triée par temps total décroissant ; durées en nanosecondes.
+        """
+        with self._verrou:
+            groupes: Dict[Tuple[str, str], HistogrammeLatence] = {}
+            for (methode, robot), histogramme in self._histogrammes.items():
+                cle = (methode, robot if parRobot else "")
+                if cle not in groupes:
+                    groupes[cle] = HistogrammeLatence(self._bitsPrecision)
+                groupes[cle].fusionner(histogramme)
+        entrees = []
+        for (methode, robot), histogramme in groupes.items():
+            entree = {"methode": methode, "appels": histogramme.get_nb(), "total_ns": histogramme.get_total(),
+                      "moyenne_ns": histogramme.get_moyenne(), "min_ns": histogramme.get_min(),
+                      "max_ns": histogramme.get_max(),
+                      "quantiles_ns": {str(q): histogramme.quantile(q) for q in QUANTILES},
+                      "cases": histogramme.cases()}
+            if parRobot:
+                entree["robot"] = robot
+            entrees.append(entree)
+        entrees.sort(key=lambda entree: -entree["total_ns"])
+        return {"horodatage": time.time(), "precision_bits": self._bitsPrecision, "methodes": entrees}
+
+    def exporterJson(self, sortie: Any, parRobot: bool = True) -> None:
+        """
+        Écrit instantane() en JSON dans un fichier ouvert ou à un chemin.
+        """
+        if isinstance(sortie, str):
+            with open(sortie, "w", encoding="utf-8") as fichier:
+                json.dump(self.instantane(parRobot), fichier, ensure_ascii=False, indent=1)
+        else:
+            json.dump(self.instantane(parRobot), sortie, ensure_ascii=False, indent=1)
+
+    def rapportTexte(self, parRobot: bool = False) -> str:
+        """
+        Tableau par méthode (et par robot si parRobot) : appels, temps total, moyenne et quantiles.
+        """
+        lignes = [f"{'méthode':<34}{'robot':<14} {'appels':>9} {'total ms':>10} {'moy µs':>9}"
+                  f" {'p50 µs':>9} {'p99 µs':>9} {'max µs':>9}"]
+        for entree in self.instantane(parRobot)["methodes"]:
+            quantiles = entree["quantiles_ns"]
+            lignes.append(f"{entree['methode']:<34}{entree.get('robot', '*')[:13]:<14} {entree['appels']:>9,}"
+                          f" {entree['total_ns'] / 1e6:>10.2f} {entree['moyenne_ns'] / 1e3:>9.1f}"
+                          f" {quantiles['0.5'] / 1e3:>9.1f} {quantiles['0.99'] / 1e3:>9.1f}"
+                          f" {entree['max_ns'] / 1e3:>9.1f}")
+        return "\n".join(lignes)
+
+
+def main(arguments: Optional[List[str]] = None, sortie: Optional[TextIO] = None) -> Profileur:
+    """
+    Point d'entrée : python profilage.py [test_xxx ...] [--json FICHIER] [--par-robot] [--verbeux]
+    Exécute les scénarios de test.py (tous par défaut) avec l'instrumentation active, puis
+    affiche la répartition du temps par méthode.
+    """
+    import argparse
+    import test as scenarios
+
+    analyseur = argparse.ArgumentParser(description="Profilage par méthode des scénarios de test.py")
+    analyseur.add_argument("tests", nargs="*", help="fonctions test_xxx à exécuter (toutes par défaut)")
+    analyseur.add_argument("--json", help="exporte l'instantané JSON dans ce fichier")
+    analyseur.add_argument("--par-robot", action="store_true", help="une ligne par méthode et par robot")
+    analyseur.add_argument("--verbeux", action="store_true", help="laisse passer l'affichage des scénarios")
+    options = analyseur.parse_args(arguments)
+    sortie = sortie if sortie is not None else sys.stdout
+
+    noms = options.tests or [nom for nom in vars(scenarios) if nom.startswith("test_")]
+    profileur = Profileur()
+    with profileur:
+        for nom in noms:
+            scenario = getattr(scenarios, nom, None)
+            if scenario is None:
+                raise SystemExit(f"Scénario inconnu : {nom}")
+            if options.verbeux:
+                scenario()
+            else:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    scenario()
+    print(profileur.rapportTexte(options.par_robot), file=sortie)
+    if options.json:
+        profileur.exporterJson(options.json, parRobot=True)
+    return profileur
+
+
+if __name__ == "__main__":
+    main()
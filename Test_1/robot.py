@@ -1,5 +1,7 @@
 from typing import Optional, Tuple, Any
 from abc import ABC, abstractmethod
+from telemetrie import CONSOLE, Evenement, TelemetrieNulle
+from capteurs import Capteur, GestionnaireCapteurs
 
 class Robot(ABC): 
     def __init__(self, name : str):
@@ -9,7 +11,13 @@ class Robot(ABC):
         self.__vitesseAng : float = 0.0
         self.__batteryLevel : float = 100.0
         self.__etat : str = "à l'arrêt"
-        self.__activeSensors : list[Any] = []
+        # Dictionnaire ordonné (valeurs inutilisées) : appartenance en O(1), ordre d'ajout conservé
+        self.__activeSensors : dict[Any, None] = {}
+        # Échantillonnage des objets Capteur, créé au premier ajout
+        self.__capteurs : Optional[GestionnaireCapteurs] = None
+        # Télémétrie des événements (affichage immédiat par défaut) et identifiant interné du nom
+        self.__telemetrie : TelemetrieNulle = CONSOLE
+        self.__idTelemetrie : int = CONSOLE.identifiant(name)
 
     # ---------- Getters ----------
    
@@ -29,7 +37,15 @@ class Robot(ABC):
         return self.__etat
     
     def get_active_sensors(self) -> list[Any]:
-        return self.__activeSensors
+        return list(self.__activeSensors)
+
+    def get_gestionnaire_capteurs(self) -> GestionnaireCapteurs:
+        if self.__capteurs is None:
+            self.__capteurs = GestionnaireCapteurs()
+        return self.__capteurs
+
+    def get_telemetrie(self) -> TelemetrieNulle:
+        return self.__telemetrie
     
     # ---------- Setters ----------
     
@@ -37,6 +53,7 @@ class Robot(ABC):
         if not name:
             raise ValueError("Le nom ne peut pas être vide.")
         self.__name = name
+        self.__idTelemetrie = self.__telemetrie.identifiant(name)
     
     def set_position(self, x: float, y: float, theta: float) -> None:
         self.__position = (x, y, theta)
@@ -48,20 +65,62 @@ class Robot(ABC):
     def set_battery_level(self, niveau: float) -> None:
         if not (0.0 <= niveau <= 100.0):
             raise ValueError("Le niveau de batterie doit être entre 0 et 100.")
-        self._batteryLevel = niveau
+        self.__batteryLevel = niveau
 
     def set_etat(self, etat: str) -> None:
         if etat not in {"à l'arrêt", "en mouvement", "ramassage", "tri"}:
             raise ValueError("État invalide.")
         self.__etat = etat
 
+    def set_telemetrie(self, telemetrie: TelemetrieNulle) -> None:
+        self.__telemetrie = telemetrie
+        self.__idTelemetrie = telemetrie.identifiant(self.__name)
+
     def add_sensor(self, sensor: Any) -> None:
+        """
+        Ajoute un capteur ; un objet Capteur est en plus échantillonné à sa fréquence
+        par le gestionnaire de capteurs du robot (voir startSensors()).
+        """
         if sensor not in self.__activeSensors:
-            self.__activeSensors.append(sensor)
+            self.__activeSensors[sensor] = None
+            if isinstance(sensor, Capteur):
+                self.get_gestionnaire_capteurs().ajouter(sensor)
 
     def remove_sensor(self, sensor: Any) -> None:
         if sensor in self.__activeSensors:
-            self.__activeSensors.remove(sensor)
+            del self.__activeSensors[sensor]
+            if isinstance(sensor, Capteur) and self.__capteurs.get_capteur(sensor.get_nom()) is sensor:
+                self.__capteurs.retirer(sensor.get_nom())
+
+    # ---------- Capteurs ----------
+
+    def startSensors(self) -> None:
+        """
+        Démarre l'échantillonnage en arrière-plan (ordonnanceur + pool de threads pour les E/S bloquantes).
+        """
+        self.get_gestionnaire_capteurs().demarrer()
+
+    def stopSensors(self) -> None:
+        if self.__capteurs is not None:
+            self.__capteurs.arreter()
+
+    def get_sensor_period(self, nom: str) -> Optional[float]:
+        """
+        Période d'échantillonnage (s) du capteur nom, ou None s'il n'est pas enregistré.
+        """
+        if self.__capteurs is None:
+            return None
+        capteur = self.__capteurs.get_capteur(nom)
+        return None if capteur is None else capteur.get_periode()
+
+    def readSensor(self, nom: str, ageMax: Optional[float] = None) -> Any:
+        """
+        Dernière valeur en cache du capteur nom, sans attendre de lecture ;
+        None si le capteur est absent, jamais lu, ou plus ancien que ageMax secondes.
+        """
+        if self.__capteurs is None:
+            return None
+        return self.__capteurs.valeur(nom, ageMax)
 
     # ---------- Méthodes de comportement ----------
     
@@ -86,5 +145,21 @@ class Robot(ABC):
               f"Batterie: {self.get_battery_level():.1f}% | État: {self.get_etat()}")
         if self.get_active_sensors():
             print(f"Capteurs actifs: {', '.join(str(s) for s in self.get_active_sensors())}")
+            if self.__capteurs is not None:
+                for nom, stats in self.__capteurs.get_statistiques().items():
+                    print(f"  {nom}: {stats['frequenceMesuree']:.1f}/{stats['frequence']:.1f} Hz, "
+                          f"dernière lecture il y a {stats['anciennete'] * 1e3:.0f} ms")
         else:
             print("Aucun capteur actif.")
+
+    def recordStatus(self) -> None:
+        """
+        Variante de status() pour les boucles chargées : enregistre position et batterie
+        dans la télémétrie, sans formatage de chaîne.
+        """
+        x, y, theta = self.__position
+        self._tracer(Evenement.STATUT, x, y, theta, self.__batteryLevel)
+
+    def _tracer(self, code: int, *charge: float) -> None:
+        # Enregistre un événement (charge numérique, 4 valeurs au plus) dans la télémétrie du robot
+        self.__telemetrie.enregistrer(self.__idTelemetrie, code, *charge)
@@ -1,9 +1,27 @@
 from typing import Tuple, Optional, Any, Deque, List
 from collections import deque
-from math import cos, sin
+from math import cos, sin, atan2, hypot
 from robot import Robot
+from navigation import PlanificateurAStar, ZONE_TRI, Cellule, simplifierChemin
+from vision import DetecteurCube
+from telemetrie import Evenement
+from monde import CarteCubes
+from odometrie import OdometrieEncodeurs
+from energie import ChampEnergie
+from capteurs import CAPTEUR_CAMERA, CAPTEUR_ENCODEURS
 from abc import ABC
 
+# Distance (m) en deçà de laquelle un cube de la carte est considéré comme atteint
+RAYON_RAMASSAGE = 0.1
+
+# Ancienneté maximale d'une vitesse d'encodeurs en cache, en périodes du capteur : au-delà,
+# le capteur est considéré comme bloqué et les roues à l'arrêt
+PERIODES_ENCODEURS_MAX = 10
+
+# Pas de temps (s) de référence d'un appel à move() : la consommation forfaitaire (0.1 par move(),
+# ou ModeleEnergie.parPas) est ramenée à ce pas quand l'ordonnanceur cadence l'odométrie
+PAS_NOMINAL = 0.1
+
 # Si PIDController existe, on l'importe ; sinon, on peut définir un stub
 class PIDController:
     def __init__(self, kp: float, ki: float, kd: float):
@@ -46,6 +64,33 @@ class RobotCollector(Robot, ABC):
         self._stockageMax: int = stockageMax
         self._stockActuel: int = 0
         self._listeCubes: List[Any] = [] 
+        self._commande: Tuple[float, float] = (0.0, 0.0)   # Dernières commandes PID (lin, ang)
+        self._moteurs: Any = None          # Pilote moteurs (appelable (lin, ang)) ; None = stub
+
+        # Navigation (optionnelle) : planificateur A* sur grille + département visé ensuite
+        self._planificateur: Optional[PlanificateurAStar] = None
+        self._indexDepartement: int = 0
+
+        # Perception : caméra (objet exposant derniereImage() -> (numéro, image)) + détecteur HSV
+        self._camera: Any = None
+        self._detecteur: DetecteurCube = DetecteurCube()
+        self._dernierCrop: Any = None      # Image recadrée de la dernière détection
+        self._dernierNumero: int = -1      # Numéro de l'image dont vient _dernierCrop
+
+        # Modèle du monde (optionnel, partageable entre collecteurs) : cubes repérés non ramassés
+        self._carte: Optional[CarteCubes] = None
+        self._ciblesInaccessibles: set = set()
+        self._cibleAffectee: Optional[int] = None     # Cube attribué par un AllocateurCubes
+
+        # Chaîne de tri (ChaineTri, optionnelle) : file bornée vers les trieurs
+        self._chaineTri: Any = None
+
+        # Odométrie encodeurs haute fréquence (optionnelle), intégrée par blocs d'échantillons
+        self._odometrie: Optional[OdometrieEncodeurs] = None
+
+        # Champ d'énergie de retour (optionnel) : remplace le seuil fixe de 20 % et la consommation forfaitaire
+        self._energie: Optional[ChampEnergie] = None
+        self._retourDemande: bool = False    # Trajet interrompu : plus assez d'énergie pour aller plus loin
 
     # ---------- Getters / Setters supplémentaires ----------
 
@@ -66,31 +111,136 @@ class RobotCollector(Robot, ABC):
     def get_liste_cubes(self) -> List[Any]:
         return self._listeCubes
 
+    def get_commande(self) -> Tuple[float, float]:
+        return self._commande
+
+    def get_moteurs(self) -> Any:
+        return self._moteurs
+
+    def set_moteurs(self, moteurs: Any) -> None:
+        self._moteurs = moteurs
+
+    def get_planificateur(self) -> Optional[PlanificateurAStar]:
+        return self._planificateur
+
+    def set_planificateur(self, planificateur: Optional[PlanificateurAStar]) -> None:
+        self._planificateur = planificateur
+        self._indexDepartement = 0
+
+    def get_camera(self) -> Any:
+        return self._camera
+
+    def set_camera(self, cam: Any) -> None:
+        self._camera = cam
+        self._detecteur.reinitialiser()
+
+    def get_detecteur(self) -> DetecteurCube:
+        return self._detecteur
+
+    def get_carte(self) -> Optional[CarteCubes]:
+        return self._carte
+
+    def set_carte(self, carte: Optional[CarteCubes]) -> None:
+        self._carte = carte
+        self._ciblesInaccessibles = set()
+
+    def get_cible_affectee(self) -> Optional[int]:
+        return self._cibleAffectee
+
+    def set_cible_affectee(self, ident: Optional[int]) -> None:
+        self._cibleAffectee = ident
+
+    def set_detecteur(self, detecteur: DetecteurCube) -> None:
+        self._detecteur = detecteur
+
+    def get_chaine_tri(self) -> Any:
+        return self._chaineTri
+
+    def set_chaine_tri(self, chaine: Any) -> None:
+        self._chaineTri = chaine
+
+    def get_odometrie(self) -> Optional[OdometrieEncodeurs]:
+        return self._odometrie
+
+    def set_odometrie(self, odometrie: Optional[OdometrieEncodeurs]) -> None:
+        self._odometrie = odometrie
+
+    def get_energie(self) -> Optional[ChampEnergie]:
+        return self._energie
+
+    def set_energie(self, champ: Optional[ChampEnergie]) -> None:
+        self._energie = champ
+
     # ---------- Méthodes de collecte / mobilité ----------
 
-    def move(self) -> None:
+    def move(self, dt: float = 0.1) -> None:
         """
         Implémentation du move() pour RobotCollector.
         Utilise la cinématique différentielle pour mettre à jour la position.
         Intègre la détection de cube à chaque itération.
+        dt : pas de temps (s) depuis le dernier appel (mesuré par l'ordonnanceur en production).
         """
         # Vérification batterie + mise à jour d'état 
         super().move()
 
+        x0, y0, theta0 = self.get_position()
+        self.updateOdometry(dt)
+
+        # Tentative de détection et collecte d'un cube
+        cube_pos = self.detectCube()
+        if cube_pos and self._carte is not None:
+            # Le cube est mémorisé dans la carte : s'il n'est pas ramassé, un autre collecteur pourra le viser
+            self._carte.ajouter(*cube_pos)
+        if cube_pos and self._stockActuel < self._stockageMax:
+            success = self.pickUpCube()
+            if success:
+                self._tracer(Evenement.CUBE_RAMASSE, self._stockActuel, self._stockageMax)
+        
+        self._consommerPas(x0, y0, theta0)
+
+    def odometryStep(self, dt: float) -> None:
+        """
+        Pas de mobilité cadencé par OrdonnanceurTempsReel (la perception est une tâche séparée) :
+        vérification batterie et état comme move(), odométrie sur dt et consommation du pas,
+        la part forfaitaire étant ramenée à dt (PAS_NOMINAL).
+        """
+        super().move()
+        x0, y0, theta0 = self.get_position()
+        self.updateOdometry(dt)
+        self._consommerPas(x0, y0, theta0, dt / PAS_NOMINAL)
+
+    def _consommerPas(self, x0: float, y0: float, theta0: float, fraction: float = 1.0) -> None:
+        consommation = 0.1 * fraction  # Consommation d'énergie par mouvement
+        if self._energie is not None:
+            # Modèle énergétique : distance parcourue et rotation effectuées pendant ce pas,
+            # avec un minimum par pas (un robot immobile consomme aussi)
+            x1, y1, theta1 = self.get_position()
+            modele = self._energie.get_modele()
+            consommation = max(modele.coutDeplacement(hypot(x1 - x0, y1 - y0), theta1 - theta0),
+                               modele.parPas * fraction)
+        self._consommer(consommation)
+
+    def _consommer(self, consommation: float) -> None:
+        if self.get_battery_level() < consommation:
+            raise RuntimeError("Batterie insuffisante pour continuer le mouvement.")
+        self.set_battery_level(self.get_battery_level() - consommation)
+
+    def updateOdometry(self, dt: float) -> None:
+        """
+        Met à jour la position par cinématique différentielle sur le pas de temps dt.
+        """
         # Exemple de calcul de vitesse et mise à jour position :
         # - On suppose avoir des consignes cibles self._vitesseLin et self._vitesseAngulaire
         # - On lit les vitesses réelles des roues (stub ici à 0.0)
 
         "Cas 1 : Avec encoders ou capteurs de vitesse"
-        wheel_left_speed = 0.0
-        wheel_right_speed = 0.0
+        wheel_left_speed, wheel_right_speed = self.readWheelSpeeds()
 
         # Calcul de la vitesse linéaire et angulaire selon l'écartement des roues
         v = (wheel_right_speed + wheel_left_speed) / 2.0
         omega = (wheel_right_speed - wheel_left_speed) / self._ecartementRoues
 
-        # Mise à jour de la position (approximation Euler simple pour dt arbitraire)
-        dt = 0.1  # À remplacer par le vrai pas de temps en production
+        # Mise à jour de la position (approximation Euler simple sur le pas dt)
         x, y, theta = self.get_position()
         new_theta = theta + omega * dt
         new_x = x + v * dt * cos(theta)
@@ -103,26 +253,86 @@ class RobotCollector(Robot, ABC):
         omega = self._vitesseAngulaire 
         '''
 
-        # Tentative de détection et collecte d'un cube
-        cube_pos = self.detectCube()
-        if cube_pos and self._stockActuel < self._stockageMax:
-            success = self.pickUpCube()
-            if success:
-                print(f"Cube ramassé ! Stock actuel : {self._stockActuel}/{self._stockageMax}")
-        
-        consommation = 0.1  # Consommation d'énergie par mouvement
-        if self.get_battery_level() < consommation:
-            raise RuntimeError("Batterie insuffisante pour continuer le mouvement.")
-        self.set_battery_level(self.get_battery_level() - consommation)
+    def integrateEncoders(self, temps: Any, ticksGauche: Any, ticksDroite: Any) -> Tuple[float, float, float]:
+        """
+        Cas 1 à haute fréquence : intègre un bloc d'échantillons horodatés des compteurs
+        d'encodeurs (OdometrieEncodeurs, arc exact) et met la pose à jour une seule fois par bloc.
+        """
+        if self._odometrie is None:
+            raise RuntimeError("Aucune odométrie encodeurs définie (set_odometrie()).")
+        pose = self._odometrie.integrerBloc(self.get_position(), temps, ticksGauche, ticksDroite)
+        self.set_position(*pose)
+        return pose
+
+    def controlStep(self, dt: float) -> Tuple[float, float]:
+        """
+        Régulation des vitesses : _pidLin et _pidAng comparent les consignes get_vitesse()
+        aux vitesses mesurées par les encodeurs, sur le pas de temps mesuré dt.
+        Retourne les commandes (linéaire, angulaire), envoyées au pilote moteurs (set_moteurs())
+        s'il est défini (stub : seulement mémorisées).
+        """
+        wheel_left_speed, wheel_right_speed = self.readWheelSpeeds()
+        v = (wheel_right_speed + wheel_left_speed) / 2.0
+        omega = (wheel_right_speed - wheel_left_speed) / self._ecartementRoues
+        consigneLin, consigneAng = self.get_vitesse()
+        self._commande = (self._pidLin.compute(consigneLin, v, dt),
+                          self._pidAng.compute(consigneAng, omega, dt))
+        if self._moteurs is not None:
+            self._moteurs(*self._commande)
+        return self._commande
+
+    def readWheelSpeeds(self) -> Tuple[float, float]:
+        """
+        Lecture des encodeurs : dernière valeur en cache du capteur CAPTEUR_ENCODEURS
+        (échantillonné en arrière-plan, voir add_sensor()), sinon stub.
+        Une valeur plus ancienne que PERIODES_ENCODEURS_MAX périodes du capteur est ignorée :
+        l'odométrie n'intègre pas une vitesse figée par un capteur qui ne répond plus.
+        Retourne les vitesses réelles (gauche, droite) des roues en m/s.
+        """
+        periode = self.get_sensor_period(CAPTEUR_ENCODEURS)
+        if periode is not None:
+            vitesses = self.readSensor(CAPTEUR_ENCODEURS, PERIODES_ENCODEURS_MAX * periode)
+            if vitesses is not None:
+                return vitesses
+        # Implémenter la vraie lecture des encodeurs / capteurs de vitesse.
+        return (0.0, 0.0)
 
     def detectCube(self) -> Optional[Tuple[float, float]]:
         """
-        Stub de détection de cube.
-        Idéalement, on capture une image, on applique HSV + filtrage, etc.
-        Retourne (x_cube, y_cube) si un cube est détecté à portée, sinon None.
+        Détection de cube sur la dernière image de la caméra (HSV + composantes connexes).
+        Le détecteur garde en cache le résultat de chaque image : move() puis pickUpCube()
+        sur la même image ne lancent qu'une seule détection.
+        L'image vient du cache du capteur CAPTEUR_CAMERA s'il est enregistré (aucune attente
+        d'acquisition), sinon de la caméra définie par set_camera().
+        Avec une caméra à vues partagées (AnneauImages), une image réécrite pendant la détection
+        est écartée (est_valide()) : None, et le résultat est retiré du cache du détecteur.
+        Retourne (x_cube, y_cube) dans le repère de l'arène, ou None (aussi sans caméra).
         """
-        # Implémenter la vraie détection via OpenCV.
-        return None
+        derniere = self.readSensor(CAPTEUR_CAMERA)
+        if derniere is None:
+            if self._camera is None:
+                return None
+            derniere = self._camera.derniereImage()
+        numero, image = derniere
+        detection = self._detecteur.detecter(image, numero)
+        if not self._imageValide(numero):
+            self._detecteur.oublier(numero)
+            detection = None
+        if detection is None:
+            self._dernierCrop = None
+            return None
+        l0, c0, l1, c1 = detection.boite
+        self._dernierCrop = image[l0:l1, c0:c1]
+        self._dernierNumero = numero
+        avant, gauche = self._detecteur.versRobot(detection, image.shape)
+        x, y, theta = self.get_position()
+        return (x + avant * cos(theta) - gauche * sin(theta),
+                y + avant * sin(theta) + gauche * cos(theta))
+
+    def _imageValide(self, numero: int) -> bool:
+        # Seules les caméras à vues partagées (est_valide()) peuvent réécrire une image en cours d'usage
+        est_valide = getattr(self._camera, "est_valide", None)
+        return est_valide is None or est_valide(numero)
 
     def pickUpCube(self) -> bool:
         """
@@ -142,20 +352,69 @@ class RobotCollector(Robot, ABC):
 
         # Aligner le robot sur cube_pos, puis actionner le bras ou scoop pour ramasser.
         # Pour l'instant, on simule la prise :
+        crop = None
+        if self._dernierCrop is not None:
+            # Image recadrée conservée pour la classification par le RobotTrieur
+            # (écartée si la vue a été réécrite avant la copie)
+            crop = self._dernierCrop.copy()
+            if not self._imageValide(self._dernierNumero):
+                crop = None
+        return self.storeCube(cube_pos, crop)
+
+    def storeCube(self, cube_pos: Tuple[float, float], crop: Any = None) -> bool:
+        """
+        Range à bord un cube pris en (x, y) : ajout à _listeCubes (avec son image recadrée
+        éventuelle), incrément de _stockActuel, retrait de la carte, état "ramassage".
+        Retourne False si le stockage est plein.
+        """
+        if self._stockActuel >= self._stockageMax:
+            return False
         cube_obj = {"position": cube_pos}  # Exemple d'objet stub
+        if crop is not None:
+            cube_obj["crop"] = crop
         self._listeCubes.append(cube_obj)
         self._stockActuel += 1
+        if self._carte is not None:
+            self._carte.retirerProche(*cube_pos)
+        if self._energie is not None:
+            self.set_battery_level(max(0.0, self.get_battery_level() - self._energie.get_modele().parRamassage))
         self.set_etat("ramassage")
         return True
 
+    def emptyStorage(self) -> List[Any]:
+        """
+        Vide le stockage (dépôt en zone de tri) et renvoie les cubes transportés, dans l'ordre de ramassage.
+        """
+        cubes = self._listeCubes[:]
+        self._listeCubes.clear()
+        self._stockActuel = 0
+        return cubes
+
+    def restoreStorage(self, cubes: List[Any]) -> None:
+        """
+        Remplace la charge à bord par cubes (dans l'ordre de ramassage), par exemple à la reprise
+        d'un journal de flotte ; _stockActuel suit leur nombre. ValueError au-delà de stockageMax.
+        """
+        if len(cubes) > self._stockageMax:
+            raise ValueError("Le nombre de cubes dépasse la capacité de stockage.")
+        self._listeCubes[:] = cubes
+        self._stockActuel = len(cubes)
+
     def shouldReturnToSort(self) -> bool:
         """
         Retourne True si le robot doit retourner trier :
         - soit le stockage est plein
-        - soit la batterie est trop faible (on choisit 20% comme seuil par exemple)
+        - soit la batterie est trop faible : avec un champ d'énergie (set_energie()), elle ne couvre
+          plus un ramassage, le retour depuis la cellule courante (lecture O(1)) et la marge ;
+          sinon, seuil fixe de 20 %
+        - soit un trajet a été interrompu faute d'énergie pour revenir du point de passage suivant
         """
-        if self._stockActuel >= self._stockageMax:
+        if self._stockActuel >= self._stockageMax or self._retourDemande:
             return True
+        if self._energie is not None:
+            x, y, theta = self.get_position()
+            modele = self._energie.get_modele()
+            return self.get_battery_level() <= self._energie.energieEn(x, y, theta) + modele.parRamassage + modele.marge
         if self.get_battery_level() <= 20.0:
             return True
         return False
@@ -164,22 +423,50 @@ class RobotCollector(Robot, ABC):
         """
         Boucle principale de collecte.
         Tant que self.shouldReturnToSort() est False, le robot :
-        - se déplace vers le département suivant
+        - se déplace vers le cube connu le plus proche (carte partagée, si définie),
+          sinon vers le département suivant
         - cherche un cube via detectCube()
         - tente pickUpCube()
         - met à jour l'état en "ramassage"
         Dès que shouldReturnToSort() devient True, on appelle returnToSort().
         """
         while not self.shouldReturnToSort():
-            # Définir la logique pour choisir le prochain département ( surement ici sera l'algo de navigation A* , etc)
-            # Exemple : self.navigateTo(next_dept_x, next_dept_y)
-            # On simule un déplacement temporaire
-            self.set_vitesse(0.5, 0.0)  # avancer droit
-            self.move()
+            cible = self._choisirCible()
+            if cible is not None:
+                # Cube connu le plus proche (index spatial), réservé pour les autres collecteurs
+                ident, xC, yC = cible
+                stockAvant = self._stockActuel
+                if not self.navigateTo(xC, yC):
+                    self._ciblesInaccessibles.add(ident)
+                    self._carte.liberer(ident)
+                    continue
+                x, y, _ = self.get_position()
+                if self._stockActuel > stockAvant or hypot(xC - x, yC - y) <= RAYON_RAMASSAGE:
+                    # Sur place : ramassé ou disparu, le cube sort de la carte
+                    self._carte.retirer(ident)
+                else:
+                    # Pas encore atteint (pas de planificateur, trajet interrompu) : le cube reste
+                    # en carte et redevient disponible pour les autres collecteurs
+                    self._carte.liberer(ident)
+            elif self._planificateur is not None and self._planificateur.get_departements():
+                # Départements visités à tour de rôle, via leurs champs de distance en cache
+                departements = self._planificateur.get_departements()
+                nom = departements[self._indexDepartement % len(departements)]
+                self._indexDepartement += 1
+                chemin = self._planificateur.cheminVers(nom, self._celluleCourante())
+                if chemin is not None:
+                    self._suivreChemin(chemin, interruptible=True)
+                else:
+                    self.set_vitesse(0.5, 0.0)
+                    self.move()
+            else:
+                # Pas de carte : on simule un déplacement droit
+                self.set_vitesse(0.5, 0.0)  # avancer droit
+                self.move()
 
             # Tentative de ramassage
             if self.pickUpCube():
-                print("Cube collecté pendant la boucle.")
+                self._tracer(Evenement.CUBE_COLLECTE)
             self.set_etat("en mouvement")
 
         # On revient trier
@@ -188,11 +475,110 @@ class RobotCollector(Robot, ABC):
     def returnToSort(self) -> None:
         """
         Planifie et exécute le chemin vers la zone de tri (coordonnées fixes ou repérées).
-        Appelle ensuite le tri via une classe RobotTrieur ou le stub de dépôt.
+        Appelle ensuite le tri via une classe RobotTrieur ou le stub de dépôt ; avec une chaîne
+        de tri (set_chaine_tri()), les cubes lui sont remis par unloadCubes().
         """
-        # Planifier un chemin vers la zone de tri (ex. coordonnées (0, 0))
-        # On simule la navigation :
-        self.set_vitesse(0.5, 0.0)
-        self.move()
+        chemin = None
+        if self._planificateur is not None and self._planificateur.possedeChamp(ZONE_TRI):
+            # Lecture O(1) dans le champ de distance de la zone de tri, puis descente de gradient
+            chemin = self._planificateur.cheminVers(ZONE_TRI, self._celluleCourante())
+        self._retourDemande = False
+        if chemin is not None:
+            self._suivreChemin(chemin)
+        else:
+            # Pas de carte (ou zone inaccessible) : on simule la navigation
+            self.set_vitesse(0.5, 0.0)
+            self.move()
         self.set_etat("tri")
-        print("Arrivé à la zone de tri, prêt pour le tri.")
+        x, y, _ = self.get_position()
+        self._tracer(Evenement.ARRIVEE_TRI, x, y)
+        if self._chaineTri is not None:
+            self.unloadCubes()
+
+    def unloadCubes(self, timeout: Optional[float] = None) -> int:
+        """
+        Remet les cubes transportés à la chaîne de tri, dans l'ordre de ramassage.
+        Bloque tant que la file est pleine (contre-pression) ; les cubes refusés (délai expiré,
+        chaîne fermée) restent à bord. Retourne le nombre de cubes remis.
+        """
+        remis = 0
+        for cube in self._listeCubes:
+            if not self._chaineTri.deposer(cube, timeout):
+                break
+            remis += 1
+        del self._listeCubes[:remis]
+        self._stockActuel -= remis
+        return remis
+
+    def _choisirCible(self) -> Optional[Tuple[int, float, float]]:
+        """
+        Cube attribué par l'allocateur de flotte s'il est toujours dans la carte et que ce robot en
+        obtient la réservation ; sinon cube non ramassé le plus proche, non réservé par un autre
+        collecteur, réservé au nom de ce robot.
+        None sans carte ou si aucun cube n'est disponible.
+        """
+        if self._carte is None:
+            return None
+        ident = self._cibleAffectee
+        # La cible attribuée n'est suivie que si sa réservation est (encore) à ce robot
+        if ident is not None and ident not in self._ciblesInaccessibles and self._carte.reserver(ident, self.get_name()):
+            return (ident, *self._carte.get_position(ident))
+        x, y, _ = self.get_position()
+        cible = self._carte.plusProche(x, y, proprietaire=self.get_name(), exclus=self._ciblesInaccessibles)
+        if cible is not None:
+            self._carte.reserver(cible[0], self.get_name())
+        return cible
+
+    def navigateTo(self, x: float, y: float) -> bool:
+        """
+        Planifie un chemin A* jusqu'à (x, y) puis le suit.
+        Sans planificateur, se contente d'avancer droit (comportement historique).
+        Retourne False si la cible est inaccessible.
+        """
+        if self._planificateur is None:
+            self.set_vitesse(0.5, 0.0)
+            self.move()
+            return True
+        grille = self._planificateur.get_grille()
+        chemin = self._planificateur.planifier(self._celluleCourante(), grille.versCellule(x, y))
+        if chemin is None:
+            return False
+        self._suivreChemin(chemin, interruptible=True)
+        return True
+
+    def _celluleCourante(self) -> Cellule:
+        x, y, _ = self.get_position()
+        return self._planificateur.get_grille().versCellule(x, y)
+
+    def _suivreChemin(self, chemin: List[Cellule], interruptible: bool = False) -> bool:
+        """
+        Suit un chemin de cellules en ne visant que les points où la direction change.
+        Stub : chaque point de passage est supposé atteint après un appel à move() ; avec un
+        champ d'énergie, le trajet restant jusqu'au point (distance et rotation) est facturé.
+        interruptible : s'arrête avant un point d'où le retour au tri ne serait plus assuré
+        (shouldReturnToSort() devient vrai). Retourne False si le chemin a été interrompu.
+        """
+        grille = self._planificateur.get_grille()
+        pointsPassage = simplifierChemin(chemin)
+        if not pointsPassage:
+            # Déjà sur place : un seul pas pour détecter/ramasser
+            self.move()
+            return True
+        for ligne, colonne in pointsPassage:
+            xP, yP = grille.versMonde(ligne, colonne)
+            x, y, _ = self.get_position()
+            self.set_vitesse(0.5, 0.0)
+            self.move()
+            cap = atan2(yP - y, xP - x)
+            if self._energie is not None:
+                x1, y1, theta1 = self.get_position()
+                rotation = atan2(sin(cap - theta1), cos(cap - theta1))
+                modele = self._energie.get_modele()
+                cout = modele.coutDeplacement(hypot(xP - x1, yP - y1), rotation)
+                if interruptible and self.get_battery_level() < (cout + self._energie.energieEn(xP, yP, cap)
+                                                                 + modele.parRamassage + modele.marge):
+                    self._retourDemande = True
+                    return False
+                self._consommer(cout)
+            self.set_position(xP, yP, cap)
+        return True
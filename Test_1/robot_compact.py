@@ -0,0 +1,164 @@
+from typing import Any, List, Optional, Tuple
+from abc import ABC, abstractmethod
+from enum import IntEnum
+from telemetrie import CONSOLE, Evenement, TelemetrieNulle
+
+
+class EtatRobot(IntEnum):
+    """
+    Codes compacts des états d'un robot (un entier au lieu d'une chaîne).
+    """
+    ARRET = 0
+    MOUVEMENT = 1
+    RAMASSAGE = 2
+    TRI = 3
+
+
+# Libellés historiques, indexés par code (même ordre que EtatRobot)
+LIBELLES_ETAT: Tuple[str, ...] = ("à l'arrêt", "en mouvement", "ramassage", "tri")
+CODES_ETAT = {libelle: int(code) for code, libelle in enumerate(LIBELLES_ETAT)}
+
+
+class RobotCompact(ABC):
+    """
+    RobotCompact : variante mémoire-compacte de Robot, avec la même API publique.
+    - __slots__ : pas de __dict__ par instance.
+    - La position est stockée en trois flottants (aucun tuple alloué par set_position()).
+    - L'état est un code entier EtatRobot ; get_etat() renvoie toujours le libellé.
+    - Les capteurs sont stockés dans un tuple immuable (partagé tant qu'il est vide) ;
+      get_active_sensors() en renvoie une liste, comme Robot.
+    - Pas de gestionnaire de capteurs : un Capteur ajouté n'est pas échantillonné ;
+      startSensors() / stopSensors() ne font rien, readSensor() et get_sensor_period()
+      renvoient None (comme Robot sans capteur enregistré).
+    Les sous-classes doivent déclarer leurs propres __slots__ pour rester compactes.
+    """
+
+    __slots__ = ("__name", "__x", "__y", "__theta", "__vitesseLin", "__vitesseAng",
+                 "__batteryLevel", "__etat", "__activeSensors", "__telemetrie", "__idTelemetrie")
+
+    def __init__(self, name: str):
+        self.__name: str = name
+        self.__x: float = 0.0
+        self.__y: float = 0.0
+        self.__theta: float = 0.0
+        self.__vitesseLin: float = 0.0
+        self.__vitesseAng: float = 0.0
+        self.__batteryLevel: float = 100.0
+        self.__etat: int = EtatRobot.ARRET
+        self.__activeSensors: Tuple[Any, ...] = ()     # tuple vide partagé tant qu'aucun capteur
+        self.__telemetrie: TelemetrieNulle = CONSOLE
+        self.__idTelemetrie: int = CONSOLE.identifiant(name)
+
+    # ---------- Getters ----------
+
+    def get_name(self) -> str:
+        return self.__name
+
+    def get_position(self) -> Tuple[float, float, float]:
+        return (self.__x, self.__y, self.__theta)
+
+    def get_vitesse(self) -> Tuple[float, float]:
+        return (self.__vitesseLin, self.__vitesseAng)
+
+    def get_battery_level(self) -> float:
+        return self.__batteryLevel
+
+    def get_etat(self) -> str:
+        return LIBELLES_ETAT[self.__etat]
+
+    def get_etat_code(self) -> EtatRobot:
+        return EtatRobot(self.__etat)
+
+    def get_active_sensors(self) -> List[Any]:
+        return list(self.__activeSensors)
+
+    def get_telemetrie(self) -> TelemetrieNulle:
+        return self.__telemetrie
+
+    # ---------- Setters ----------
+
+    def set_name(self, name: str) -> None:
+        if not name:
+            raise ValueError("Le nom ne peut pas être vide.")
+        self.__name = name
+        self.__idTelemetrie = self.__telemetrie.identifiant(name)
+
+    def set_position(self, x: float, y: float, theta: float) -> None:
+        self.__x = x
+        self.__y = y
+        self.__theta = theta
+
+    def set_vitesse(self, vitesseLin: float, vitesseAng: float) -> None:
+        self.__vitesseLin = vitesseLin
+        self.__vitesseAng = vitesseAng
+
+    def set_battery_level(self, niveau: float) -> None:
+        if not (0.0 <= niveau <= 100.0):
+            raise ValueError("Le niveau de batterie doit être entre 0 et 100.")
+        self.__batteryLevel = niveau
+
+    def set_etat(self, etat: str) -> None:
+        code = CODES_ETAT.get(etat)
+        if code is None:
+            raise ValueError("État invalide.")
+        self.__etat = code
+
+    def set_etat_code(self, code: EtatRobot) -> None:
+        self.__etat = int(EtatRobot(code))
+
+    def set_telemetrie(self, telemetrie: TelemetrieNulle) -> None:
+        self.__telemetrie = telemetrie
+        self.__idTelemetrie = telemetrie.identifiant(self.__name)
+
+    def add_sensor(self, sensor: Any) -> None:
+        if sensor not in self.__activeSensors:
+            self.__activeSensors += (sensor,)
+
+    def remove_sensor(self, sensor: Any) -> None:
+        if sensor in self.__activeSensors:
+            self.__activeSensors = tuple(s for s in self.__activeSensors if s != sensor)
+
+    def startSensors(self) -> None:
+        pass
+
+    def stopSensors(self) -> None:
+        pass
+
+    def get_sensor_period(self, nom: str) -> Optional[float]:
+        return None
+
+    def readSensor(self, nom: str, ageMax: Optional[float] = None) -> Any:
+        return None
+
+    # ---------- Méthodes de comportement ----------
+
+    @abstractmethod
+    def move(self):
+        """
+        - A redéfinir dans chaque sous-classe.
+        - Vérifier la batterie et mettre à jour l'état.
+        """
+        if self.__batteryLevel <= 0:
+            self.__etat = EtatRobot.ARRET
+            raise RuntimeError("Batterie vide, le robot ne peut pas se déplacer.")
+        self.__etat = EtatRobot.MOUVEMENT
+
+    def status(self) -> None:
+        """
+        Affiche un résumé des attributs essentiels du robot.
+        """
+        print(f"Robot '{self.__name}' | Position: ({self.__x:.2f}, {self.__y:.2f}, θ={self.__theta:.2f}) | "
+              f"Batterie: {self.__batteryLevel:.1f}% | État: {LIBELLES_ETAT[self.__etat]}")
+        if self.__activeSensors:
+            print(f"Capteurs actifs: {', '.join(str(s) for s in self.__activeSensors)}")
+        else:
+            print("Aucun capteur actif.")
+
+    def recordStatus(self) -> None:
+        """
+        Variante de status() sans formatage : position et batterie enregistrées dans la télémétrie.
+        """
+        self._tracer(Evenement.STATUT, self.__x, self.__y, self.__theta, self.__batteryLevel)
+
+    def _tracer(self, code: int, *charge: float) -> None:
+        self.__telemetrie.enregistrer(self.__idTelemetrie, code, *charge)
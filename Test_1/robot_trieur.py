@@ -1,6 +1,13 @@
-from typing import Tuple, Any, List, Dict
+from typing import Tuple, Any, List, Dict, Optional
 from abc import ABC
 from robot import Robot
+from classification import ClassifieurCouleur
+from cinematique_bras import BrasPlanaire, TableIK
+from telemetrie import Evenement
+from capteurs import CAPTEUR_CAMERA_TRI
+from planification_tri import PlanificateurTri
+from vision import DetecteurCube
+from calibration import CalibrateurZone
 
 class RobotTrieur(Robot, ABC):
     """
@@ -8,7 +15,8 @@ class RobotTrieur(Robot, ABC):
     Spécialisé dans la phase de tri/dépôt dans les corbeilles à l'aide d'un bras articulé.
     """
 
-    def __init__(self, name: str, nbArticulations: int, corbeilles: Dict[str, Tuple[float, float]], seuilConfiance: float = 0.7):
+    def __init__(self, name: str, nbArticulations: int, corbeilles: Dict[str, Tuple[float, float]], seuilConfiance: float = 0.7,
+                 longueursSegments: Optional[List[float]] = None):
         super().__init__(name)
 
         self._nbArticulations: int = nbArticulations
@@ -19,11 +27,31 @@ class RobotTrieur(Robot, ABC):
         self._corbeilles: Dict[str, Tuple[float, float]] = corbeilles
 
         # Caméra utilisée pour la classification ou pour lire des QR Codes
+        # (objet exposant derniereImage() -> (numéro, image), par exemple un AnneauImages)
         self._cameraTri: Any = None
+        self._detecteurTri: DetecteurCube = DetecteurCube()
 
         # Seuil de confiance pour la classification d’un cube (si on utilise un CNN ou HSV)
         self._seuilConfiance: float = seuilConfiance
 
+        # Classifieur HSV vectorisé, avec cache LRU des images déjà classées
+        self._classifieur: ClassifieurCouleur = ClassifieurCouleur()
+
+        # Géométrie du bras (0.5 m par segment par défaut) et table IK précalculée par corbeille
+        if longueursSegments is None:
+            longueursSegments = [0.5] * nbArticulations
+        if len(longueursSegments) != nbArticulations:
+            raise ValueError("Il faut une longueur de segment par articulation.")
+        self._bras: BrasPlanaire = BrasPlanaire(longueursSegments)
+        self._tableIK: TableIK = TableIK(self._bras)
+        self._tableIK.reconstruire(self._corbeilles)
+
+        # Ordre des dépôts d'une charge complète (sortBatch()) : déplacement articulaire minimal
+        self._planificateur: PlanificateurTri = PlanificateurTri()
+
+        # Calibration des corbeilles par marqueurs (None = stub historique de calibrateSortingZone())
+        self._calibrateur: Optional[CalibrateurZone] = None
+
 
     # ---------- Getters / Setters ----------
 
@@ -38,6 +66,9 @@ class RobotTrieur(Robot, ABC):
             raise ValueError("Le nombre d'angles doit correspondre au nombre d'articulations.")
         self._angles = new_angles
 
+    def get_bras(self) -> BrasPlanaire:
+        return self._bras
+
     def get_force_max(self) -> float:
         return self._forceMax
 
@@ -46,6 +77,18 @@ class RobotTrieur(Robot, ABC):
             raise ValueError("La force maximale doit être positive.")
         self._forceMax = f
 
+    def get_planificateur_tri(self) -> PlanificateurTri:
+        return self._planificateur
+
+    def set_planificateur_tri(self, planificateur: PlanificateurTri) -> None:
+        self._planificateur = planificateur
+
+    def get_calibrateur(self) -> Optional[CalibrateurZone]:
+        return self._calibrateur
+
+    def set_calibrateur(self, calibrateur: Optional[CalibrateurZone]) -> None:
+        self._calibrateur = calibrateur
+
     def get_corbeilles(self) -> Dict[str, Tuple[float, float]]:
         # Renvoie une copie pour ne pas exposer directement la référence interne
         return self._corbeilles.copy()
@@ -54,6 +97,7 @@ class RobotTrieur(Robot, ABC):
         if not mapping:
             raise ValueError("La carte des corbeilles ne peut pas être vide.")
         self._corbeilles = mapping
+        self._tableIK.reconstruire(self._corbeilles)
 
     def get_camera_tri(self) -> Any:
         return self._cameraTri
@@ -80,16 +124,35 @@ class RobotTrieur(Robot, ABC):
         """
         super().move()   # vérification de la batterie + etat = "en mouvement"
         self.set_etat("en mouvement")
-        print(f"[{self.get_name()}] Bras positionné selon angles {self._angles}.")
+        self._tracer(Evenement.BRAS_POSITIONNE, *self._angles[:4])   # 4 premiers angles au plus
 
 
     def classifyCube(self, cropImage: Any) -> str:
         """
         Classifie un cube à partir d'une image recadrée (cropImage).
-        - Stub : renvoie toujours "doute". À remplacer par HSV ou CNN.
-        - Doit renvoyer l’une des chaînes : "bleu", "vert", "rouge" ou "doute".
+        - Délègue à classifyBatch() avec un lot d'une image.
+        - Sans image, prend la dernière image en cache du capteur CAPTEUR_CAMERA_TRI (s'il est enregistré).
+        - Renvoie l’une des chaînes : "bleu", "vert", "rouge" ou "doute" (aussi sans image).
+        """
+        if cropImage is None:
+            cropImage = self.readSensor(CAPTEUR_CAMERA_TRI)
+        return self.classifyBatch([cropImage])[0]
+
+
+    def classifyBatch(self, crops: List[Any]) -> List[str]:
+        """
+        Classifie N images recadrées en un seul passage vectorisé (teinte moyenne HSV).
+        - Toute classification sous _seuilConfiance devient "doute", de même qu'une image absente (None).
+        - Les images déjà classées (ex. réinspection dans handleError()) sont lues dans le cache LRU.
         """
-        return "doute"
+        presentes = [i for i, crop in enumerate(crops) if crop is not None]
+        resultats = ["doute"] * len(crops)
+        if presentes:
+            couleurs, confiances = self._classifieur.classifierLot([crops[i] for i in presentes])
+            for i, couleur, confiance in zip(presentes, couleurs, confiances):
+                if confiance >= self._seuilConfiance:
+                    resultats[i] = couleur
+        return resultats
 
 
     def sortNextCube(self, listeCubes: List[Any]) -> None:
@@ -110,9 +173,98 @@ class RobotTrieur(Robot, ABC):
         # Récupération du cube (dernier ajouté)
         cube = listeCubes.pop()
 
-        # Stub : récupère l'image du cube pour classification (à implémenter)
-        cropImage = None  
+        cropImage = self.cropCube(cube)
         couleur = self.classifyCube(cropImage)
+        self.depositCube(couleur)
+
+
+    def sortAll(self, listeCubes: List[Any]) -> None:
+        """
+        Mode groupé de sortNextCube() : vide listeCubes dans le même ordre (dernier ajouté en premier),
+        mais classifie toute la charge en un seul appel à classifyBatch().
+        """
+        self._trierCharge(listeCubes, planifier=False)
+
+
+    def sortBatch(self, listeCubes: List[Any]) -> List[str]:
+        """
+        Tri planifié d'une charge complète : classification de tous les cubes (classifyBatch()),
+        puis dépôts dans l'ordre qui minimise le déplacement articulaire total depuis _angles
+        (planSortOrder()) au lieu de l'ordre LIFO. Vide listeCubes et retourne les couleurs
+        dans l'ordre des dépôts.
+        """
+        return self._trierCharge(listeCubes, planifier=True)
+
+
+    def _trierCharge(self, listeCubes: List[Any], planifier: bool) -> List[str]:
+        # Chemin de dépôt commun à sortAll() (ordre LIFO) et sortBatch() (ordre planifié)
+        if not listeCubes:
+            return []
+        cubes = listeCubes[::-1]
+        listeCubes.clear()
+        couleurs = self.classifyBatch([self.cropCube(cube) for cube in cubes])
+        if planifier:
+            couleurs = [couleurs[i] for i in self.planSortOrder(couleurs)]
+        for couleur in couleurs:
+            self.depositCube(couleur)
+        return couleurs
+
+
+    def planSortOrder(self, couleurs: List[str]) -> List[int]:
+        """
+        Ordre de dépôt (indices de couleurs) minimisant Σ|Δq| du bras depuis les angles actuels :
+        résolution exacte pour peu de corbeilles distinctes, heuristique au-delà (PlanificateurTri).
+        """
+        cibles = [self._anglesCorbeille(couleur) for couleur in couleurs]
+        return self._planificateur.ordonner(self._angles, cibles)
+
+
+    def _anglesCorbeille(self, couleur: str) -> Any:
+        # Configuration articulaire de dépôt dans la corbeille de couleur (table IK, comme depositCube())
+        xC, yC = self._corbeilles[couleur if couleur in self._corbeilles else "doute"]
+        angles = self._tableIK.angles(xC, yC)
+        return angles if angles is not None else self._tableIK.resoudreProche(xC, yC)[0]
+
+
+    def cropCube(self, cube: Any) -> Any:
+        """
+        Image recadrée associée à un cube (clé "crop" des cubes stub) ; à défaut, recadrage du
+        cube présenté à la caméra de tri (cropFromCamera()), ou None.
+        """
+        crop = cube.get("crop") if isinstance(cube, dict) else None
+        if crop is None and self._cameraTri is not None:
+            crop = self.cropFromCamera()
+        return crop
+
+
+    def cropFromCamera(self) -> Any:
+        """
+        Détecte le cube sur la dernière image de la caméra de tri et renvoie sa boîte sous forme
+        de tranche de l'image (vue NumPy, sans copie), ou None si aucun cube n'est visible.
+        Avec une caméra à vues partagées (AnneauImages), une image réécrite pendant la détection
+        est écartée (est_valide()) et une nouvelle tentative est faite sur la plus récente.
+        """
+        est_valide = getattr(self._cameraTri, "est_valide", None)
+        for _ in range(2):
+            numero, image = self._cameraTri.derniereImage()
+            if numero < 0:
+                return None
+            detection = self._detecteurTri.detecter(image, numero)
+            if est_valide is None or est_valide(numero):
+                break
+            self._detecteurTri.oublier(numero)
+        else:
+            return None
+        if detection is None:
+            return None
+        l0, c0, l1, c1 = detection.boite
+        return image[l0:l1, c0:c1]
+
+
+    def depositCube(self, couleur: str) -> None:
+        """
+        Oriente le bras vers la corbeille de couleur, exécute le placement et lâche le cube.
+        """
         if couleur not in self._corbeilles:
             couleur = "doute"
 
@@ -126,39 +278,55 @@ class RobotTrieur(Robot, ABC):
         # Lâche le cube
         self.release()
         self.set_etat("à l'arrêt")
-        print(f"Cube déposé dans la corbeille '{couleur}' aux coords ({xC}, {yC}).")
+        self._tracer(Evenement.CUBE_DEPOSE, self.get_telemetrie().identifiant(couleur), xC, yC)
 
 
     def calibrateSortingZone(self) -> None:
         """
-        Lit les QR Codes devant chaque corbeille pour mettre à jour leur position réelle.
-        Stub : on simule la reconnaissance ; on reconfirme juste la position actuelle.
+        Lit les marqueurs devant chaque corbeille pour mettre à jour leur position réelle.
+        - Avec un calibrateur (set_calibrateur()) et une caméra de tri : toutes les corbeilles sont
+          vérifiées sur une même image ; seules celles qui ont dérivé sont recalibrées (et tracées).
+        - Sinon (stub) : on reconfirme juste la position actuelle.
         """
+        if self._calibrateur is not None and self._cameraTri is not None:
+            nouvelles = self._calibrateur.calibrer(self._cameraTri, self._corbeilles)
+            for couleur, coords in nouvelles.items():
+                self._corbeilles[couleur] = coords
+                self._tracer(Evenement.CORBEILLE_CALIBREE, self.get_telemetrie().identifiant(couleur), *coords)
+            self._tableIK.reconstruire(self._corbeilles)
+            return
         for couleur, coords in self._corbeilles.items():
             true_coords = coords  # Stub : ici, on ferait lecture QR pour recalibrer
             self._corbeilles[couleur] = true_coords
-            print(f"Corbeille '{couleur}' calibrée à la position {true_coords}.")
+            self._tracer(Evenement.CORBEILLE_CALIBREE, self.get_telemetrie().identifiant(couleur), *true_coords)
+        # La table IK n'est recalculée que si une position a réellement changé
+        self._tableIK.reconstruire(self._corbeilles)
 
 
-    def handleError(self) -> None:
+    def handleError(self, cube: Any = None) -> None:
         """
         En cas d'échec de dépôt, on effectue une micro-rotation et on retente l’opération.
+        Si le cube est fourni, il est réinspecté (classification lue dans le cache) puis redéposé.
         """
-        print(f"[{self.get_name()}] Erreur détectée lors du dépôt, réessai en cours...")
+        self._tracer(Evenement.ERREUR_DEPOT)
         self.move()  # Nouveau positionnement du bras (stub)
-        print("Réessai de dépôt effectué.")
+        if cube is not None:
+            self.depositCube(self.classifyCube(self.cropCube(cube)))
+        self._tracer(Evenement.REESSAI_DEPOT)
 
 
     def navigateArmTo(self, xC: float, yC: float) -> None:
         """
         Calcule la cinématique inverse pour orienter le bras vers la position (xC, yC).
-        Met à jour self._angles en conséquence (stub simplifié).
+        Met à jour self._angles en conséquence :
+        - corbeille connue : lecture dans la table IK précalculée,
+        - autre cible : résolution démarrée depuis la solution en cache la plus proche.
         """
-        # Stub : on simule la mise à jour des angles pour toutes les articulations
-        # (ex. répartir une même valeur sur chaque articulation)
-        for i in range(self._nbArticulations):
-            self._angles[i] = 0.5  # Valeur arbitraire simulée
-        print(f"Navigation du bras vers ({xC}, {yC}) calculée, angles fixés à {self._angles}.")
+        angles = self._tableIK.angles(xC, yC)
+        if angles is None:
+            angles = self._tableIK.resoudreProche(xC, yC)[0]
+        self._angles = angles.tolist()
+        self._tracer(Evenement.BRAS_NAVIGUE, xC, yC)
 
 
     def release(self) -> None:
@@ -166,5 +334,5 @@ class RobotTrieur(Robot, ABC):
         Ouvre la pince pour déposer le cube.
         Stub : en pratique, on commanderait le servomoteur de la pince.
         """
-        print("Pince ouverte, cube relâché.")
+        self._tracer(Evenement.PINCE_OUVERTE)
 
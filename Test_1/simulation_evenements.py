@@ -0,0 +1,321 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from enum import IntEnum
+import heapq
+import math
+import numpy as np
+from monde import CarteCubes
+from robot_collector import RobotCollector
+from robot_trieur import RobotTrieur
+from energie import ChampEnergie
+
+
+class TypeEvenement(IntEnum):
+    """
+    Événements de la simulation de mission (l'ordre sert aussi à départager deux événements simultanés).
+    """
+    CUBE_APERCU = 0
+    ARRIVEE_CUBE = 1
+    SEUIL_BATTERIE = 2
+    ARRIVEE_TRI = 3
+    TRI_TERMINE = 4
+    RECHARGE_TERMINEE = 5
+
+
+# Entrée de l'échéancier : (instant, type, numéro d'ordre, robot, donnée)
+Echeance = Tuple[float, int, int, int, Any]
+
+
+class SimulateurMission:
+    """
+    Simulation à événements discrets d'une mission de collecte et de tri.
+    Au lieu d'appeler move() tous les 0.1 s, le temps simulé saute directement à l'événement
+    suivant d'un échéancier (tas binaire heapq) :
+    - CUBE_APERCU : un cube apparaît (processus de Poisson) et rejoint la CarteCubes partagée ;
+      les collecteurs libres partent vers le cube le plus proche (réservé) ;
+    - ARRIVEE_CUBE : le collecteur ramasse le cube (storeCube()), puis repart ou rentre trier
+      si shouldReturnToSort() ;
+    - SEUIL_BATTERIE : la batterie atteint le seuil en route (instant calculé à l'avance), le
+      collecteur abandonne sa cible et rentre ;
+    - ARRIVEE_TRI : la charge (emptyStorage()) est confiée au premier RobotTrieur libre, le
+      collecteur se recharge ;
+    - TRI_TERMINE : le trieur dépose effectivement les cubes (sortAll()) ;
+    - RECHARGE_TERMINEE : le collecteur redevient disponible.
+    Les trajets sont rectilignes à vitesse constante, la consommation proportionnelle à la distance.
+    Avec un champEnergie, la consommation suit son ModeleEnergie (mètres, rotations, ramassages),
+    les collecteurs l'utilisent dans shouldReturnToSort() et un collecteur ne part vers un cube
+    que si sa batterie couvre l'aller, le ramassage, le retour depuis le cube et la marge : le
+    seuil fixe (seuilBatterie) et les abandons en route disparaissent.
+    Tous les tirages passent par un générateur NumPy initialisé avec graine : deux simulations
+    de même graine produisent exactement la même suite d'événements.
+    """
+
+    def __init__(self, collecteurs: List[RobotCollector], trieurs: List[RobotTrieur], graine: int = 0,
+                 tailleArene: float = 10.0, tauxApparition: float = 0.05, nbCubesInitiaux: int = 0,
+                 vitesse: float = 0.5, consommation: float = 0.5, seuilBatterie: float = 20.0,
+                 tauxRecharge: float = 2.0, dureeTri: float = 4.0, zoneTri: Tuple[float, float] = (0.0, 0.0),
+                 garderJournal: bool = False, champEnergie: Optional[ChampEnergie] = None):
+        if not collecteurs or not trieurs:
+            raise ValueError("Il faut au moins un collecteur et un trieur.")
+        if vitesse <= 0 or tauxRecharge <= 0:
+            raise ValueError("La vitesse et le taux de recharge doivent être positifs.")
+        self._collecteurs: List[RobotCollector] = list(collecteurs)
+        self._trieurs: List[RobotTrieur] = list(trieurs)
+        self._rng: np.random.Generator = np.random.default_rng(graine)
+        self._tailleArene: float = tailleArene
+        self._tauxApparition: float = tauxApparition    # Cubes par seconde
+        self._vitesse: float = vitesse                  # m/s
+        self._consommation: float = consommation        # % de batterie par mètre
+        self._seuilBatterie: float = seuilBatterie
+        self._tauxRecharge: float = tauxRecharge        # % par seconde
+        self._dureeTri: float = dureeTri                # s par cube
+        self._zoneTri: Tuple[float, float] = zoneTri
+        self._carte: CarteCubes = CarteCubes(tailleCellule=max(tailleArene / 20.0, 0.1), rayonFusion=0.0)
+        self._champEnergie: Optional[ChampEnergie] = champEnergie
+        if champEnergie is not None:
+            self._consommation = champEnergie.get_modele().parMetre
+            self._seuilBatterie = 0.0
+
+        self._t: float = 0.0
+        self._echeancier: List[Echeance] = []
+        self._sequence: int = 0
+        # État de chaque collecteur : "libre", "cube", "tri" (trajet retour) ou "recharge"
+        self._etats: List[str] = ["libre"] * len(self._collecteurs)
+        # Trajet en cours : (départ, x0, y0, x1, y1, batterie au départ)
+        self._trajets: List[Optional[Tuple[float, float, float, float, float, float]]] = [None] * len(self._collecteurs)
+        self._trieursLibres: List[float] = [0.0] * len(self._trieurs)   # Instant où chaque trieur se libère
+        self._compteurs: Dict[TypeEvenement, int] = {type: 0 for type in TypeEvenement}
+        self._nbCollectes: int = 0
+        self._nbTries: int = 0
+        self._distance: float = 0.0
+        self._nbRetours: int = 0
+        self._batterieRetourTotale: float = 0.0
+        self._nbPannes: int = 0
+        self._journal: Optional[List[Tuple[float, str, int]]] = [] if garderJournal else None
+        self._traiteurs: Dict[int, Callable[[int, Any], None]] = {
+            TypeEvenement.CUBE_APERCU: self._surCubeApercu,
+            TypeEvenement.ARRIVEE_CUBE: self._surArriveeCube,
+            TypeEvenement.SEUIL_BATTERIE: self._surSeuilBatterie,
+            TypeEvenement.ARRIVEE_TRI: self._surArriveeTri,
+            TypeEvenement.TRI_TERMINE: self._surTriTermine,
+            TypeEvenement.RECHARGE_TERMINEE: self._surRechargeTerminee,
+        }
+
+        for robot in self._collecteurs:
+            robot.set_position(zoneTri[0], zoneTri[1], 0.0)
+            robot.set_carte(self._carte)
+            robot.set_energie(champEnergie)
+        for _ in range(nbCubesInitiaux):
+            self._planifier(0.0, TypeEvenement.CUBE_APERCU, -1, False)
+        if tauxApparition > 0:
+            self._planifier(self._rng.exponential(1.0 / tauxApparition), TypeEvenement.CUBE_APERCU, -1, True)
+
+    # ---------- Getters ----------
+
+    def get_temps(self) -> float:
+        return self._t
+
+    def get_carte(self) -> CarteCubes:
+        return self._carte
+
+    def get_nb_collectes(self) -> int:
+        return self._nbCollectes
+
+    def get_nb_tries(self) -> int:
+        return self._nbTries
+
+    def get_distance_parcourue(self) -> float:
+        return self._distance
+
+    def get_nb_retours(self) -> int:
+        return self._nbRetours
+
+    def get_batterie_retour_moyenne(self) -> float:
+        """
+        Batterie restante moyenne à l'arrivée en zone de tri (énergie rapportée sans servir).
+        """
+        return self._batterieRetourTotale / self._nbRetours if self._nbRetours else 0.0
+
+    def get_nb_pannes(self) -> int:
+        """
+        Retours arrivés batterie vide (énergie de retour sous-estimée).
+        """
+        return self._nbPannes
+
+    def get_compteurs(self) -> Dict[str, int]:
+        return {type.name: nombre for type, nombre in self._compteurs.items()}
+
+    def get_journal(self) -> List[Tuple[float, str, int]]:
+        """
+        Événements traités (instant, type, robot ou trieur concerné) ; vide si garderJournal=False.
+        """
+        return list(self._journal or [])
+
+    # ---------- Boucle principale ----------
+
+    def executer(self, duree: float) -> int:
+        """
+        Traite tous les événements des duree prochaines secondes simulées. Retourne leur nombre.
+        """
+        fin = self._t + duree
+        echeancier = self._echeancier
+        traites = 0
+        while echeancier and echeancier[0][0] <= fin:
+            t, type, _, robot, donnee = heapq.heappop(echeancier)
+            self._t = t
+            self._compteurs[type] += 1
+            if self._journal is not None:
+                self._journal.append((t, TypeEvenement(type).name, robot))
+            self._traiteurs[type](robot, donnee)
+            traites += 1
+        self._t = fin
+        return traites
+
+    def _planifier(self, t: float, type: TypeEvenement, robot: int, donnee: Any = None) -> None:
+        heapq.heappush(self._echeancier, (t, int(type), self._sequence, robot, donnee))
+        self._sequence += 1
+
+    # ---------- Déplacements ----------
+
+    def _partir(self, i: int, arrivee: TypeEvenement, xD: float, yD: float, donnee: Any = None) -> None:
+        robot = self._collecteurs[i]
+        x, y, _ = robot.get_position()
+        distance = math.hypot(xD - x, yD - y)
+        cap = self._cap(i, xD, yD)
+        if self._champEnergie is not None:
+            robot.set_battery_level(max(0.0, robot.get_battery_level() - self._coutRotation(i, cap)))
+        batterie = robot.get_battery_level()
+        robot.set_position(x, y, cap)
+        robot.set_vitesse(self._vitesse, 0.0)
+        robot.set_etat("en mouvement")
+        self._trajets[i] = (self._t, x, y, xD, yD, batterie)
+        autonomie = (batterie - self._seuilBatterie) / self._consommation if self._consommation > 0 else math.inf
+        if arrivee == TypeEvenement.ARRIVEE_CUBE and autonomie < distance:
+            # Le seuil sera franchi en route : seul cet événement est planifié
+            self._planifier(self._t + max(autonomie, 0.0) / self._vitesse, TypeEvenement.SEUIL_BATTERIE, i, donnee)
+        else:
+            self._planifier(self._t + distance / self._vitesse, arrivee, i, donnee)
+
+    def _avancer(self, i: int) -> None:
+        # Position et batterie à l'instant courant, sur le trajet en cours
+        t0, x0, y0, x1, y1, batterie = self._trajets[i]
+        longueur = math.hypot(x1 - x0, y1 - y0)
+        parcouru = min(longueur, (self._t - t0) * self._vitesse)
+        f = parcouru / longueur if longueur > 0 else 1.0
+        robot = self._collecteurs[i]
+        robot.set_position(x0 + f * (x1 - x0), y0 + f * (y1 - y0), robot.get_position()[2])
+        robot.set_battery_level(max(0.0, batterie - parcouru * self._consommation))
+        robot.set_vitesse(0.0, 0.0)
+        self._distance += parcouru
+        self._trajets[i] = None
+
+    def _cap(self, i: int, xD: float, yD: float) -> float:
+        x, y, theta = self._collecteurs[i].get_position()
+        return math.atan2(yD - y, xD - x) if (xD, yD) != (x, y) else theta
+
+    def _coutRotation(self, i: int, cap: float) -> float:
+        ecart = (cap - self._collecteurs[i].get_position()[2] + math.pi) % (2.0 * math.pi) - math.pi
+        return self._champEnergie.get_modele().coutDeplacement(0.0, ecart)
+
+    def _peutAtteindre(self, i: int, xC: float, yC: float) -> bool:
+        """
+        Sans champ d'énergie, toujours vrai (le seuil est surveillé en route). Sinon, la batterie
+        doit couvrir rotation et aller, ramassage, retour depuis le cube (lecture O(1)) et marge.
+        """
+        if self._champEnergie is None:
+            return True
+        robot = self._collecteurs[i]
+        x, y, _ = robot.get_position()
+        modele = self._champEnergie.get_modele()
+        cap = self._cap(i, xC, yC)
+        besoin = (self._coutRotation(i, cap) + modele.coutDeplacement(math.hypot(xC - x, yC - y))
+                  + modele.parRamassage + self._champEnergie.energieEn(xC, yC, cap) + modele.marge)
+        return robot.get_battery_level() >= besoin
+
+    def _choisir(self, i: int) -> None:
+        """
+        Collecteur disponible : cube le plus proche non réservé, retour au tri s'il doit trier
+        (ou s'il n'y a plus de cube à viser et qu'il transporte déjà des cubes), sinon attente.
+        """
+        robot = self._collecteurs[i]
+        if robot.shouldReturnToSort():
+            self._rentrer(i)
+            return
+        x, y, _ = robot.get_position()
+        cible = None
+        if len(self._carte) > self._carte.get_nb_reservations():
+            cible = self._carte.plusProche(x, y, proprietaire=robot.get_name())
+        if cible is not None and not self._peutAtteindre(i, cible[1], cible[2]):
+            self._rentrer(i)
+        elif cible is not None:
+            ident, xC, yC = cible
+            self._carte.reserver(ident, robot.get_name())
+            self._etats[i] = "cube"
+            self._partir(i, TypeEvenement.ARRIVEE_CUBE, xC, yC, ident)
+        elif robot.get_stock_actuel() > 0:
+            self._rentrer(i)
+        else:
+            self._etats[i] = "libre"
+            robot.set_etat("à l'arrêt")
+
+    def _rentrer(self, i: int) -> None:
+        self._etats[i] = "tri"
+        self._partir(i, TypeEvenement.ARRIVEE_TRI, *self._zoneTri)
+
+    # ---------- Traitement des événements ----------
+
+    def _surCubeApercu(self, _: int, processus: bool) -> None:
+        x, y = self._rng.uniform(0.0, self._tailleArene, 2).tolist()
+        ident = self._carte.ajouter(x, y)
+        if processus:
+            self._planifier(self._t + self._rng.exponential(1.0 / self._tauxApparition), TypeEvenement.CUBE_APERCU, -1, True)
+        # Un collecteur n'attend que s'il ne reste aucun cube libre : le nouveau cube va au plus proche
+        libres = [i for i, etat in enumerate(self._etats) if etat == "libre" and self._peutAtteindre(i, x, y)]
+        if libres:
+            positions = [self._collecteurs[i].get_position() for i in libres]
+            k = min(range(len(libres)), key=lambda k: (positions[k][0] - x) ** 2 + (positions[k][1] - y) ** 2)
+            i = libres[k]
+            self._carte.reserver(ident, self._collecteurs[i].get_name())
+            self._etats[i] = "cube"
+            self._partir(i, TypeEvenement.ARRIVEE_CUBE, x, y, ident)
+
+    def _surArriveeCube(self, i: int, ident: int) -> None:
+        self._avancer(i)
+        if ident in self._carte:
+            if self._collecteurs[i].storeCube(self._carte.get_position(ident)):
+                self._nbCollectes += 1
+            self._carte.retirer(ident)
+        self._choisir(i)
+
+    def _surSeuilBatterie(self, i: int, ident: int) -> None:
+        self._avancer(i)
+        self._carte.liberer(ident)
+        self._rentrer(i)
+
+    def _surArriveeTri(self, i: int, _: Any) -> None:
+        self._avancer(i)
+        robot = self._collecteurs[i]
+        robot.set_etat("tri")
+        self._nbRetours += 1
+        self._batterieRetourTotale += robot.get_battery_level()
+        if robot.get_battery_level() <= 0.0:
+            self._nbPannes += 1
+        cubes = robot.emptyStorage()
+        if cubes:
+            # Premier trieur disponible ; la charge attend s'ils sont tous occupés
+            k = min(range(len(self._trieurs)), key=self._trieursLibres.__getitem__)
+            fin = max(self._t, self._trieursLibres[k]) + self._dureeTri * len(cubes)
+            self._trieursLibres[k] = fin
+            self._planifier(fin, TypeEvenement.TRI_TERMINE, k, cubes)
+        self._etats[i] = "recharge"
+        duree = (100.0 - robot.get_battery_level()) / self._tauxRecharge
+        self._planifier(self._t + duree, TypeEvenement.RECHARGE_TERMINEE, i)
+
+    def _surTriTermine(self, k: int, cubes: List[Any]) -> None:
+        self._nbTries += len(cubes)
+        self._trieurs[k].sortAll(cubes)
+
+    def _surRechargeTerminee(self, i: int, _: Any) -> None:
+        robot = self._collecteurs[i]
+        robot.set_battery_level(100.0)
+        robot.set_etat("à l'arrêt")
+        self._choisir(i)
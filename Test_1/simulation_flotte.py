@@ -0,0 +1,128 @@
+from typing import List
+import numpy as np
+from robot_collector import RobotCollector
+
+# Indices des lignes du tableau d'état (struct-of-arrays)
+X, Y, THETA, V, OMEGA, BATTERIE = range(6)
+
+
+class SimulationFlotte:
+    """
+    SimulationFlotte : moteur de simulation vectorisé pour une flotte de RobotCollector.
+    L'état de tous les robots (x, y, θ, v, ω, batterie) est stocké dans un seul tableau
+    NumPy de forme (6, N) ; chaque ligne est une vue contiguë sur une grandeur.
+    Un appel à step() applique à toute la flotte les mêmes équations que RobotCollector.move().
+    """
+
+    def __init__(self, nbRobots: int, ecartementRoues: float = 0.5, consommation: float = 0.1):
+        if nbRobots <= 0:
+            raise ValueError("La flotte doit contenir au moins un robot.")
+        self._nbRobots: int = nbRobots
+        self._etat: np.ndarray = np.zeros((6, nbRobots))
+        self._etat[BATTERIE] = 100.0
+        self._ecartementRoues: np.ndarray = np.full(nbRobots, float(ecartementRoues))
+        self._consommation: float = consommation        # Consommation d'énergie par pas (%)
+        self._actifs: np.ndarray = np.ones(nbRobots, dtype=bool)   # False = batterie épuisée
+
+    @classmethod
+    def fromCollectors(cls, robots: List[RobotCollector], consommation: float = 0.1) -> "SimulationFlotte":
+        """
+        Construit une flotte à partir de robots existants (position, vitesses, batterie, écartement).
+        Les vitesses reprennent les consignes get_vitesse() de chaque robot.
+        """
+        flotte = cls(len(robots), consommation=consommation)
+        for i, robot in enumerate(robots):
+            x, y, theta = robot.get_position()
+            vLin, vAng = robot.get_vitesse()
+            flotte._etat[:, i] = (x, y, theta, vLin, vAng, robot.get_battery_level())
+            flotte._ecartementRoues[i] = robot.get_ecartement_roues()
+        flotte._actifs[:] = flotte._etat[BATTERIE] > 0.0
+        return flotte
+
+    # ---------- Getters / Setters ----------
+
+    def get_nb_robots(self) -> int:
+        return self._nbRobots
+
+    def get_etat(self) -> np.ndarray:
+        # Vue (6, N) sur l'état interne, sans copie
+        return self._etat
+
+    def get_positions(self) -> np.ndarray:
+        # Copie (N, 3) des poses (x, y, θ)
+        return self._etat[X:THETA + 1].T.copy()
+
+    def get_battery_levels(self) -> np.ndarray:
+        return self._etat[BATTERIE].copy()
+
+    def get_actifs(self) -> np.ndarray:
+        return self._actifs.copy()
+
+    def set_battery_levels(self, niveaux: np.ndarray) -> None:
+        niveaux = np.asarray(niveaux, dtype=float)
+        if np.any((niveaux < 0.0) | (niveaux > 100.0)):
+            raise ValueError("Le niveau de batterie doit être entre 0 et 100.")
+        self._etat[BATTERIE] = niveaux
+        self._actifs[:] = self._etat[BATTERIE] > 0.0
+
+    def set_vitesses(self, vitesseLin: np.ndarray, vitesseAng: np.ndarray) -> None:
+        self._etat[V] = vitesseLin
+        self._etat[OMEGA] = vitesseAng
+
+    def set_vitesses_roues(self, gauche: np.ndarray, droite: np.ndarray) -> None:
+        """
+        Cas 1 de move() : calcule v et ω de chaque robot à partir des vitesses des roues.
+        """
+        gauche = np.asarray(gauche, dtype=float)
+        droite = np.asarray(droite, dtype=float)
+        self._etat[V] = (droite + gauche) / 2.0
+        self._etat[OMEGA] = (droite - gauche) / self._ecartementRoues
+
+    # ---------- Simulation ----------
+
+    def step(self, dt: float = 0.1) -> None:
+        """
+        Avance toute la flotte d'un pas dt (intégration Euler, identique à RobotCollector.move()).
+        - Les robots à batterie nulle ne bougent plus (move() lèverait une exception).
+        - Un robot dont la batterie passe sous la consommation s'arrête après ce dernier pas.
+        """
+        etat = self._etat
+        actifs = self._actifs
+        if actifs.all():
+            theta = etat[THETA].copy()
+            vdt = etat[V] * dt
+            etat[THETA] += etat[OMEGA] * dt
+            etat[X] += vdt * np.cos(theta)
+            etat[Y] += vdt * np.sin(theta)
+        else:
+            theta = etat[THETA, actifs]
+            vdt = etat[V, actifs] * dt
+            etat[THETA, actifs] = theta + etat[OMEGA, actifs] * dt
+            etat[X, actifs] += vdt * np.cos(theta)
+            etat[Y, actifs] += vdt * np.sin(theta)
+
+        # Consommation d'énergie : les robots sans réserve suffisante sont arrêtés
+        batterie = etat[BATTERIE]
+        epuises = actifs & (batterie < self._consommation)
+        if epuises.any():
+            actifs &= ~epuises
+        np.subtract(batterie, self._consommation, out=batterie, where=actifs)
+        actifs &= batterie > 0.0
+
+    def run(self, nbPas: int, dt: float = 0.1) -> None:
+        for _ in range(nbPas):
+            self.step(dt)
+
+    def writeBack(self, robots: List[RobotCollector]) -> None:
+        """
+        Recopie l'état de la flotte dans les objets RobotCollector correspondants.
+        """
+        if len(robots) != self._nbRobots:
+            raise ValueError("Le nombre de robots doit correspondre à la taille de la flotte.")
+        for i, robot in enumerate(robots):
+            x, y, theta, vLin, vAng, batterie = self._etat[:, i].tolist()
+            robot.set_position(x, y, theta)
+            robot.set_vitesse(vLin, vAng)
+            robot.set_battery_level(batterie)
+            if not self._actifs[i]:
+                robot.set_etat("à l'arrêt")
@@ -0,0 +1,273 @@
+from typing import Dict, List, Optional, TextIO, Tuple
+from enum import IntEnum
+import itertools
+import math
+import struct
+import sys
+import threading
+import time
+import numpy as np
+
+NAN = math.nan
+
+
+class Evenement(IntEnum):
+    """
+    Codes d'événements de télémétrie (stockés sur 16 bits dans les enregistrements).
+    """
+    STATUT = 0
+    BRAS_POSITIONNE = 1
+    BRAS_NAVIGUE = 2
+    PINCE_OUVERTE = 3
+    CUBE_DEPOSE = 4
+    CORBEILLE_CALIBREE = 5
+    ERREUR_DEPOT = 6
+    REESSAI_DEPOT = 7
+    CUBE_RAMASSE = 8
+    CUBE_COLLECTE = 9
+    ARRIVEE_TRI = 10
+
+
+# Enregistrement typé : horodatage, identifiant du robot, code d'événement, charge numérique (4 flottants).
+# STRUCT_ENREGISTREMENT écrit exactement la disposition mémoire de DTYPE_ENREGISTREMENT (46 octets, sans alignement).
+DTYPE_ENREGISTREMENT = np.dtype([("t", "<f8"), ("robot", "<i4"), ("code", "<i2"),
+                                 ("a", "<f8"), ("b", "<f8"), ("c", "<f8"), ("d", "<f8")])
+STRUCT_ENREGISTREMENT = struct.Struct("<dihdddd")
+
+# Message de chaque événement ; {robot} et {texte} sont des chaînes internées (identifiant()),
+# {valeurs} la liste des champs de charge renseignés
+FORMATS: Dict[int, str] = {
+    Evenement.STATUT: "Robot '{robot}' | Position: ({a:.2f}, {b:.2f}, θ={c:.2f}) | Batterie: {d:.1f}%",
+    Evenement.BRAS_POSITIONNE: "[{robot}] Bras positionné selon angles {valeurs}.",
+    Evenement.BRAS_NAVIGUE: "Navigation du bras vers ({a}, {b}) calculée.",
+    Evenement.PINCE_OUVERTE: "Pince ouverte, cube relâché.",
+    Evenement.CUBE_DEPOSE: "Cube déposé dans la corbeille '{texte}' aux coords ({b}, {c}).",
+    Evenement.CORBEILLE_CALIBREE: "Corbeille '{texte}' calibrée à la position ({b}, {c}).",
+    Evenement.ERREUR_DEPOT: "[{robot}] Erreur détectée lors du dépôt, réessai en cours...",
+    Evenement.REESSAI_DEPOT: "Réessai de dépôt effectué.",
+    Evenement.CUBE_RAMASSE: "Cube ramassé ! Stock actuel : {a:.0f}/{b:.0f}",
+    Evenement.CUBE_COLLECTE: "Cube collecté pendant la boucle.",
+    Evenement.ARRIVEE_TRI: "Arrivé à la zone de tri, prêt pour le tri.",
+}
+
+
+class TelemetrieNulle:
+    """
+    Télémétrie désactivée : enregistrer() ne fait rien (aucune allocation, aucun formatage).
+    """
+
+    def identifiant(self, chaine: str) -> int:
+        return 0
+
+    def enregistrer(self, robotId: int, code: int, a: float = NAN, b: float = NAN,
+                    c: float = NAN, d: float = NAN) -> None:
+        pass
+
+
+class TelemetrieConsole(TelemetrieNulle):
+    """
+    Télémétrie synchrone : chaque événement est formaté et affiché immédiatement (comportement
+    historique des print()). Pratique en mise au point, coûteuse en boucle chargée.
+    """
+
+    def __init__(self, sortie: Optional[TextIO] = None):
+        self._sortie: Optional[TextIO] = sortie      # None = sys.stdout au moment de l'écriture
+        self._chaines: List[str] = []
+        self._identifiants: Dict[str, int] = {}
+        self._verrouChaines: threading.Lock = threading.Lock()   # Internement depuis plusieurs threads
+
+    def identifiant(self, chaine: str) -> int:
+        """
+        Interne une chaîne (nom de robot, couleur...) et renvoie son identifiant entier.
+        Chaîne déjà connue : lecture sans verrou ; nouvelle chaîne : ajout sous verrou.
+        """
+        ident = self._identifiants.get(chaine)
+        if ident is None:
+            with self._verrouChaines:
+                ident = self._identifiants.get(chaine)
+                if ident is None:
+                    self._chaines.append(chaine)
+                    ident = self._identifiants[chaine] = len(self._chaines) - 1
+        return ident
+
+    def chaine(self, ident: int) -> str:
+        return self._chaines[ident] if 0 <= ident < len(self._chaines) else f"#{ident}"
+
+    def formater(self, robotId: int, code: int, a: float, b: float, c: float, d: float) -> str:
+        charge = [v for v in (a, b, c, d) if not math.isnan(v)]
+        modele = FORMATS.get(code)
+        if modele is None:
+            return f"[{self.chaine(robotId)}] Événement {code} : {charge}"
+        texte = self.chaine(int(a)) if not math.isnan(a) else ""
+        return modele.format(robot=self.chaine(robotId), texte=texte, valeurs=charge, a=a, b=b, c=c, d=d)
+
+    def enregistrer(self, robotId: int, code: int, a: float = NAN, b: float = NAN,
+                    c: float = NAN, d: float = NAN) -> None:
+        print(self.formater(robotId, code, a, b, c, d), file=self._sortie or sys.stdout)
+
+
+class Telemetrie(TelemetrieConsole):
+    """
+    Télémétrie à faible surcoût :
+    - enregistrer() écrit un enregistrement typé (struct.pack_into) dans un tampon circulaire
+      préalloué, vu côté lecture comme un tableau NumPy de DTYPE_ENREGISTREMENT ;
+      aucun formatage de chaîne ni verrou sur le chemin critique (créneau réservé par itertools.count) ;
+    - plusieurs threads peuvent enregistrer en parallèle : chaque créneau porte le numéro de
+      séquence de son enregistrement, publié après l'écriture ; le vidage ne lit que la plage
+      contiguë de créneaux publiés et écarte ceux réécrits pendant sa copie ;
+    - un thread de vidage écrit périodiquement les nouveaux enregistrements vers un fichier ou
+      la sortie standard, en texte formaté ou en binaire brut (binaire=True, relu par lireJournal()) ;
+    - si le tampon est plein avant le vidage, les plus anciens enregistrements sont perdus (comptés).
+    """
+
+    def __init__(self, capacite: int = 1 << 16, sortie: Optional[TextIO] = None,
+                 chemin: Optional[str] = None, binaire: bool = False, periodeVidage: float = 0.1,
+                 demarrer: bool = True):
+        super().__init__(sortie)
+        if capacite <= 0 or capacite & (capacite - 1):
+            raise ValueError("La capacité doit être une puissance de deux.")
+        if binaire and not chemin:
+            raise ValueError("Le mode binaire nécessite un fichier (chemin).")
+        self._capacite: int = capacite
+        self._masque: int = capacite - 1
+        self._taille: int = STRUCT_ENREGISTREMENT.size
+        self._tampon: bytearray = bytearray(capacite * self._taille)
+        self._vue: np.ndarray = np.frombuffer(self._tampon, dtype=DTYPE_ENREGISTREMENT)
+        self._ecrire = STRUCT_ENREGISTREMENT.pack_into
+        self._compteur = itertools.count()
+        # Numéro de séquence publié dans chaque créneau (-1 : vide ou écriture en cours)
+        self._sequences: np.ndarray = np.full(capacite, -1, dtype=np.int64)
+        self._lus: int = 0             # Enregistrements déjà traités par le vidage
+        self._perdus: int = 0
+        self._verrouVidage: threading.Lock = threading.Lock()
+        self._horloge = time.perf_counter
+        self._origine: float = self._horloge()
+        self._binaire: bool = binaire
+        self._fichier = open(chemin, "wb" if binaire else "w", encoding=None if binaire else "utf-8") \
+            if chemin else None
+        self._periodeVidage: float = periodeVidage
+        self._arret: threading.Event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if demarrer:
+            self.demarrer()
+
+    # ---------- Getters ----------
+
+    def get_capacite(self) -> int:
+        return self._capacite
+
+    def get_nb_enregistrements(self) -> int:
+        return int(self._sequences.max()) + 1
+
+    def get_nb_perdus(self) -> int:
+        return self._perdus
+
+    # ---------- Chemin critique ----------
+
+    def enregistrer(self, robotId: int, code: int, a: float = NAN, b: float = NAN,
+                    c: float = NAN, d: float = NAN) -> None:
+        n = next(self._compteur)
+        i = n & self._masque
+        self._sequences[i] = -1
+        self._ecrire(self._tampon, i * self._taille, self._horloge(), robotId, code, a, b, c, d)
+        self._sequences[i] = n
+
+    # ---------- Lecture / vidage ----------
+
+    def instantane(self) -> np.ndarray:
+        """
+        Copie, dans l'ordre chronologique, des enregistrements encore présents dans le tampon.
+        """
+        return self._copier(*self._publies(0))[1]
+
+    def _publies(self, depuis: int) -> Tuple[int, int]:
+        """
+        Plage [debut, fin) des enregistrements publiés à partir du numéro depuis : debut saute les
+        enregistrements déjà écrasés, fin s'arrête au premier créneau dont l'écriture est en cours.
+        """
+        haut = int(self._sequences.max()) + 1
+        debut = max(depuis, haut - self._capacite)
+        attendus = np.arange(debut, haut)
+        publies = self._sequences[attendus & self._masque] == attendus
+        return debut, debut + (len(publies) if publies.all() else int(np.argmin(publies)))
+
+    def _copier(self, debut: int, fin: int) -> Tuple[int, np.ndarray]:
+        """
+        Copie des enregistrements [debut, fin) ; ceux réécrits pendant la copie (les plus anciens)
+        sont écartés. Retourne le premier numéro effectivement copié et la copie.
+        """
+        if fin <= debut:
+            return debut, self._vue[:0].copy()
+        i, j = debut & self._masque, fin & self._masque
+        lot = self._vue[i:j].copy() if i < j else np.concatenate((self._vue[i:], self._vue[:j]))
+        attendus = np.arange(debut, fin)
+        intacts = self._sequences[attendus & self._masque] == attendus
+        if not intacts.all():
+            # Réécriture par l'avant du tampon : seuls les derniers enregistrements restent valides
+            k = len(intacts) - int(np.argmin(intacts[::-1]))
+            return debut + k, lot[k:]
+        return debut, lot
+
+    def vider(self) -> int:
+        """
+        Écrit les enregistrements non encore vidés (texte formaté ou binaire). Retourne leur nombre.
+        """
+        with self._verrouVidage:
+            debut, fin = self._publies(self._lus)
+            debut, lot = self._copier(debut, fin)
+            self._perdus += debut - self._lus
+            self._lus = fin
+            if not len(lot):
+                return 0
+            if self._binaire:
+                self._fichier.write(lot.tobytes())
+            else:
+                lignes = [f"{t - self._origine:.6f} {self.formater(robot, code, a, b, c, d)}\n"
+                          for t, robot, code, a, b, c, d in lot.tolist()]
+                sortie = self._fichier or self._sortie or sys.stdout
+                sortie.writelines(lignes)
+            (self._fichier or self._sortie or sys.stdout).flush()
+            return len(lot)
+
+    def demarrer(self) -> None:
+        if self._thread is not None:
+            return
+        self._arret.clear()
+        self._thread = threading.Thread(target=self._boucleVidage, name="telemetrie", daemon=True)
+        self._thread.start()
+
+    def _boucleVidage(self) -> None:
+        while not self._arret.wait(self._periodeVidage):
+            self.vider()
+
+    def fermer(self) -> None:
+        """
+        Arrête le thread de vidage, vide les derniers enregistrements et ferme le fichier éventuel.
+        """
+        if self._thread is not None:
+            self._arret.set()
+            self._thread.join()
+            self._thread = None
+        self.vider()
+        if self._fichier is not None:
+            self._fichier.close()
+            self._fichier = None
+
+    def __enter__(self) -> "Telemetrie":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fermer()
+
+
+def lireJournal(chemin: str) -> np.ndarray:
+    """
+    Relit un fichier écrit par Telemetrie(binaire=True) : tableau de DTYPE_ENREGISTREMENT.
+    """
+    return np.fromfile(chemin, dtype=DTYPE_ENREGISTREMENT)
+
+
+# Télémétrie par défaut des robots : affichage immédiat, comme les print() historiques
+CONSOLE = TelemetrieConsole()
+# Télémétrie désactivée, partageable par tous les robots
+DESACTIVEE = TelemetrieNulle()
@@ -1,8 +1,40 @@
 # test_robotics.py
 
 from robot import Robot                # Classe de base (définie précédemment)
-from robot_collector import RobotCollector
+from robot_collector import RobotCollector, PERIODES_ENCODEURS_MAX
 from robot_trieur import RobotTrieur
+from simulation_flotte import SimulationFlotte
+from robot_compact import RobotCompact, EtatRobot
+from navigation import GrilleOccupation, PlanificateurAStar, ChampDistance, ZONE_TRI
+from vision import CameraSynthetique, DetecteurCube, etiqueterComposantes
+from cinematique_bras import BrasPlanaire
+from ordonnanceur import OrdonnanceurTempsReel
+from banque_pid import PIDBank
+from telemetrie import Telemetrie, TelemetrieConsole, Evenement, DESACTIVEE, lireJournal
+from monde import CarteCubes
+from allocation import AllocateurCubes, resoudreAffectation
+import allocation
+from chaine_tri import ChaineTri
+from simulation_evenements import SimulateurMission
+from odometrie import OdometrieEncodeurs
+from energie import ModeleEnergie, ChampEnergie
+from capteurs import Capteur, GestionnaireCapteurs, CAPTEUR_CAMERA, CAPTEUR_ENCODEURS, CAPTEUR_CAMERA_TRI
+from planification_tri import PlanificateurTri
+from profilage import HistogrammeLatence, Profileur, main as profilerScenarios
+from flux_camera import AnneauImages, acquerirSynthetique
+from journal_flotte import JournalFlotte, LecteurJournal
+from calibration import CalibrateurZone, CameraMarqueurs, FiltrePose, lireMarqueur, motifMarqueur
+import multiprocessing
+import threading
+import time
+import itertools
+import math
+import io
+import json
+import os
+import tempfile
+from robot_collector import PIDController
+import numpy as np
 
 def test_robot_collector():
     print("=== Test RobotCollector ===")
@@ -86,6 +118,1225 @@ def test_robot_trieur():
     print("=== Fin test RobotTrieur ===\n")
 
 
+def test_simulation_flotte():
+    print("=== Test SimulationFlotte ===")
+    # Robot scalaire de référence : vitesses de roues constantes (monkey-patch des encodeurs)
+    collector = RobotCollector(name="Ref", ecartementRoues=0.4, stockageMax=5)
+    collector.readWheelSpeeds = lambda: (0.3, 0.5)
+
+    flotte = SimulationFlotte.fromCollectors([collector])
+    flotte.set_vitesses_roues([0.3], [0.5])
+
+    for _ in range(200):
+        collector.move()
+        flotte.step(0.1)
+
+    # Le chemin vectorisé doit être numériquement identique au chemin scalaire
+    x, y, theta = flotte.get_positions()[0].tolist()
+    print(f"Scalaire : {collector.get_position()} | Flotte : {(x, y, theta)}")
+    assert (x, y, theta) == collector.get_position()
+    assert flotte.get_battery_levels()[0] == collector.get_battery_level()
+
+    # Une flotte dont la batterie s'épuise s'arrête proprement
+    petite = SimulationFlotte(3)
+    petite.set_battery_levels([100.0, 0.25, 0.0])
+    petite.set_vitesses([1.0, 1.0, 1.0], [0.0, 0.0, 0.0])
+    petite.run(5)
+    print(f"Robots actifs : {petite.get_actifs().tolist()} | x : {petite.get_positions()[:, 0].tolist()}")
+    assert petite.get_actifs().tolist() == [True, False, False]
+    assert petite.get_positions()[2, 0] == 0.0
+    print("=== Fin test SimulationFlotte ===\n")
+
+
+def test_robot_compact():
+    print("=== Test RobotCompact ===")
+
+    class RobotSimple(Robot):
+        def move(self):
+            super().move()
+
+    class RobotSimpleCompact(RobotCompact):
+        __slots__ = ()
+
+        def move(self):
+            super().move()
+
+    # Les deux représentations doivent se comporter de la même façon via l'API publique
+    for robot in (RobotSimple("R1"), RobotSimpleCompact("R1")):
+        robot.set_position(1.0, 2.0, 0.5)
+        robot.set_vitesse(0.3, -0.1)
+        robot.set_battery_level(42.0)
+        robot.add_sensor("lidar")
+        robot.add_sensor("lidar")
+        robot.move()
+        assert robot.get_position() == (1.0, 2.0, 0.5)
+        assert robot.get_vitesse() == (0.3, -0.1)
+        assert robot.get_battery_level() == 42.0
+        assert robot.get_etat() == "en mouvement"
+        assert robot.get_active_sensors() == ["lidar"]
+        robot.startSensors()
+        assert robot.readSensor("lidar") is None and robot.get_sensor_period("lidar") is None
+        robot.stopSensors()
+        robot.status()
+
+    compact = RobotSimpleCompact("R2")
+    assert not hasattr(compact, "__dict__")
+    compact.set_etat("tri")
+    assert compact.get_etat_code() == EtatRobot.TRI
+    try:
+        compact.set_etat("inconnu")
+        assert False, "set_etat doit refuser un état inconnu"
+    except ValueError:
+        print("État invalide correctement refusé.")
+    print("=== Fin test RobotCompact ===\n")
+
+
+def test_navigation():
+    print("=== Test navigation A* ===")
+    # Arène 20x20 (cellules de 0.1 m) avec un mur vertical percé d'une porte en bas
+    grille = GrilleOccupation(20, 20, resolution=0.1)
+    grille.set_couts({(ligne, 10): float("inf") for ligne in range(3, 20)})
+    planificateur = PlanificateurAStar(grille)
+    planificateur.definirZoneTri([(0, 0)])
+    planificateur.ajouterDepartement("est", [(19, 19)])
+
+    chemin = planificateur.planifier((19, 0), (19, 19))
+    assert chemin[0] == (19, 0) and chemin[-1] == (19, 19)
+    assert all(grille.estLibre(*cellule) for cellule in chemin)
+    # Le champ de distance donne le même coût que A*, en lecture directe
+    assert planificateur.distanceVers("est", (19, 0)) == len(chemin) - 1
+    print(f"Chemin A* : {len(chemin) - 1} pas | distance mise en cache : {planificateur.distanceVers('est', (19, 0))}")
+
+    # Fermeture de la porte : le champ est réparé localement et le chemin en cache invalidé
+    grille.set_couts({(ligne, 10): float("inf") for ligne in range(3)})
+    assert planificateur.planifier((19, 0), (19, 19)) is None
+    assert planificateur.distanceVers("est", (19, 0)) == float("inf")
+    grille.set_obstacle(0, 10, False)
+    reference = ChampDistance(grille, [(19, 19)])
+    assert planificateur.distanceVers("est", (19, 0)) == reference.distance(19, 0)
+    print(f"Après réouverture partielle : distance {planificateur.distanceVers('est', (19, 0))}")
+
+    # collectCycle() suit les champs de distance vers le département puis vers la zone de tri
+    collector = RobotCollector(name="Nav1", ecartementRoues=0.5, stockageMax=2)
+    collector.set_planificateur(planificateur)
+    collector.set_position(0.05, 1.95, 0.0)
+    collector.detectCube = lambda: (1.9, 1.9)
+    collector.collectCycle()
+    assert collector.get_stock_actuel() == 2
+    assert grille.versCellule(*collector.get_position()[:2]) == (0, 0)
+    assert planificateur.distanceVers(ZONE_TRI, (0, 0)) == 0.0
+    collector.status()
+    print("=== Fin test navigation A* ===\n")
+
+
+def test_vision():
+    print("=== Test détection de cubes ===")
+    # Étiquetage : trois composantes dont une en "U" (fusion par propagation)
+    masque = np.zeros((8, 10), dtype=bool)
+    masque[1:6, 1] = masque[5, 1:5] = masque[1:6, 4] = True
+    masque[0, 8] = True
+    masque[7, 6:9] = True
+    _, n = etiqueterComposantes(masque)
+    assert n == 3
+
+    camera = CameraSynthetique(640, 480, cote=40, couleur="vert")
+    detecteur = DetecteurCube()
+    zones = []
+    analyser = detecteur._detecterDans
+    def espion(image, l0, c0, aireMin=None):
+        zones.append(image.shape[:2])
+        return analyser(image, l0, c0, aireMin)
+    detecteur._detecterDans = espion
+
+    for _ in range(5):
+        numero, image = camera.derniereImage()
+        detection = detecteur.detecter(image, numero)
+        u, v = camera.get_centre_cube()
+        assert detection.couleur == "vert"
+        assert abs(detection.centre[0] - (u - 0.5)) < 1e-9 and abs(detection.centre[1] - (v - 0.5)) < 1e-9
+        camera.avancer()
+    # Première image : passe grossière (1/4) + affinage ; les suivantes dans la seule région d'intérêt
+    print(f"Zones analysées : {zones}")
+    assert zones[0] == (120, 160) and all(zone[0] < 480 and zone[1] < 640 for zone in zones[1:])
+    assert len(zones) == 6
+
+    # move() et pickUpCube() partagent une seule détection pour la même image
+    collector = RobotCollector(name="Vision1", ecartementRoues=0.5, stockageMax=3)
+    collector.set_camera(camera)
+    collector.set_detecteur(detecteur)
+    zones.clear()
+    collector.move()
+    assert collector.get_stock_actuel() == 1 and len(zones) == 1
+    print(f"Cube ramassé en {collector.get_liste_cubes()[0]['position']} avec {len(zones)} détection")
+
+    # Aucun cube visible : None, après un repli sur l'image entière
+    camera.set_couleur(None)
+    camera.avancer()
+    assert collector.detectCube() is None
+    print("=== Fin test détection de cubes ===\n")
+
+
+def test_classification_lot():
+    print("=== Test classification groupée ===")
+    corbeilles = {"bleu": (0.0, 0.0), "vert": (1.0, 0.0), "rouge": (0.0, 1.0), "doute": (1.0, 1.0)}
+    trieur = RobotTrieur(name="Tri2", nbArticulations=3, corbeilles=corbeilles, seuilConfiance=0.6)
+
+    def crop(rgb, taille=16):
+        return np.full((taille, taille, 3), rgb, dtype=np.uint8)
+
+    gris = crop((120, 120, 120))
+    crops = [crop((200, 30, 30)), crop((30, 180, 40), 24), crop((30, 60, 200)), gris, None]
+    couleurs = trieur.classifyBatch(crops)
+    print(f"Classification groupée : {couleurs}")
+    assert couleurs == ["rouge", "vert", "bleu", "doute", "doute"]
+    assert trieur.classifyCube(crops[0]) == "rouge"
+
+    # Réinspection dans handleError() : la classification est lue dans le cache LRU
+    succes, echecs = trieur._classifieur.get_statistiques_cache()
+    trieur.navigateArmTo = lambda x, y: None
+    trieur.handleError({"crop": crops[2]})
+    assert trieur._classifieur.get_statistiques_cache() == (succes + 1, echecs)
+
+    # sortAll() : même ordre de dépôt que des appels répétés à sortNextCube()
+    deposes = []
+    trieur.navigateArmTo = lambda x, y: deposes.append((x, y))
+    liste_cubes = [{"id": "C1", "crop": crops[0]}, {"id": "C2", "crop": crops[1]}, {"id": "C3"}]
+    trieur.sortAll(liste_cubes)
+    assert liste_cubes == [] and deposes == [corbeilles["doute"], corbeilles["vert"], corbeilles["rouge"]]
+    print("=== Fin test classification groupée ===\n")
+
+
+def test_cinematique_bras():
+    print("=== Test cinématique inverse ===")
+    corbeilles = {"bleu": (0.0, 0.6), "vert": (1.0, 0.0), "rouge": (0.8, 0.8), "doute": (-0.5, 0.5)}
+    trieur = RobotTrieur(name="Tri3", nbArticulations=3, corbeilles=dict(corbeilles))
+    bras = trieur.get_bras()
+
+    # Chaque corbeille est atteinte à partir de la table précalculée
+    for couleur, (xC, yC) in corbeilles.items():
+        trieur.navigateArmTo(xC, yC)
+        xE, yE = bras.positionEffecteur(trieur.get_angles())
+        assert abs(xE - xC) < 1e-5 and abs(yE - yC) < 1e-5, couleur
+
+    # La table n'est reconstruite que si la carte change
+    trieur.calibrateSortingZone()
+    assert trieur._tableIK.get_nb_reconstructions() == 1
+    trieur.set_corbeilles({**corbeilles, "vert": (1.1, 0.1)})
+    assert trieur._tableIK.get_nb_reconstructions() == 2
+
+    # Cible voisine d'une corbeille : démarrage à chaud, moins d'itérations qu'à froid
+    _, erreurFroid, iterFroid = bras.resoudre(0.82, 0.79)
+    _, erreurChaud, iterChaud = trieur._tableIK.resoudreProche(0.82, 0.79)
+    print(f"Itérations à froid : {iterFroid} | à chaud : {iterChaud}")
+    assert erreurChaud < 1e-5 and iterChaud < iterFroid
+
+    # Bras à deux articulations : solution analytique exacte
+    bras2 = BrasPlanaire([0.6, 0.4])
+    angles, erreur, iterations = bras2.resoudre(0.5, 0.5)
+    assert erreur < 1e-12 and iterations == 0
+    print("=== Fin test cinématique inverse ===\n")
+
+
+def test_ordonnanceur():
+    print("=== Test ordonnanceur temps réel ===")
+    ordonnanceur = OrdonnanceurTempsReel()
+    robots = []
+    commandes = []
+    for i in range(2):
+        robot = RobotCollector(name=f"RT{i}", ecartementRoues=0.5, stockageMax=3)
+        robot.set_moteurs(lambda lin, ang, nom=robot.get_name(): commandes.append((nom, lin)))
+        robot.readWheelSpeeds = lambda: (0.4, 0.4)
+        robot.set_vitesse(0.5, 0.0)
+        ordonnanceur.ajouterRobotCollector(robot, frequenceControle=100.0, frequenceVision=30.0)
+        robots.append(robot)
+    dts = []
+    ordonnanceur.ajouterTache("espion", 50.0, dts.append)
+
+    ordonnanceur.lancer(0.5)
+    duree = ordonnanceur.get_duree_execution()
+    stats = ordonnanceur.get_statistiques()
+    for nom in ("RT0/controle", "RT1/vision", "espion"):
+        print(stats[nom])
+    # Fréquences respectées (marge large pour les machines chargées)
+    assert stats["RT0/controle"].get_frequence_mesuree(duree) > 50.0
+    assert 10.0 < stats["RT1/vision"].get_frequence_mesuree(duree) < 40.0
+    assert all(0.0 < dt < 0.1 for dt in dts) and abs(sum(dts[1:]) / len(dts[1:]) - 0.02) < 0.01
+
+    # L'odométrie intègre le dt mesuré : distance ≈ vitesse × durée, pour chaque robot
+    for robot in robots:
+        x, _, _ = robot.get_position()
+        assert abs(x - 0.4 * duree) < 0.1, x
+        # Le PID reçoit l'erreur consigne (0.5) - mesure (0.4)
+        assert abs(robot.get_commande()[0] - 0.1) < 1e-9
+        # Consommation au prorata du dt : 0.1 par pas nominal de 0.1 s, soit ≈ 1 % par seconde
+        assert abs((100.0 - robot.get_battery_level()) - duree) < 0.1, robot.get_battery_level()
+    # Chaque commande calculée est envoyée au pilote moteurs
+    assert {nom for nom, _ in commandes} == {"RT0", "RT1"} and abs(commandes[-1][1] - 0.1) < 1e-9
+    print("=== Fin test ordonnanceur temps réel ===\n")
+
+
+def test_banque_pid():
+    print("=== Test PIDBank ===")
+    rng = np.random.default_rng(3)
+    controleurs = [PIDController(kp, ki, kd) for kp, ki, kd in rng.uniform(0.0, 2.0, (20, 3))]
+    banque = PIDBank.fromControllers(controleurs)
+    for _ in range(100):
+        consignes, mesures = rng.uniform(-1.0, 1.0, (2, 20))
+        dts = rng.choice([0.0, 0.01, 0.1], 20)          # dt par régulateur, dt nul compris
+        attendu = [c.compute(s, m, dt) for c, s, m, dt in zip(controleurs, consignes, mesures, dts)]
+        # Sans option, résultat identique bit à bit au chemin scalaire
+        assert banque.compute(consignes, mesures, dts).tolist() == attendu
+
+    # Saturation + anti-windup : l'intégrale ne diverge pas pendant la saturation
+    banque = PIDBank(2, kp=1.0, ki=5.0)
+    banque.set_limites(-1.0, 1.0)
+    banque.set_anti_windup([True, False])
+    for _ in range(50):
+        sortie = banque.compute(10.0, 0.0, 0.1)
+    print(f"Sorties saturées : {sortie.tolist()} | intégrales : {banque.get_integrales().tolist()}")
+    assert sortie.tolist() == [1.0, 1.0]
+    assert banque.get_integrales()[0] == 0.0 and banque.get_integrales()[1] > 40.0
+
+    # Dérivée sur la mesure : pas de pic quand la consigne saute
+    banque = PIDBank(2, kp=0.0, kd=1.0)
+    banque.set_derivee_mesure([True, False])
+    banque.compute(0.0, 0.0, 0.1)
+    sortie = banque.compute(1.0, 0.0, 0.1)
+    print(f"Saut de consigne : dérivée sur mesure {sortie[0]} | sur erreur {sortie[1]}")
+    assert sortie[0] == 0.0 and sortie[1] > 9.0
+    print("=== Fin test PIDBank ===\n")
+
+
+def test_telemetrie():
+    print("=== Test télémétrie ===")
+    corbeilles = {"bleu": (0.0, 0.5), "doute": (0.5, 0.5)}
+    trieur = RobotTrieur(name="TriTel", nbArticulations=2, corbeilles=corbeilles)
+    sortie = io.StringIO()
+    telemetrie = Telemetrie(capacite=8, sortie=sortie, demarrer=False)
+    trieur.set_telemetrie(telemetrie)
+
+    # Un dépôt = navigation du bras, positionnement, pince, dépôt : 4 enregistrements typés
+    trieur.sortNextCube([{"id": "C1"}])
+    codes = telemetrie.instantane()["code"].tolist()
+    assert codes == [Evenement.BRAS_NAVIGUE, Evenement.BRAS_POSITIONNE, Evenement.PINCE_OUVERTE,
+                     Evenement.CUBE_DEPOSE]
+    assert telemetrie.vider() == 4 and telemetrie.vider() == 0
+    lignes = sortie.getvalue().splitlines()
+    print(lignes[-1])
+    assert "Cube déposé dans la corbeille 'doute' aux coords (0.5, 0.5)." in lignes[-1]
+
+    # Tampon plein avant le vidage : les plus anciens enregistrements sont perdus et comptés
+    for _ in range(3):
+        trieur.sortNextCube([{"id": "C"}])
+    assert telemetrie.vider() == 8 and telemetrie.get_nb_perdus() == 4
+
+    # Vidage en tâche de fond vers la sortie, puis fermeture
+    telemetrie = Telemetrie(sortie=sortie, periodeVidage=0.01)
+    trieur.set_telemetrie(telemetrie)
+    trieur.recordStatus()
+    telemetrie.fermer()
+    assert "Robot 'TriTel' | Position: (0.00, 0.00, θ=0.00) | Batterie: 100.0%" in sortie.getvalue()
+
+    with tempfile.TemporaryDirectory() as dossier:
+        # Journal binaire : relu tel quel sous forme de tableau structuré
+        chemin = os.path.join(dossier, "telemetrie.bin")
+        with Telemetrie(chemin=chemin, binaire=True, demarrer=False) as journal:
+            trieur.set_telemetrie(journal)
+            trieur.sortNextCube([{"id": "C3"}])
+        enregistrements = lireJournal(chemin)
+        assert enregistrements["code"].tolist()[-1] == Evenement.CUBE_DEPOSE
+        assert (enregistrements["b"][-1], enregistrements["c"][-1]) == (0.5, 0.5)
+
+        # Plusieurs threads enregistrent en parallèle : chaque enregistrement vidé est complet
+        chemin = os.path.join(dossier, "telemetrie_threads.bin")
+        with Telemetrie(capacite=1 << 12, chemin=chemin, binaire=True, periodeVidage=0.001) as journal:
+            def ecrire(robot):
+                for k in range(2000):
+                    journal.enregistrer(robot, Evenement.STATUT, k, 2.0 * k, 3.0 * k, 4.0 * k)
+            threads = [threading.Thread(target=ecrire, args=(r,)) for r in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        enregistrements = lireJournal(chemin)
+        assert len(enregistrements) + journal.get_nb_perdus() == 8000
+        assert np.array_equal(enregistrements["b"], 2.0 * enregistrements["a"])
+        assert np.array_equal(enregistrements["d"], 4.0 * enregistrements["a"])
+
+    # Internement concurrent de nouvelles chaînes : un identifiant distinct par chaîne
+    console = TelemetrieConsole()
+    noms = [f"robot{k}" for k in range(200)]
+    identifiants = [[] for _ in range(4)]
+    threads = [threading.Thread(target=lambda r=r: identifiants[r].extend(console.identifiant(n) for n in noms))
+               for r in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(liste == identifiants[0] for liste in identifiants)
+    assert sorted(identifiants[0]) == list(range(200)) and [console.chaine(i) for i in identifiants[0]] == noms
+
+    # Mode désactivé : rien n'est écrit
+    avant = sortie.getvalue()
+    trieur.set_telemetrie(DESACTIVEE)
+    trieur.sortNextCube([{"id": "C2"}])
+    assert sortie.getvalue() == avant
+    print("=== Fin test télémétrie ===\n")
+
+
+def test_monde():
+    print("=== Test carte des cubes ===")
+    rng = np.random.default_rng(5)
+    carte = CarteCubes(tailleCellule=0.5, rayonFusion=0.0)
+    points = {carte.ajouter(x, y): (x, y) for x, y in rng.uniform(-5.0, 5.0, (500, 2)).tolist()}
+    for ident in list(points)[:100]:
+        assert carte.retirer(ident)
+        del points[ident]
+    # Requêtes identiques à une recherche exhaustive
+    for x, y in rng.uniform(-7.0, 7.0, (200, 2)).tolist():
+        distances = {k: (px - x) ** 2 + (py - y) ** 2 for k, (px, py) in points.items()}
+        ident, _, _ = carte.plusProche(x, y)
+        assert distances[ident] == min(distances.values())
+        assert sorted(carte.dansRayon(x, y, 1.5)) == sorted(k for k, d in distances.items() if d <= 1.5 ** 2)
+
+    # Observations fusionnées et réservations
+    carte = CarteCubes(rayonFusion=0.05)
+    a = carte.ajouter(1.0, 1.0)
+    assert carte.ajouter(1.02, 1.0) == a and len(carte) == 1
+    assert carte.reserver(a, "C1") and not carte.reserver(a, "C2")
+    assert carte.plusProche(0.0, 0.0, proprietaire="C2") is None
+    # Un cube réservé revu n'est pas dupliqué, et retirerProche() retire bien ce cube-là
+    assert carte.ajouter(1.01, 1.01) == a and len(carte) == 1 and carte.get_reservation(a) == "C1"
+    b = carte.ajouter(3.0, 3.0)
+    assert carte.retirerProche(1.0, 1.0) == a and list(carte.get_cubes()) == [b] and carte.get_nb_reservations() == 0
+    carte.retirer(b)
+    a = carte.ajouter(1.0, 1.0)
+    carte.reserver(a, "C1")
+
+    # collectCycle() vise le cube connu le plus proche, via A*
+    grille = GrilleOccupation(20, 20, resolution=0.1)
+    planificateur = PlanificateurAStar(grille)
+    planificateur.definirZoneTri([(0, 0)])
+    cubesReels = [(0.35, 0.35), (1.05, 0.25), (1.85, 1.85)]
+    for x, y in cubesReels:
+        carte.ajouter(x, y)
+    carte.liberer(a)
+    carte.retirer(a)
+    collector = RobotCollector(name="Carto", ecartementRoues=0.5, stockageMax=2)
+    collector.set_planificateur(planificateur)
+    collector.set_carte(carte)
+    collector.set_position(0.05, 0.05, 0.0)
+
+    def detection_proche():
+        x, y, _ = collector.get_position()
+        ramasses = [cube["position"] for cube in collector.get_liste_cubes()]
+        for cube in cubesReels:
+            if cube not in ramasses and abs(cube[0] - x) < 0.1 and abs(cube[1] - y) < 0.1:
+                return cube
+        return None
+    collector.detectCube = detection_proche
+    collector.collectCycle()
+    ordre = [cube["position"] for cube in collector.get_liste_cubes()]
+    print(f"Cubes ramassés dans l'ordre : {ordre} | restant en carte : {list(carte.get_cubes().values())}")
+    assert ordre == [(0.35, 0.35), (1.05, 0.25)]
+    assert list(carte.get_cubes().values()) == [(1.85, 1.85)]
+
+    # Sans planificateur le robot n'atteint pas les cubes : ils restent en carte, sans réservation
+    carte = CarteCubes()
+    carte.ajouterLot([(1.0 + k, 2.0) for k in range(5)])
+    collector = RobotCollector(name="SansPlan", ecartementRoues=0.5, stockageMax=3)
+    collector.set_telemetrie(DESACTIVEE)
+    collector.set_carte(carte)
+    collector.collectCycle()
+    assert collector.get_position()[:2] == (0.0, 0.0) and collector.get_stock_actuel() == 0
+    assert len(carte) == 5 and carte.get_nb_reservations() == 0
+    print("=== Fin test carte des cubes ===\n")
+
+def test_allocation():
+    print("=== Test allocation des cubes ===")
+    rng = np.random.default_rng(11)
+    # Optimalité (à la précision près) face à une recherche exhaustive, y compris couples interdits
+    for n, m in ((3, 5), (5, 3), (4, 4)):
+        couts = rng.uniform(0.0, 10.0, (n, m))
+        couts[0, 0] = np.inf
+        affectation, prix = resoudreAffectation(couts, precision=1e-6)
+        lignes = np.flatnonzero(affectation >= 0)
+        assert len(lignes) == min(n, m) and len(set(affectation[lignes])) == len(lignes)
+        total = couts[lignes, affectation[lignes]].sum()
+        if n <= m:
+            meilleur = min(sum(couts[i, p[i]] for i in range(n)) for p in itertools.permutations(range(m), n))
+        else:
+            meilleur = min(sum(couts[p[j], j] for j in range(m)) for p in itertools.permutations(range(n), m))
+        assert total <= meilleur + 1e-6
+        # Démarrage à chaud après une perturbation des coûts
+        couts2 = couts + rng.normal(0.0, 0.5, couts.shape)
+        affectation2, _ = resoudreAffectation(couts2, prix, 1e-6, affectation)
+        froid, _ = resoudreAffectation(couts2, precision=1e-6)
+        l2, l3 = np.flatnonzero(affectation2 >= 0), np.flatnonzero(froid >= 0)
+        assert abs(couts2[l2, affectation2[l2]].sum() - couts2[l3, froid[l3]].sum()) <= 2e-6
+
+    # Deux collecteurs : chacun son cube, réservé dans la carte ; robot plein ignoré
+    carte = CarteCubes(rayonFusion=0.0)
+    proche, loin = carte.ajouter(0.5, 0.0), carte.ajouter(3.0, 0.0)
+    c1 = RobotCollector(name="A1", ecartementRoues=0.5, stockageMax=2)
+    c2 = RobotCollector(name="A2", ecartementRoues=0.5, stockageMax=2)
+    c3 = RobotCollector(name="A3", ecartementRoues=0.5, stockageMax=0)
+    c1.set_position(0.0, 0.0, 0.0)
+    c2.set_position(3.5, 0.0, 0.0)
+    allocateur = AllocateurCubes(carte)
+    for robot in (c1, c2, c3):
+        allocateur.ajouterRobot(robot)
+    affectations = allocateur.allouer()
+    print(f"Affectations : {affectations}")
+    assert affectations == {"A1": proche, "A2": loin}
+    assert carte.get_reservation(proche) == "A1" and carte.get_reservation(loin) == "A2"
+    assert c3.get_cible_affectee() is None
+
+    # Nouveau cube : ré-allocation incrémentale ; batterie faible : le robot perd sa cible
+    nouveau = carte.ajouter(3.2, 0.0)
+    c2.set_battery_level(10.0)
+    affectations = allocateur.allouer()
+    assert affectations == {"A1": proche} and carte.get_reservation(loin) is None
+    assert c2.get_cible_affectee() is None
+
+    # collectCycle() part vers la cible affectée plutôt que vers le cube le plus proche
+    c1.set_carte(carte)
+    c1.set_cible_affectee(nouveau)
+    assert c1._choisirCible()[0] == nouveau
+    # Cible affectée entre-temps réservée par un autre collecteur : repli sur le plus proche libre
+    carte.liberer(nouveau)
+    carte.reserver(nouveau, "X")
+    assert c1._choisirCible()[0] != nouveau and carte.get_reservation(nouveau) == "X"
+    # Cube réservé hors de la flotte : jamais attribué, réservation conservée
+    affectations = allocateur.allouer()
+    assert nouveau not in affectations.values() and carte.get_reservation(nouveau) == "X"
+    carte.liberer(nouveau)
+    allocateur.retirerRobot(c1)
+    assert c1.get_cible_affectee() is None and carte.get_reservation(proche) is None
+
+    # Ré-allocation incrémentale : à partir du second allouer(), prix et affectation précédente
+    # servent de démarrage à chaud à l'enchère
+    carte = CarteCubes(rayonFusion=0.0)
+    carte.ajouterLot([(1.0, 0.0), (4.0, 0.0), (8.0, 0.0)])
+    allocateur = AllocateurCubes(carte)
+    for k, x in enumerate((0.0, 5.0)):
+        robot = RobotCollector(name=f"W{k}", ecartementRoues=0.5, stockageMax=2)
+        robot.set_position(x, 0.0, 0.0)
+        allocateur.ajouterRobot(robot)
+    demarrages = []
+    resoudre = allocation._resoudreRegion
+    def espion(tache):
+        _, prix, _, initiale = tache
+        demarrages.append(prix is not None and initiale is not None and bool((initiale >= 0).any()))
+        return resoudre(tache)
+    allocation._resoudreRegion = espion
+    try:
+        premiere = allocateur.allouer()
+        robot.set_position(6.0, 0.0, 0.0)
+        assert allocateur.allouer() == premiere
+    finally:
+        allocation._resoudreRegion = resoudre
+    assert demarrages == [False, True]
+
+    # Découpage en régions : même résultat séquentiel ou sur pool de processus
+    carte = CarteCubes(rayonFusion=0.0)
+    carte.ajouterLot(rng.uniform(0.0, 20.0, (60, 2)).tolist())
+    positions = rng.uniform(0.0, 20.0, (30, 2)).tolist()
+    resultats = []
+    for nbProcessus in (0, 2):
+        allocateur = AllocateurCubes(carte, tailleRegion=10, nbProcessus=nbProcessus)
+        for k, (x, y) in enumerate(positions):
+            robot = RobotCollector(name=f"R{k}", ecartementRoues=0.5, stockageMax=3)
+            robot.set_position(x, y, 0.0)
+            allocateur.ajouterRobot(robot)
+        resultats.append(allocateur.allouer())
+        allocateur.fermer()
+    assert resultats[0] == resultats[1] and len(set(resultats[0].values())) == 30
+    print("=== Fin test allocation des cubes ===\n")
+
+def test_chaine_tri():
+    print("=== Test chaîne collecte → tri ===")
+    corbeilles = {"bleu": (0.0, 0.6), "vert": (1.0, 0.0), "rouge": (0.8, 0.8), "doute": (-0.5, 0.5)}
+    couleurs = {"rouge": (200, 30, 30), "vert": (30, 180, 40), "bleu": (30, 60, 200)}
+    trieurs = [RobotTrieur(name=f"TriC{k}", nbArticulations=2, corbeilles=dict(corbeilles), seuilConfiance=0.6)
+               for k in range(2)]
+    deposes = []
+    verrou = threading.Lock()
+    for trieur in trieurs:
+        trieur.set_telemetrie(DESACTIVEE)
+        def navigue(xC, yC, nom=trieur.get_name()):
+            with verrou:
+                deposes.append((nom, (xC, yC)))
+        trieur.navigateArmTo = navigue
+
+    # Contre-pression : chaîne non démarrée, file pleine → dépôt refusé après le délai
+    chaine = ChaineTri(trieurs, capacite=2)
+    assert chaine.deposer({"id": 0}) and chaine.deposer({"id": 1})
+    assert not chaine.deposer({"id": 2}, timeout=0.01) and chaine.get_profondeur() == 2
+
+    # Trois collecteurs concurrents, deux trieurs : tous les cubes sont triés dans la bonne corbeille
+    attendus = []
+    def collecter(k):
+        for i in range(20):
+            couleur = list(couleurs)[(k + i) % 3]
+            with verrou:
+                attendus.append(corbeilles[couleur])
+            chaine.deposer({"id": (k, i), "crop": np.full((8, 8, 3), couleurs[couleur], dtype=np.uint8)})
+    with chaine:
+        collecteurs = [threading.Thread(target=collecter, args=(k,)) for k in range(3)]
+        for thread in collecteurs:
+            thread.start()
+        for thread in collecteurs:
+            thread.join()
+    stats = chaine.get_statistiques()
+    print(stats)
+    assert stats.nbEntres == stats.nbTries == 62
+    assert sorted(cible for _, cible in deposes) == sorted(attendus + [corbeilles["doute"]] * 2)
+    assert {nom for nom, _ in deposes} == {"TriC0", "TriC1"}
+    assert stats.profondeurMax <= 2 and stats.get_cubes_par_minute() > 0
+    assert not chaine.deposer({"id": 99})
+
+    # Fermeture pendant un dépôt bloqué (chaîne non démarrée, file pleine) : aucun marqueur de fin
+    # n'est placé devant lui ; fermer() échoue, puis aboutit une fois le cube entré et trié
+    chaine = ChaineTri(trieurs[:1], capacite=1)
+    assert chaine.deposer({"id": 0})
+    bloque = threading.Thread(target=chaine.deposer, args=({"id": 1},))
+    bloque.start()
+    while chaine._depotsEnCours == 0:
+        time.sleep(0.001)
+    assert not chaine.fermer(timeout=0.01) and not chaine.deposer({"id": 2}, timeout=0.01)
+    chaine.demarrer()
+    assert chaine.fermer(timeout=5.0)
+    bloque.join()
+    assert chaine.get_statistiques().nbTries == 2
+
+    # Trieur en échec : les dépôts lèvent au lieu de bloquer sur une file qui ne se vide plus
+    panne = RobotTrieur(name="TriPanne", nbArticulations=2, corbeilles=dict(corbeilles))
+    panne.set_telemetrie(DESACTIVEE)
+    def casse(xC, yC):
+        raise ValueError("servo bloqué")
+    panne.navigateArmTo = casse
+    chaine = ChaineTri([panne], capacite=1, tailleLot=1)
+    chaine.demarrer()
+    try:
+        for i in range(50):
+            chaine.deposer({"id": i}, timeout=1.0)
+        assert False, "deposer() aurait dû lever"
+    except RuntimeError as erreur:
+        assert isinstance(erreur.__cause__, ValueError)
+    try:
+        chaine.fermer(timeout=1.0)
+        assert False, "fermer() aurait dû lever"
+    except RuntimeError:
+        pass
+    assert isinstance(chaine.get_erreur(), ValueError)
+
+    # Collecteur : returnToSort() remet sa charge à la chaîne, dans l'ordre de ramassage
+    deposes.clear()
+    chaine = ChaineTri(trieurs[:1], capacite=4, tailleLot=1)
+    collector = RobotCollector(name="CollC", ecartementRoues=0.5, stockageMax=3)
+    collector.set_telemetrie(DESACTIVEE)
+    collector.set_chaine_tri(chaine)
+    collector.restoreStorage([{"crop": np.full((8, 8, 3), couleurs[couleur], dtype=np.uint8)}
+                              for couleur in ("rouge", "bleu", "vert")])
+    with chaine:
+        collector.returnToSort()
+        assert collector.get_stock_actuel() == 0 and collector.get_liste_cubes() == []
+    assert [cible for _, cible in deposes] == [corbeilles["rouge"], corbeilles["bleu"], corbeilles["vert"]]
+    print("=== Fin test chaîne collecte → tri ===\n")
+
+def test_simulation_evenements():
+    print("=== Test simulation à événements discrets ===")
+    corbeilles = {"bleu": (0.0, 0.6), "vert": (1.0, 0.0), "rouge": (0.8, 0.8), "doute": (-0.5, 0.5)}
+
+    def mission(graine, consommation=0.5):
+        collecteurs = [RobotCollector(name=f"Sim{k}", ecartementRoues=0.5, stockageMax=3) for k in range(3)]
+        trieurs = [RobotTrieur(name="SimTri", nbArticulations=2, corbeilles=dict(corbeilles))]
+        for robot in collecteurs + trieurs:
+            robot.set_telemetrie(DESACTIVEE)
+        simulation = SimulateurMission(collecteurs, trieurs, graine=graine, nbCubesInitiaux=4,
+                                       consommation=consommation, garderJournal=True)
+        nbEvenements = simulation.executer(2 * 3600.0)
+        return simulation, collecteurs, nbEvenements
+
+    simulation, collecteurs, nbEvenements = mission(7)
+    compteurs = simulation.get_compteurs()
+    print(f"2 h simulées en {nbEvenements} événements : {compteurs}")
+    assert simulation.get_temps() == 2 * 3600.0
+    # Le temps saute d'un événement au suivant : bien moins d'itérations qu'à pas fixe de 0.1 s
+    assert 0 < nbEvenements < 2 * 3600.0 / 0.1 / 10
+    journal = simulation.get_journal()
+    assert len(journal) == nbEvenements and all(a[0] <= b[0] for a, b in zip(journal, journal[1:]))
+    # Chaque cube apparu est en carte, à bord, en attente de tri ou trié
+    assert compteurs["ARRIVEE_CUBE"] == simulation.get_nb_collectes()
+    a_bord = sum(robot.get_stock_actuel() for robot in collecteurs)
+    assert simulation.get_nb_collectes() + len(simulation.get_carte()) == compteurs["CUBE_APERCU"]
+    assert simulation.get_nb_tries() <= simulation.get_nb_collectes() - a_bord
+    assert all(0.0 <= robot.get_battery_level() <= 100.0 for robot in collecteurs)
+
+    # Déterminisme : même graine, même suite d'événements ; autre graine, autre suite
+    assert mission(7)[0].get_journal() == journal
+    assert mission(8)[0].get_journal() != journal
+
+    # Consommation forte : le seuil de batterie est atteint en route, le collecteur rentre
+    simulation, collecteurs, _ = mission(7, consommation=20.0)
+    compteurs = simulation.get_compteurs()
+    assert compteurs["SEUIL_BATTERIE"] > 0
+    assert compteurs["RECHARGE_TERMINEE"] <= compteurs["ARRIVEE_TRI"]
+    print("=== Fin test simulation à événements discrets ===\n")
+
+def test_odometrie():
+    print("=== Test odométrie encodeurs par blocs ===")
+    rng = np.random.default_rng(14)
+    ecartement, metresParTick, n = 0.5, 1e-4, 5000
+    # Incréments constants (3 ticks à droite, 2 à gauche) et pas de temps variables : arc de cercle exact
+    temps = np.cumsum(rng.uniform(1e-4, 4e-4, n + 1))
+    gauche = 1000 + 2 * np.arange(n + 1)
+    droite = 7 + 3 * np.arange(n + 1)
+    odometrie = OdometrieEncodeurs(ecartement, metresParTick)
+    x, y, theta = odometrie.integrerBloc((0.0, 0.0, 0.0), temps, gauche, droite)
+    thetaAttendu = n * (3 - 2) * metresParTick / ecartement
+    rayon = ecartement / 2.0 * (3 + 2) / (3 - 2)
+    print(f"Pose intégrée : ({x:.6f}, {y:.6f}, {theta:.6f})")
+    assert abs(theta - thetaAttendu) < 1e-12
+    assert abs(x - rayon * np.sin(thetaAttendu)) < 1e-12 and abs(y - rayon * (1 - np.cos(thetaAttendu))) < 1e-12
+    v, omega = odometrie.get_vitesses()
+    assert abs(v - n * 2.5 * metresParTick / (temps[-1] - temps[0])) < 1e-9
+
+    # Découpage en blocs et rebouclage de compteurs 16 bits : même pose
+    odometrie = OdometrieEncodeurs(ecartement, metresParTick, bitsCompteur=16)
+    pose = (0.0, 0.0, 0.0)
+    for debut in range(0, n + 1, 777):
+        fin = debut + 777
+        pose = odometrie.integrerBloc(pose, temps[debut:fin], gauche[debut:fin] % 65536, droite[debut:fin] % 65536)
+    assert np.allclose(pose, (x, y, theta), atol=1e-12) and odometrie.get_nb_echantillons() == n
+
+    # Covariance : symétrique, positive, croissante avec la distance parcourue
+    odometrie = OdometrieEncodeurs(ecartement, metresParTick, covariance=True)
+    odometrie.integrerBloc((0.0, 0.0, 0.0), temps[:2501], gauche[:2501], droite[:2501])
+    P1 = odometrie.get_covariance()
+    odometrie.integrerBloc((0.0, 0.0, 0.0), temps[2500:], gauche[2500:], droite[2500:])
+    P2 = odometrie.get_covariance()
+    assert np.allclose(P2, P2.T) and np.all(np.linalg.eigvalsh(P2) >= -1e-15)
+    assert np.all(np.diag(P2) > np.diag(P1))
+
+    # RobotCollector : une mise à jour de pose par bloc
+    collector = RobotCollector(name="Odo", ecartementRoues=ecartement, stockageMax=2)
+    collector.set_odometrie(OdometrieEncodeurs(ecartement, metresParTick))
+    collector.integrateEncoders(temps[:1000], gauche[:1000], droite[:1000])
+    collector.integrateEncoders(temps[999:], gauche[999:], droite[999:])
+    assert np.allclose(collector.get_position(), (x, y, theta), atol=1e-12)
+    print("=== Fin test odométrie encodeurs par blocs ===\n")
+
+
+def test_energie():
+    print("=== Test champ d'énergie de retour ===")
+    modele = ModeleEnergie(parMetre=1.0, parQuartDeTour=0.5, parRamassage=0.2, marge=2.0)
+    assert modele.coutDeplacement(2.0, np.pi) == 2.0 + 2 * 0.5
+    # Grille 6x6 de 1 m, zone de tri en (0, 0) : 3 cellules vers l'ouest, orienté ouest ou est
+    grille = GrilleOccupation(6, 6, resolution=1.0)
+    champ = ChampEnergie(grille, [(0, 0)], modele)
+    assert champ.energie(0, 0) == 0.0
+    assert champ.energie(0, 3, 2) == 3.0 and champ.energie(0, 3, 0) == 3.0 + 2 * 0.5
+    assert champ.energie(2, 3) == 5.0 + 0.5   # 5 cellules et un virage
+    assert champ.energieEn(3.5, 0.5, np.pi) == 3.0 and champ.toArray().shape == (6, 6)
+
+    # Obstacles : réparation incrémentale identique à un recalcul complet
+    rng = np.random.default_rng(15)
+    for _ in range(20):
+        grille.set_couts({(int(l), int(c)): (np.inf if rng.random() < 0.6 else float(rng.integers(1, 4)))
+                          for l, c in rng.integers(0, 6, (3, 2)) if (l, c) != (0, 0)})
+        reference = ChampEnergie(grille, [(0, 0)], modele, suivreGrille=False)
+        assert np.array_equal(champ._energie, reference._energie)
+    assert champ.get_nb_recalculs() < 20
+
+    # shouldReturnToSort : batterie comparée à l'énergie de retour depuis la cellule courante
+    grille = GrilleOccupation(20, 20, resolution=1.0)
+    collector = RobotCollector(name="Energie", ecartementRoues=0.5, stockageMax=5)
+    assert collector.get_battery_level() > 20.0 and not collector.shouldReturnToSort()
+    collector.set_energie(ChampEnergie(grille, [(0, 0)], modele))
+    collector.set_position(18.5, 0.5, np.pi)
+    collector.set_battery_level(20.0)   # 18 m de retour + ramassage + marge = 20.2 %
+    assert collector.shouldReturnToSort()
+    collector.set_position(2.5, 0.5, np.pi)
+    collector.set_battery_level(10.0)   # sous l'ancien seuil de 20 %, mais le tri est à 2 m
+    assert not collector.shouldReturnToSort()
+    assert collector.storeCube((3.0, 0.5)) and abs(collector.get_battery_level() - 9.8) < 1e-12
+
+    # collectCycle avec planificateur et champ : les trajets entre points de passage sont facturés
+    # et un pas sur place coûte parPas, la boucle s'arrête donc toujours (aucun cube ici)
+    grille = GrilleOccupation(20, 20, resolution=1.0)
+    planificateur = PlanificateurAStar(grille)
+    planificateur.definirZoneTri([(0, 0)])
+    planificateur.ajouterDepartement("nord", [(18, 2)])
+    planificateur.ajouterDepartement("est", [(2, 18)])
+    collector = RobotCollector(name="EnergieCycle", ecartementRoues=0.5, stockageMax=5)
+    collector.set_telemetrie(DESACTIVEE)
+    collector.set_planificateur(planificateur)
+    collector.set_energie(ChampEnergie(grille, [(0, 0)], modele))
+    collector.collectCycle()
+    batterie = collector.get_battery_level()
+    print(f"Cycle sans cube : retour au tri avec {batterie:.1f} % de batterie")
+    assert collector.get_etat() == "tri" and 0.0 < batterie < 100.0 - 2 * 16.0
+
+    # Mission : le collecteur ne part que s'il peut revenir, aucune batterie vide à l'arrivée
+    corbeilles = {"bleu": (0.0, 0.6), "vert": (1.0, 0.0), "rouge": (0.8, 0.8), "doute": (-0.5, 0.5)}
+
+    def mission(champ):
+        collecteurs = [RobotCollector(name=f"En{k}", ecartementRoues=0.5, stockageMax=10) for k in range(2)]
+        trieurs = [RobotTrieur(name="EnTri", nbArticulations=2, corbeilles=dict(corbeilles))]
+        for robot in collecteurs + trieurs:
+            robot.set_telemetrie(DESACTIVEE)
+        simulation = SimulateurMission(collecteurs, trieurs, graine=3, tailleArene=20.0, tauxApparition=0.5,
+                                       nbCubesInitiaux=50, consommation=3.0, champEnergie=champ)
+        simulation.executer(3600.0)
+        return simulation
+
+    fixe = mission(None)
+    avecChamp = mission(ChampEnergie(GrilleOccupation(40, 40, resolution=0.5), [(0, 0)], ModeleEnergie(parMetre=3.0)))
+    print(f"Seuil fixe : {fixe.get_nb_retours()} retours, {fixe.get_nb_pannes()} batteries vides | "
+          f"champ : {avecChamp.get_nb_retours()} retours, {avecChamp.get_nb_pannes()} batteries vides")
+    assert fixe.get_nb_pannes() > 0 and avecChamp.get_nb_pannes() == 0
+    assert avecChamp.get_compteurs()["SEUIL_BATTERIE"] == 0 and avecChamp.get_nb_collectes() > 0
+    print("=== Fin test champ d'énergie de retour ===\n")
+
+
+def test_capteurs():
+    print("=== Test gestionnaire de capteurs multi-fréquence ===")
+    # Horloge simulée (pas de 1/16 s, exacts en binaire) : échéances déterministes
+    temps = [0.0]
+    horloge = lambda: temps[0]
+    gestionnaire = GestionnaireCapteurs(horloge=horloge)
+    lectures = {"imu": 0, "gps": 0}
+
+    def lire(nom):
+        lectures[nom] += 1
+        return lectures[nom]
+
+    gestionnaire.ajouter(Capteur("imu", lambda: lire("imu"), 8.0, bloquant=False, horloge=horloge))
+    gestionnaire.ajouter(Capteur("gps", lambda: lire("gps"), 2.0, horloge=horloge))
+    gestionnaire.ajouter(Capteur("panne", lambda: 1 / 0, 4.0, horloge=horloge))
+    for k in range(17):
+        temps[0] = k / 16
+        gestionnaire.interroger()
+    assert lectures == {"imu": 9, "gps": 3}
+    statistiques = gestionnaire.get_statistiques()
+    print(statistiques)
+    assert statistiques["imu"]["frequenceMesuree"] == 8.0 and statistiques["gps"]["frequenceMesuree"] == 2.0
+    assert statistiques["panne"]["erreurs"] == 5 and statistiques["panne"]["anciennete"] == float("inf")
+    temps[0] = 1.0 + 1 / 16
+    assert gestionnaire.get_capteur("imu").get_anciennete() == 1 / 16
+    assert gestionnaire.valeur("gps") == 3 and gestionnaire.valeur("gps", ageMax=0.05) is None
+    assert [v for _, v in gestionnaire.get_capteur("imu").historique()] == list(range(1, 10))
+    gestionnaire.retirer("imu")
+    temps[0] = 2.0
+    gestionnaire.interroger()
+    assert lectures["imu"] == 9 and "imu" not in gestionnaire
+
+    # Threads : une E/S lente (bloquante) ne retarde pas la lecture du cache par la boucle de contrôle
+    collector = RobotCollector(name="Capteurs", ecartementRoues=0.5, stockageMax=3)
+    collector.set_telemetrie(DESACTIVEE)
+    camera = CameraSynthetique(640, 480, cote=40, couleur="vert")
+
+    def imageLente():
+        time.sleep(0.05)
+        return camera.derniereImage()
+
+    collector.add_sensor(Capteur(CAPTEUR_CAMERA, imageLente, 50.0))
+    collector.add_sensor(Capteur(CAPTEUR_ENCODEURS, lambda: (0.5, 0.5), 200.0, bloquant=False))
+    assert collector.readSensor(CAPTEUR_CAMERA) is None
+    collector.startSensors()
+    try:
+        debut = time.perf_counter()
+        while collector.readSensor(CAPTEUR_CAMERA) is None and time.perf_counter() - debut < 5.0:
+            time.sleep(0.01)
+        attenteMax = 0.0
+        for _ in range(20):
+            debut = time.perf_counter()
+            collector.move(0.1)
+            attenteMax = max(attenteMax, time.perf_counter() - debut)
+            time.sleep(0.005)
+    finally:
+        collector.stopSensors()
+    collector.status()
+    gestionnaire = collector.get_gestionnaire_capteurs()
+    camera_ = gestionnaire.get_capteur(CAPTEUR_CAMERA)
+    print(f"move() le plus long : {attenteMax * 1e3:.2f} ms | caméra {camera_.get_nb_lectures()} lectures,"
+          f" {camera_.get_nb_sauts()} échéances sautées")
+    # Encodeurs (0.5 m/s) lus dans le cache : 20 pas de 0.1 s, et le cube vu par la caméra est ramassé
+    assert abs(collector.get_position()[0] - 1.0) < 1e-9
+    assert collector.get_stock_actuel() >= 1 and collector.get_liste_cubes()[0]["crop"] is not None
+    assert attenteMax < 0.05 and camera_.get_nb_sauts() > 0
+    # Encodeurs arrêtés : au-delà de PERIODES_ENCODEURS_MAX périodes, la vitesse en cache est périmée
+    time.sleep(PERIODES_ENCODEURS_MAX * collector.get_sensor_period(CAPTEUR_ENCODEURS) + 0.01)
+    assert collector.readSensor(CAPTEUR_ENCODEURS) == (0.5, 0.5) and collector.readWheelSpeeds() == (0.0, 0.0)
+
+    # Liste des capteurs : doublons ignorés, retrait aussi du gestionnaire
+    collector.add_sensor("lidar")
+    collector.add_sensor("lidar")
+    assert collector.get_active_sensors()[-1] == "lidar" and len(collector.get_active_sensors()) == 3
+    collector.remove_sensor(camera_)
+    assert CAPTEUR_CAMERA not in gestionnaire and collector.readSensor(CAPTEUR_CAMERA) is None
+
+    # RobotTrieur : classifyCube() sans image lit le cache de la caméra de tri
+    trieur = RobotTrieur(name="TriCapteurs", nbArticulations=2, seuilConfiance=0.6,
+                         corbeilles={"vert": (1.0, 0.0), "doute": (-0.5, 0.5)})
+    l0, c0 = 240 - 20, 320 - 20
+    trieur.add_sensor(Capteur(CAPTEUR_CAMERA_TRI, lambda: camera.derniereImage()[1][l0:l0 + 40, c0:c0 + 40], 10.0))
+    assert trieur.classifyCube(None) == "doute"
+    trieur.get_gestionnaire_capteurs().interroger()
+    assert trieur.classifyCube(None) == "vert"
+    print("=== Fin test gestionnaire de capteurs multi-fréquence ===\n")
+
+
+def test_planification_tri():
+    print("=== Test planification de l'ordre de tri ===")
+    # Planificateur seul : Held-Karp égal à la recherche exhaustive, heuristique valide
+    rng = np.random.default_rng(17)
+    planificateur = PlanificateurTri(seuilExact=8)
+    for n in range(1, 7):
+        depart, cibles = rng.uniform(-3, 3, 3), rng.uniform(-3, 3, (n, 3))
+        ordre = planificateur.ordonner(depart, cibles)
+        optimum = min(PlanificateurTri.cout(depart, cibles, p) for p in itertools.permutations(range(n)))
+        assert sorted(ordre) == list(range(n)) and planificateur.get_dernier_mode() == "exact"
+        assert abs(PlanificateurTri.cout(depart, cibles, ordre) - optimum) < 1e-9
+    cibles = rng.uniform(-3, 3, (40, 3))
+    ordre = planificateur.ordonner(np.zeros(3), cibles)
+    assert sorted(ordre) == list(range(40)) and planificateur.get_dernier_mode() == "heuristique"
+    assert PlanificateurTri.cout(np.zeros(3), cibles, ordre) <= PlanificateurTri.cout(np.zeros(3), cibles, range(40))
+
+    # RobotTrieur : charge mélangée, dépôts regroupés par corbeille, moins de trajet que l'ordre LIFO
+    corbeilles = {"bleu": (0.0, 0.6), "vert": (1.0, 0.0), "rouge": (0.8, 0.8), "doute": (-0.5, 0.5)}
+    trieur = RobotTrieur(name="TriPlan", nbArticulations=3, corbeilles=dict(corbeilles), seuilConfiance=0.6)
+    trieur.set_telemetrie(DESACTIVEE)
+    rgb = {"rouge": (200, 30, 30), "vert": (30, 180, 40), "bleu": (30, 60, 200)}
+    charge = ["rouge", "vert", "bleu", "rouge", "vert", "bleu", "rouge", "vert"]
+    liste_cubes = [{"id": k, "crop": np.full((16, 16, 3), rgb[c], dtype=np.uint8)} for k, c in enumerate(charge)]
+    depart = trieur.get_angles()
+    lifo = [trieur._anglesCorbeille(c) for c in charge[::-1]]
+    ordre = trieur.sortBatch(liste_cubes)
+    print(f"Ordre planifié : {ordre}")
+    assert liste_cubes == [] and sorted(ordre) == sorted(charge)
+    # Chaque corbeille n'est visitée qu'une fois
+    assert sum(1 for a, b in zip(ordre, ordre[1:]) if a != b) == len(set(charge)) - 1
+    planifie = [trieur._anglesCorbeille(c) for c in ordre]
+    assert PlanificateurTri.cout(depart, planifie, range(8)) < PlanificateurTri.cout(depart, lifo, range(8))
+    assert np.allclose(trieur.get_angles(), planifie[-1])
+    print("=== Fin test planification de l'ordre de tri ===\n")
+
+
+def test_profilage():
+    print("=== Test profilage par méthode ===")
+    # Histogramme : quantiles à 2^(1-7) près en relatif, sur six ordres de grandeur
+    rng = np.random.default_rng(18)
+    valeurs = np.exp(rng.uniform(np.log(50), np.log(5e7), 20_000)).astype(np.int64)
+    histogramme = HistogrammeLatence()
+    for valeur in valeurs.tolist():
+        histogramme.enregistrer(valeur)
+    assert histogramme.get_nb() == len(valeurs) and histogramme.get_max() == valeurs.max()
+    for q in (0.5, 0.9, 0.99):
+        exact = np.quantile(valeurs, q, method="inverted_cdf")
+        assert abs(histogramme.quantile(q) - exact) <= exact / 64 + 1
+    for valeur in (0, 1, 127, 128, 129, 1000, 123_456_789):
+        bas, haut = histogramme.bornes(histogramme.index(valeur))
+        assert bas <= valeur <= haut
+
+    # Instrumentation : comptes par méthode et par robot, méthodes d'origine rendues ensuite
+    origine = RobotCollector.move
+    collector = RobotCollector(name="Profil", ecartementRoues=0.5, stockageMax=2)
+    collector.set_telemetrie(DESACTIVEE)
+    camera = CameraSynthetique(640, 480, cote=40, couleur="vert")
+    collector.set_camera(camera)
+    with Profileur() as profileur:
+        assert RobotCollector.move is not origine and profileur.est_actif()
+        for _ in range(3):
+            collector.move()
+            camera.avancer()
+    assert RobotCollector.move is origine and not profileur.est_actif()
+    collector.move()   # non mesuré
+    assert profileur.histogramme("RobotCollector.move", "Profil").get_nb() == 3
+    assert profileur.histogramme("Robot.move").get_nb() == 3
+    # pickUpCube() relance detectCube() : 2 appels de detectCube() par move() avec ramassage
+    assert profileur.histogramme("RobotCollector.pickUpCube").get_nb() == 2
+    assert profileur.histogramme("RobotCollector.detectCube").get_nb() == 3 + 2
+
+    # Export JSON et texte
+    tampon = io.StringIO()
+    profileur.exporterJson(tampon)
+    instantane = json.loads(tampon.getvalue())
+    entree = next(e for e in instantane["methodes"] if e["methode"] == "RobotCollector.move")
+    assert entree["robot"] == "Profil" and entree["appels"] == 3 and sum(n for _, n in entree["cases"]) == 3
+    assert "RobotCollector.detectCube" in profileur.rapportTexte()
+
+    # Point d'entrée : scénario de test.py instrumenté, répartition par méthode
+    sortie = io.StringIO()
+    profileur = profilerScenarios(["test_robot_trieur", "--par-robot"], sortie=sortie)
+    print(sortie.getvalue())
+    assert profileur.histogramme("RobotTrieur.sortNextCube", "Tri1").get_nb() == 2
+    assert "RobotTrieur.sortNextCube" in sortie.getvalue() and RobotTrieur.sortNextCube.__name__ == "sortNextCube"
+    print("=== Fin test profilage par méthode ===\n")
+
+
+def test_flux_camera():
+    print("=== Test flux caméra en mémoire partagée ===")
+    camera = CameraSynthetique(160, 120, cote=20, couleur="bleu", graine=3)
+    with AnneauImages.creer(120, 160, nbCases=4) as anneau:
+        assert anneau.derniereImage()[0] == -1 and anneau.lire(0) is None
+        for _ in range(3):
+            camera.avancer()
+            anneau.ecrire(camera.derniereImage()[1])
+        numero, vue = anneau.derniereImage()
+        assert numero == 2 and np.array_equal(vue, camera.derniereImage()[1])
+        # Vue sans copie sur le segment partagé ; invalide une fois la case réécrite (tour complet)
+        assert np.shares_memory(vue, anneau.lire(2)) and anneau.est_valide(2)
+        for _ in range(4):
+            anneau.ecrire(camera.derniereImage()[1])
+        assert not anneau.est_valide(2) and anneau.lire(2) is None and anneau.get_horodatage(2) is None
+
+        # Second lecteur rattaché par nom : mêmes octets
+        lecteur = AnneauImages.ouvrir(anneau.get_nom())
+        assert lecteur.get_forme() == (120, 160, 3) and lecteur.get_dernier_numero() == 6
+        assert np.shares_memory(lecteur.derniereImage()[1], lecteur.lire(6))
+        lecteur.fermer()
+
+    # Acquisition dans un autre processus, détection dans celui-ci
+    nbImages = 200
+    collector = RobotCollector(name="Flux", ecartementRoues=0.5, stockageMax=3)
+    collector.set_telemetrie(DESACTIVEE)
+    with AnneauImages.creer(480, 640, nbCases=8) as anneau:
+        collector.set_camera(anneau)
+        acquisition = multiprocessing.Process(target=acquerirSynthetique,
+                                              args=(anneau.get_nom(), nbImages, 200.0, 1, "rouge"))
+        debut = time.perf_counter()
+        acquisition.start()
+        vus, detections, latences, dernier = 0, 0, [], -1
+        while acquisition.is_alive() or dernier < anneau.get_dernier_numero():
+            numero = anneau.get_dernier_numero()
+            if numero == dernier:
+                time.sleep(0.0005)
+                continue
+            horodatage = anneau.get_horodatage(numero)
+            detections += collector.detectCube() is not None
+            if horodatage is not None:
+                latences.append(time.monotonic_ns() - horodatage)
+            dernier = numero
+            vus += 1
+        acquisition.join()
+        duree = time.perf_counter() - debut
+        assert acquisition.exitcode == 0 and anneau.get_dernier_numero() == nbImages - 1
+        latences = np.array(latences) / 1e6
+        print(f"{nbImages / duree:.0f} images/s produites, {vus} traitées ({detections} détections), "
+              f"latence médiane {np.median(latences):.2f} ms, max {latences.max():.2f} ms")
+        assert vus > 0 and detections > 0
+        # Le recadrage du dernier cube détecté est une tranche du segment partagé
+        collector.detectCube()
+        assert np.shares_memory(collector._dernierCrop, anneau.derniereImage()[1])
+        collector.set_camera(None)
+        collector._dernierCrop = None
+
+    # Trieur : sans recadrage fourni, le cube est recadré sur la caméra de tri (vue de l'anneau)
+    trieur = RobotTrieur(name="TriFlux", nbArticulations=3,
+                         corbeilles={"rouge": (0.5, 0.5), "vert": (0.5, -0.5), "bleu": (-0.5, 0.5)})
+    trieur.set_telemetrie(DESACTIVEE)
+    camera = CameraSynthetique(320, 240, cote=40, couleur="vert", graine=5)
+    with AnneauImages.creer(240, 320) as anneau:
+        anneau.ecrire(camera.derniereImage()[1])
+        trieur.set_camera_tri(anneau)
+        crop = trieur.cropFromCamera()
+        assert crop.shape == (40, 40, 3) and np.shares_memory(crop, anneau.derniereImage()[1])
+        del crop
+        cubes = [{"id": 1}]
+        trieur.sortNextCube(cubes)
+        assert cubes == [] and trieur.classifyCube(trieur.cropCube({"id": 2})) == "vert"
+        trieur.set_camera_tri(None)
+
+        # Image réécrite par l'écrivain pendant la détection : résultat écarté (cache compris)
+        class AnneauDechire:
+            # Réponses successives de est_valide(), puis celles de l'anneau
+            def __init__(self, *reponses):
+                self.reponses = list(reponses)
+            def derniereImage(self):
+                return anneau.derniereImage()
+            def est_valide(self, numero):
+                return self.reponses.pop(0) if self.reponses else anneau.est_valide(numero)
+        collector.set_camera(AnneauDechire(False))
+        assert collector.detectCube() is None and collector._dernierCrop is None
+        assert collector.detectCube() is not None and collector._dernierCrop is not None
+        # Vue réécrite entre la détection et la copie du recadrage : cube ramassé sans recadrage
+        collector.set_camera(AnneauDechire(True, False))
+        assert collector.pickUpCube() and "crop" not in collector.get_liste_cubes()[-1]
+        collector.set_camera(None)
+        collector._dernierCrop = None
+        # Trieur : nouvelle tentative sur l'image la plus récente, puis abandon
+        trieur.set_camera_tri(AnneauDechire(False))
+        assert trieur.cropFromCamera().shape == (40, 40, 3)
+        trieur.set_camera_tri(AnneauDechire(False, False))
+        assert trieur.cropFromCamera() is None
+        trieur.set_camera_tri(None)
+    print("=== Fin test flux caméra ===\n")
+
+
+def test_journal_flotte():
+    print("=== Test journal binaire de flotte (memmap, reprise) ===")
+    collector = RobotCollector(name="JournalC", ecartementRoues=0.4, stockageMax=3)
+    trieur = RobotTrieur(name="JournalT", nbArticulations=3, corbeilles={"rouge": (0.5, 0.5), "bleu": (-0.5, 0.5)})
+    for robot in (collector, trieur):
+        robot.set_telemetrie(DESACTIVEE)
+    # Journaux dans un dossier temporaire supprimé en fin de test (lecteurs fermés avant)
+    with tempfile.TemporaryDirectory() as dossier:
+        chemin = os.path.join(dossier, "mission.bin")
+        attendus = []
+        with JournalFlotte(chemin, [collector, trieur], ticksParLot=4) as journal:
+            for k in range(10):
+                collector.set_position(0.1 * k, -0.05 * k, 0.01 * k)
+                collector.set_vitesse(1.0, 0.1)
+                collector.set_battery_level(100.0 - k)
+                if k == 3:
+                    collector.storeCube((0.3, -0.15))
+                trieur.navigateArmTo(*((0.5, 0.5) if k % 2 else (-0.5, 0.5)))
+                trieur.set_etat("tri")
+                assert journal.enregistrer(0.1 * k) == k
+                attendus.append((collector.get_position(), collector.get_stock_actuel(), trieur.get_angles()))
+        # 10 ticks, un en-tête d'une page : 2 lots complets + un partiel écrits d'un bloc
+        assert os.path.getsize(chemin) == 4096 + 10 * 2 * journal.get_dtype().itemsize
+
+        lecteur = LecteurJournal(chemin)
+        assert lecteur.get_nb_ticks() == 10 and lecteur.get_noms() == ["JournalC", "JournalT"]
+        x = lecteur.colonne("x")
+        assert isinstance(lecteur.enregistrements(), np.memmap) and np.shares_memory(x, lecteur.enregistrements())
+        assert np.allclose(x[:, 0], [p[0] for p, _, _ in attendus]) and np.all(lecteur.colonne("batterie")[:, 0] == 100.0 - np.arange(10))
+        assert lecteur.colonne("stock")[:, 0].tolist() == [0, 0, 0, 1, 1, 1, 1, 1, 1, 1]
+        assert np.isnan(lecteur.colonne("angles")[:, 0]).all()
+        assert lecteur.trajectoire("JournalT")["angles"][7].tolist() == attendus[7][2]
+        assert lecteur.chercherInstant(0.55) == 5 and lecteur.chercherInstant(-1.0) == 0 and lecteur.chercherInstant(9.0) == 9
+
+        # Reprise au tick 6 : flotte reconstruite depuis l'en-tête
+        collectorRepris, trieurRepris = lecteur.restaurer(6)
+        assert collectorRepris.get_position() == attendus[6][0] and collectorRepris.get_stock_actuel() == 1
+        assert collectorRepris.get_battery_level() == 94.0 and collectorRepris.get_vitesse() == (1.0, 0.1)
+        assert collectorRepris.get_ecartement_roues() == 0.4 and collectorRepris.get_stockage_max() == 3
+        assert trieurRepris.get_angles() == attendus[6][2] and trieurRepris.get_etat() == "tri"
+        assert trieurRepris.get_corbeilles() == trieur.get_corbeilles()
+        lecteur.restaurerDans([collector, trieur], 2)
+        assert collector.get_stock_actuel() == 0 and collector.get_position() == attendus[2][0]
+        lecteur.restaurerDans([collector, trieur], 7)
+        assert collector.get_stock_actuel() == len(collector.get_liste_cubes()) == 1
+        try:
+            collector.restoreStorage([{}] * 4)
+            assert False, "restoreStorage() aurait dû refuser un stock au-delà de la capacité"
+        except ValueError:
+            pass
+        lecteur.fermer()
+
+        # Tick incomplet en fin de fichier (écriture interrompue) : ignoré
+        with open(chemin, "ab") as fichier:
+            fichier.write(b"\0" * 10)
+        assert LecteurJournal(chemin).get_nb_ticks() == 10
+        with open(os.path.join(dossier, "autre.bin"), "wb") as fichier:
+            fichier.write(b"\0" * 64)
+        try:
+            LecteurJournal(os.path.join(dossier, "autre.bin"))
+            assert False, "Un fichier étranger doit être refusé"
+        except ValueError as erreur:
+            print(f"Fichier refusé : {erreur}")
+
+        # Flotte vectorisée : un tick = copie des colonnes de SimulationFlotte
+        flotte = SimulationFlotte(50)
+        flotte.set_vitesses(np.full(50, 0.5), np.linspace(-0.2, 0.2, 50))
+        robots = [RobotCollector(name=f"F{i}", ecartementRoues=0.5, stockageMax=3) for i in range(50)]
+        cheminFlotte = os.path.join(dossier, "flotte.bin")
+        with JournalFlotte(cheminFlotte, robots) as journal:
+            for k in range(100):
+                flotte.step(0.1)
+                journal.enregistrerFlotte(flotte, 0.1 * k)
+        lecteur = LecteurJournal(cheminFlotte)
+        reprise = lecteur.restaurer(-1)
+        assert np.allclose([r.get_position() for r in reprise], flotte.get_positions())
+        assert [r.get_etat() for r in reprise[:2]] == ["en mouvement"] * 2
+        lecteur.fermer()
+        del x
+    print("=== Fin test journal de flotte ===\n")
+
+
+def test_calibration():
+    print("=== Test calibration de la zone de tri par marqueurs ===")
+    # Codage des marqueurs : tous les identifiants se relisent, un bit inversé est rejeté
+    for identifiant in range(256):
+        assert lireMarqueur(np.where(motifMarqueur(identifiant), 40.0, 210.0), (0, 0, 6, 6)) == identifiant
+    faux = np.where(motifMarqueur(5), 40.0, 210.0)
+    faux[2, 3] = 250.0 - faux[2, 3]
+    assert lireMarqueur(faux, (0, 0, 6, 6)) is None
+
+    # Fusion : la médiane puis le filtre écartent une lecture aberrante
+    filtre = FiltrePose.fusionner([(1.0, 2.0), (1.002, 2.0), (0.998, 2.001), (1.5, 2.5)], 0.002 ** 2)
+    assert filtre.get_nb_rejets() == 1 and filtre.get_nb_mesures() == 3
+    assert abs(filtre.get_pose()[0] - 1.0) < 1e-3 and filtre.get_ecart_type() < 0.002
+
+    nominales = {"rouge": (0.5, 0.5), "vert": (0.5, -0.5), "bleu": (-0.5, 0.5), "doute": (-0.5, -0.5)}
+    reelles = {"rouge": (0.52, 0.49), "vert": (0.5, -0.47), "bleu": (-0.51, 0.53), "doute": (-0.5, -0.5)}
+    trieur = RobotTrieur(name="Calib", nbArticulations=3, corbeilles=dict(nominales))
+    trieur.set_telemetrie(DESACTIVEE)
+    camera = CameraMarqueurs(reelles, graine=4)
+    calibrateur = CalibrateurZone(nbImages=6)
+    trieur.set_camera_tri(camera)
+    trieur.set_calibrateur(calibrateur)
+
+    trieur.calibrateSortingZone()
+    for couleur, (x, y) in reelles.items():
+        xC, yC = trieur.get_corbeilles()[couleur]
+        assert math.hypot(xC - x, yC - y) < 0.003, (couleur, xC, yC)
+    assert calibrateur.get_nb_recalibrations() == 4 and calibrateur.get_non_vues() == []
+    print(f"Première calibration : {calibrateur.get_duree_derniere() * 1e3:.0f} ms, {trieur.get_corbeilles()}")
+
+    # Aucune dérive : une image, aucune recalibration, table IK inchangée
+    avant = dict(trieur.get_corbeilles())
+    reconstructions = trieur._tableIK._nbReconstructions
+    trieur.calibrateSortingZone()
+    assert trieur.get_corbeilles() == avant and calibrateur.get_nb_recalibrations() == 4
+    assert trieur._tableIK._nbReconstructions == reconstructions
+    print(f"Vérification sans dérive : {calibrateur.get_duree_derniere() * 1e3:.0f} ms")
+
+    # Corbeille légèrement déplacée (dans sa fenêtre) puis déplacée loin (recherche dans toute l'image)
+    camera.deplacer("vert", 0.46, -0.48)
+    trieur.calibrateSortingZone()
+    assert calibrateur.get_nb_recalibrations() == 5 and trieur.get_corbeilles()["rouge"] == avant["rouge"]
+    assert math.hypot(trieur.get_corbeilles()["vert"][0] - 0.46, trieur.get_corbeilles()["vert"][1] + 0.48) < 0.003
+    camera.deplacer("vert", -0.1, -0.7)
+    trieur.calibrateSortingZone()
+    assert math.hypot(trieur.get_corbeilles()["vert"][0] + 0.1, trieur.get_corbeilles()["vert"][1] + 0.7) < 0.003
+    assert trieur._tableIK._nbReconstructions == reconstructions + 2
+
+    # Marqueur masqué : la corbeille garde sa position et est signalée
+    positionDoute = trieur.get_corbeilles()["doute"]
+    camera.deplacer("doute", 5.0, 5.0)      # Hors du champ
+    calibrateur.get_cache().invalider("doute")
+    trieur.calibrateSortingZone()
+    assert calibrateur.get_non_vues() == ["doute"] and trieur.get_corbeilles()["doute"] == positionDoute
+    calibrateur.fermer()
+    print("=== Fin test calibration ===\n")
+
+
 if __name__ == "__main__":
     test_robot_collector()
     test_robot_trieur()
+    test_simulation_flotte()
+    test_robot_compact()
+    test_navigation()
+    test_vision()
+    test_classification_lot()
+    test_cinematique_bras()
+    test_ordonnanceur()
+    test_banque_pid()
+    test_telemetrie()
+    test_monde()
+    test_allocation()
+    test_chaine_tri()
+    test_simulation_evenements()
+    test_odometrie()
+    test_energie()
+    test_capteurs()
+    test_planification_tri()
+    test_profilage()
+    test_flux_camera()
+    test_journal_flotte()
+    test_calibration()
@@ -0,0 +1,297 @@
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+# Plage HSV d'une couleur : (teinte min, teinte max, saturation min, valeur min)
+# Teinte en degrés [0, 360) ; si teinte min > teinte max, la plage fait le tour (rouge).
+PlageHsv = Tuple[float, float, float, float]
+
+PLAGES_DEFAUT: Dict[str, PlageHsv] = {
+    "rouge": (340.0, 20.0, 0.5, 0.3),
+    "vert": (90.0, 150.0, 0.5, 0.3),
+    "bleu": (200.0, 260.0, 0.5, 0.3),
+}
+
+_ETIQUETTE_VIDE = np.iinfo(np.int64).max
+
+
+def rgbVersHsv(image: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Conversion RGB → HSV vectorisée.
+    image : tableau (H, W, 3) uint8 ou flottant dans [0, 1].
+    Retourne (h en degrés [0, 360), s ∈ [0, 1], v ∈ [0, 1]) en float32.
+    """
+    rgb = np.asarray(image)
+    if rgb.dtype == np.uint8:
+        # Différences entières sur int16 : une seule conversion flottante par plan
+        r, g, b = (rgb[..., k].astype(np.int16) for k in range(3))
+        echelle = np.float32(1.0 / 255.0)
+    else:
+        rgb = rgb.astype(np.float32, copy=False)
+        r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+        echelle = np.float32(1.0)
+    maxi = np.maximum(np.maximum(r, g), b)
+    delta = (maxi - np.minimum(np.minimum(r, g), b)).astype(np.float32)
+    v = maxi.astype(np.float32)
+    s = np.divide(delta, v, out=np.zeros_like(v), where=maxi > 0)
+
+    inv = np.divide(np.float32(60.0), delta, out=np.zeros_like(delta), where=delta > 0)
+    h = (g - b) * inv
+    np.copyto(h, (b - r) * inv + np.float32(120.0), where=(maxi == g) & (maxi != r))
+    np.copyto(h, (r - g) * inv + np.float32(240.0), where=(maxi == b) & (maxi != r) & (maxi != g))
+    np.add(h, np.float32(360.0), out=h, where=h < 0)
+    return h, s, v * echelle
+
+
+def seuillerHsv(h: np.ndarray, s: np.ndarray, v: np.ndarray, plage: PlageHsv) -> np.ndarray:
+    """
+    Masque booléen des pixels dont la couleur tombe dans la plage HSV.
+    """
+    hMin, hMax, sMin, vMin = plage
+    if hMin <= hMax:
+        teinte = (h >= hMin) & (h <= hMax)
+    else:
+        teinte = (h >= hMin) | (h <= hMax)
+    return teinte & (s >= sMin) & (v >= vMin)
+
+
+def etiqueterComposantes(masque: np.ndarray) -> Tuple[np.ndarray, int]:
+    """
+    Étiquetage en composantes connexes (4-connexité), sans boucle Python par pixel.
+    Propagation du minimum entre voisins + saut de pointeurs jusqu'à convergence.
+    Retourne (étiquettes, nombre de composantes) ; les étiquettes vont de 1 à n, 0 = fond.
+    """
+    masque = np.asarray(masque, dtype=bool)
+    etiquettes = np.zeros(masque.shape, dtype=np.int32)
+    lignes = np.flatnonzero(masque.any(axis=1))
+    if lignes.size == 0:
+        return etiquettes, 0
+    colonnes = np.flatnonzero(masque.any(axis=0))
+    # On ne travaille que sur la boîte englobante des pixels allumés
+    l0, l1, c0, c1 = lignes[0], lignes[-1] + 1, colonnes[0], colonnes[-1] + 1
+    sous = masque[l0:l1, c0:c1]
+    H, W = sous.shape
+
+    lab = np.where(sous, np.arange(H * W, dtype=np.int64).reshape(H, W), _ETIQUETTE_VIDE)
+    plat = lab.ravel()      # vue sur lab
+    allumes = np.flatnonzero(sous.ravel())
+    while True:
+        precedent = plat[allumes]
+        voisin = lab.copy()
+        np.minimum(voisin[1:], lab[:-1], out=voisin[1:])
+        np.minimum(voisin[:-1], lab[1:], out=voisin[:-1])
+        np.minimum(voisin[:, 1:], lab[:, :-1], out=voisin[:, 1:])
+        np.minimum(voisin[:, :-1], lab[:, 1:], out=voisin[:, :-1])
+        plat[allumes] = voisin.ravel()[allumes]
+        # Saut de pointeurs : chaque étiquette est l'index d'un pixel de la même composante
+        while True:
+            courant = plat[allumes]
+            saute = plat[courant]
+            if np.array_equal(saute, courant):
+                break
+            plat[allumes] = saute
+        if np.array_equal(plat[allumes], precedent):
+            break
+
+    racines, compactes = np.unique(plat[allumes], return_inverse=True)
+    sortie = np.zeros(H * W, dtype=np.int32)
+    sortie[allumes] = compactes.astype(np.int32) + 1
+    etiquettes[l0:l1, c0:c1] = sortie.reshape(H, W)
+    return etiquettes, len(racines)
+
+
+class DetectionCube:
+    """
+    Résultat de détection : couleur, centre (u, v) en pixels, aire et boîte (l0, c0, l1, c1).
+    """
+
+    __slots__ = ("couleur", "centre", "aire", "boite")
+
+    def __init__(self, couleur: str, centre: Tuple[float, float], aire: int, boite: Tuple[int, int, int, int]):
+        self.couleur = couleur
+        self.centre = centre
+        self.aire = aire
+        self.boite = boite
+
+    def __repr__(self) -> str:
+        return f"DetectionCube({self.couleur!r}, centre={self.centre}, aire={self.aire}, boite={self.boite})"
+
+
+def extraireBlobs(masque: np.ndarray, couleur: str, aireMin: int) -> List[DetectionCube]:
+    """
+    Composantes connexes d'un masque → liste de DetectionCube (aire >= aireMin).
+    """
+    etiquettes, n = etiqueterComposantes(masque)
+    if n == 0:
+        return []
+    lignes, colonnes = np.nonzero(etiquettes)
+    lab = etiquettes[lignes, colonnes]
+    aires = np.bincount(lab, minlength=n + 1)
+    sommeL = np.bincount(lab, weights=lignes, minlength=n + 1)
+    sommeC = np.bincount(lab, weights=colonnes, minlength=n + 1)
+    l0 = np.full(n + 1, masque.shape[0]); np.minimum.at(l0, lab, lignes)
+    c0 = np.full(n + 1, masque.shape[1]); np.minimum.at(c0, lab, colonnes)
+    l1 = np.zeros(n + 1, dtype=np.int64); np.maximum.at(l1, lab, lignes)
+    c1 = np.zeros(n + 1, dtype=np.int64); np.maximum.at(c1, lab, colonnes)
+    blobs = []
+    for k in np.flatnonzero(aires >= max(aireMin, 1)):
+        blobs.append(DetectionCube(couleur, (float(sommeC[k] / aires[k]), float(sommeL[k] / aires[k])), int(aires[k]),
+                                   (int(l0[k]), int(c0[k]), int(l1[k]) + 1, int(c1[k]) + 1)))
+    return blobs
+
+
+class DetecteurCube:
+    """
+    Chaîne de détection de cubes : RGB → HSV, seuillage par couleur, composantes connexes.
+    - Suivi de région d'intérêt : après une détection, les images suivantes ne sont analysées
+      que dans une fenêtre autour de la dernière boîte (repli sur l'image entière si perdu).
+    - Recherche sur l'image entière en deux temps : passe grossière sur une image sous-échantillonnée
+      (facteur reduction), puis passe pleine résolution dans la fenêtre trouvée.
+    - Cache par image : deux appels avec le même numéro d'image renvoient le même résultat
+      sans recalcul (move() et pickUpCube() partagent ainsi une seule détection).
+    """
+
+    def __init__(self, plages: Optional[Dict[str, PlageHsv]] = None, aireMin: int = 50,
+                 margeRoi: int = 40, echelle: float = 0.002, distanceAvant: float = 0.15,
+                 reduction: int = 4):
+        self._plages: Dict[str, PlageHsv] = dict(plages or PLAGES_DEFAUT)
+        self._aireMin: int = aireMin
+        self._margeRoi: int = margeRoi              # Marge (pixels) autour de la dernière boîte
+        self._reduction: int = max(int(reduction), 1)   # Sous-échantillonnage de la passe grossière
+        self._echelle: float = echelle              # Taille d'un pixel au sol (m)
+        self._distanceAvant: float = distanceAvant  # Distance robot → bas de l'image (m)
+        self._derniereBoite: Optional[Tuple[int, int, int, int]] = None
+        self._cacheNumero: Optional[int] = None
+        self._cacheResultat: Optional[DetectionCube] = None
+
+    def get_plages(self) -> Dict[str, PlageHsv]:
+        return dict(self._plages)
+
+    def set_plage(self, couleur: str, plage: PlageHsv) -> None:
+        self._plages[couleur] = plage
+        self.reinitialiser()
+
+    def reinitialiser(self) -> None:
+        self._derniereBoite = None
+        self._cacheNumero = None
+        self._cacheResultat = None
+
+    def oublier(self, numero: int) -> None:
+        """
+        Écarte le résultat de l'image numero (réécrite pendant l'analyse) : cache et fenêtre de suivi.
+        """
+        if numero == self._cacheNumero:
+            self._cacheNumero = None
+            self._cacheResultat = None
+        self._derniereBoite = None
+
+    def detecter(self, image: np.ndarray, numero: Optional[int] = None) -> Optional[DetectionCube]:
+        """
+        Détecte le plus gros cube visible. numero identifie l'image pour le cache (None = pas de cache).
+        """
+        if numero is not None and numero == self._cacheNumero:
+            return self._cacheResultat
+
+        resultat = None
+        if self._derniereBoite is not None:
+            resultat = self._detecterAutour(image, self._derniereBoite)
+        if resultat is None:
+            k = self._reduction
+            if k > 1:
+                grossier = self._detecterDans(image[::k, ::k], 0, 0, max(self._aireMin // (k * k), 1))
+                if grossier is not None:
+                    l0, c0, l1, c1 = grossier.boite
+                    resultat = self._detecterAutour(image, (l0 * k, c0 * k, l1 * k, c1 * k))
+            else:
+                resultat = self._detecterDans(image, 0, 0)
+
+        self._derniereBoite = resultat.boite if resultat is not None else None
+        if numero is not None:
+            self._cacheNumero = numero
+            self._cacheResultat = resultat
+        return resultat
+
+    def _detecterAutour(self, image: np.ndarray, boite: Tuple[int, int, int, int]) -> Optional[DetectionCube]:
+        # Détection pleine résolution dans la boîte élargie de la marge
+        l0, c0, l1, c1 = boite
+        m = self._margeRoi
+        l0, c0 = max(l0 - m, 0), max(c0 - m, 0)
+        l1, c1 = min(l1 + m, image.shape[0]), min(c1 + m, image.shape[1])
+        return self._detecterDans(image[l0:l1, c0:c1], l0, c0)
+
+    def _detecterDans(self, image: np.ndarray, decalageL: int, decalageC: int,
+                      aireMin: Optional[int] = None) -> Optional[DetectionCube]:
+        h, s, v = rgbVersHsv(image)
+        aireMin = self._aireMin if aireMin is None else aireMin
+        meilleur = None
+        for couleur, plage in self._plages.items():
+            for blob in extraireBlobs(seuillerHsv(h, s, v, plage), couleur, aireMin):
+                if meilleur is None or blob.aire > meilleur.aire:
+                    meilleur = blob
+        if meilleur is None:
+            return None
+        u, w = meilleur.centre
+        l0, c0, l1, c1 = meilleur.boite
+        meilleur.centre = (u + decalageC, w + decalageL)
+        meilleur.boite = (l0 + decalageL, c0 + decalageC, l1 + decalageL, c1 + decalageC)
+        return meilleur
+
+    def versRobot(self, detection: DetectionCube, forme: Tuple[int, ...]) -> Tuple[float, float]:
+        """
+        Position du cube dans le repère robot (avant, gauche), caméra orientée vers le sol.
+        """
+        hauteur, largeur = forme[0], forme[1]
+        u, w = detection.centre
+        avant = self._distanceAvant + (hauteur - w) * self._echelle
+        gauche = (largeur / 2.0 - u) * self._echelle
+        return (avant, gauche)
+
+
+class CameraSynthetique:
+    """
+    Caméra de test : fond gris bruité et un cube coloré carré qui se déplace.
+    derniereImage() renvoie (numéro, image) ; le numéro ne change qu'après avancer().
+    """
+
+    COULEURS_RGB = {"rouge": (200, 30, 30), "vert": (30, 180, 40), "bleu": (30, 60, 200)}
+
+    def __init__(self, largeur: int = 640, hauteur: int = 480, cote: int = 40,
+                 couleur: Optional[str] = "rouge", graine: int = 0):
+        self._largeur: int = largeur
+        self._hauteur: int = hauteur
+        self._cote: int = cote
+        self._couleur: Optional[str] = couleur
+        self._rng = np.random.default_rng(graine)
+        self._fond: np.ndarray = self._rng.integers(90, 130, (hauteur, largeur, 3), dtype=np.uint8)
+        self._centre: Tuple[int, int] = (largeur // 2, hauteur // 2)   # (u, v)
+        self._numero: int = 0
+        self._image: np.ndarray = self._dessiner()
+
+    def get_centre_cube(self) -> Tuple[int, int]:
+        return self._centre
+
+    def set_couleur(self, couleur: Optional[str]) -> None:
+        self._couleur = couleur
+        self._image = self._dessiner()
+
+    def avancer(self, du: int = 3, dv: int = 2) -> None:
+        """
+        Nouvelle image : le cube se déplace de (du, dv) pixels (rebond sur les bords).
+        """
+        u, v = self._centre
+        demi = self._cote // 2
+        u = min(max(u + du, demi), self._largeur - demi - 1)
+        v = min(max(v + dv, demi), self._hauteur - demi - 1)
+        self._centre = (u, v)
+        self._numero += 1
+        self._image = self._dessiner()
+
+    def derniereImage(self) -> Tuple[int, np.ndarray]:
+        return (self._numero, self._image)
+
+    def _dessiner(self) -> np.ndarray:
+        image = self._fond.copy()
+        if self._couleur is not None:
+            u, v = self._centre
+            demi = self._cote // 2
+            image[v - demi:v + demi, u - demi:u + demi] = self.COULEURS_RGB[self._couleur]
+        return image